@@ -6,15 +6,18 @@ import sys
 import os
 sys.path.append(os.path.abspath('.'))
 
-__all__ = ['alterer', 'casting', 'backer', 'checker', 'config', 'configurator',
-           'connecter', 'const', 'date_tools', 'db_selector', 'dir_tools',
-           'dropper', 'informer', 'logger', 'mail_tools', 'orchestrator',
-           'py_pg_tools', 'replicator', 'restorer', 'scheduler', 'terminator',
-           'trimmer', 'vacuumer']
+__all__ = ['alterer', 'async_connecter', 'casting', 'backer', 'catalog',
+           'checker', 'config', 'configurator', 'connecter', 'const',
+           'date_tools', 'db_selector', 'dir_tools', 'dropper', 'informer',
+           'logger', 'mail_tools', 'orchestrator', 'py_pg_tools', 'reindexer',
+           'replicator', 'restorer', 'scheduler', 'terminator', 'trimmer',
+           'vacuumer', 'watcher']
 
 from . import alterer
+from . import async_connecter
 from . import casting
 from . import backer
+from . import catalog
 from . import checker
 from . import config
 from . import configurator
@@ -29,9 +32,11 @@ from . import logger
 from . import mail_tools
 from . import orchestrator
 from . import py_pg_tools
+from . import reindexer
 from . import replicator
 from . import restorer
 from . import scheduler
 from . import terminator
 from . import trimmer
 from . import vacuumer
+from . import watcher
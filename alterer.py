@@ -3,7 +3,7 @@
 
 
 from casting.casting import Casting
-from connecter import Connecter
+from connecter import ConnecterPool
 from const.const import Messenger as Msg
 from const.const import Queries
 from date_tools.date_tools import DateTools
@@ -86,6 +86,7 @@ class Alterer:
                     self.connecter.cursor.execute(
                         Queries.CHANGE_PG_DB_OWNER.format(
                             dbname=dbname, new_role=self.new_role))
+                    self.connecter.invalidate_metadata('dbs')
 
                 except Exception as e:
                     success = False
@@ -96,10 +97,10 @@ class Alterer:
 
                 # Start another connection to the target database to be able to
                 # apply the next query
-                own_connecter = Connecter(server=self.connecter.server,
-                                          user=self.connecter.user,
-                                          port=self.connecter.port,
-                                          database=dbname, logger=self.logger)
+                own_connecter = ConnecterPool.get_connecter(
+                    server=self.connecter.server, user=self.connecter.user,
+                    port=self.connecter.port, database=dbname,
+                    logger=self.logger)
 
                 # Disallow connections to the database during the process
                 result = self.connecter.disallow_db_conn(dbname)
@@ -126,7 +127,7 @@ class Alterer:
                     msg = Msg.ALLOW_CONN_TO_PG_DB_FAIL.format(dbname=dbname)
                     self.logger.highlight('warning', msg, 'yellow')
 
-                # Close cursor and connection to the target database
+                # Give the connection to the target database back
                 own_connecter.pg_disconnect()
 
             else:
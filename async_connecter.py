@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+
+
+import asyncio  # To run several queries at a time
+
+try:
+    # To work with PostgreSQL asynchronously (psycopg 3, optional)
+    import psycopg
+    from psycopg.rows import dict_row
+    from psycopg.rows import tuple_row
+except ImportError:
+    psycopg = None
+
+from casting.casting import Casting
+from checker.checker import Checker
+from const.const import Default
+from const.const import Messenger as Msg
+from const.const import Queries
+from logger.logger import Logger
+
+
+class AsyncConnecter:
+    '''This class is the asynchronous counterpart of "Connecter": it manages
+    a connection with PostgreSQL whose queries are coroutines, so that a
+    module can query several databases (or hosts) at a time. As a constructor
+    cannot wait, the connection is opened by "pg_connect". It needs the
+    package psycopg (version 3).
+    '''
+    conn = None  # The asynchronous PostgreSQL connection object
+    server = None  # The target host of the connection
+    user = None  # The PostgreSQL user who makes the connection
+    port = None  # The target port of the connection
+    database = None  # The target database of the connection
+    logger = None  # A logger to show and log some messages
+
+    # PostgreSQL version (from this one on some variables change their names)
+    PG_PID_VERSION_THRESHOLD = 90200
+    pg_pid_91 = 'procpid'  # Name for PostgreSQL PID variable till version 9.1
+    pg_pid_92 = 'pid'  # Name for PostgreSQL PID variable since version 9.2
+
+    def __init__(self, server, user, port, database=None, logger=None):
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = Logger()
+
+        if psycopg is None:
+            self.logger.stop_exe(Msg.ASYNC_NOT_SUPPORTED)
+
+        self.server = server
+
+        self.user = user
+
+        if isinstance(port, int):
+            self.port = port
+        elif Checker.str_is_int(port):
+            self.port = Casting.str_to_int(port)
+        else:
+            self.logger.stop_exe(Msg.INVALID_PORT)
+
+        if database is None:
+            self.database = Default.CONNECTION_DATABASE
+        elif database:
+            self.database = database
+        else:
+            self.logger.stop_exe(Msg.NO_CONNECTION_DATABASE)
+
+    @staticmethod
+    async def gather(coros, limit=Default.ASYNC_LIMIT):
+        '''
+        Target:
+            - run some coroutines at a time, but never more than a limit, and
+              wait for all of them to finish.
+        Parameters:
+            - coros: the coroutines to run.
+            - limit: the maximum number of coroutines running at a time.
+        Return:
+            - a list with the result of each coroutine, in the same order, or
+              the exception it raised.
+        '''
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*[run(coro) for coro in coros],
+                                    return_exceptions=True)
+
+    async def pg_connect(self):
+        '''
+        Target:
+            - connect to PostgreSQL.
+        '''
+        try:
+            self.conn = await psycopg.AsyncConnection.connect(
+                host=self.server, user=self.user, port=self.port,
+                dbname=self.database, autocommit=True, row_factory=dict_row)
+        except Exception as e:
+            self.logger.debug('Error en la función "pg_connect": {}.'.format(
+                str(e)))
+            self.logger.stop_exe(Msg.CONNECT_FAIL)
+
+    async def pg_disconnect(self):
+        '''
+        Target:
+            - disconnect from PostgreSQL.
+        '''
+        try:
+            await self.conn.close()
+        except Exception as e:
+            self.logger.debug('Error en la función "pg_disconnect": '
+                              '{}.'.format(str(e)))
+            self.logger.stop_exe(Msg.DISCONNECT_FAIL)
+
+    async def execute(self, query, params=None):
+        '''
+        Target:
+            - run a query which does not return rows.
+        Parameters:
+            - query: the query to run.
+            - params: the parameters of the query.
+        '''
+        async with self.conn.cursor() as cursor:
+            await cursor.execute(query, params)
+
+    async def fetchall(self, query, params=None):
+        '''
+        Target:
+            - run a query and get its rows.
+        Parameters:
+            - query: the query to run.
+            - params: the parameters of the query.
+        Return:
+            - a list with the rows, as dictionaries.
+        '''
+        async with self.conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchall()
+
+    async def fetchone(self, query, params=None):
+        '''
+        Target:
+            - run a query and get its first row.
+        Parameters:
+            - query: the query to run.
+            - params: the parameters of the query.
+        Return:
+            - the first row, as a dictionary, or None if there are no rows.
+        '''
+        async with self.conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchone()
+
+    async def fetchval(self, query, params=None):
+        '''
+        Target:
+            - run a query and get the first value of its first row.
+        Parameters:
+            - query: the query to run.
+            - params: the parameters of the query.
+        Return:
+            - the value, or None if there are no rows.
+        '''
+        async with self.conn.cursor(row_factory=tuple_row) as cursor:
+            await cursor.execute(query, params)
+            row = await cursor.fetchone()
+
+        return row[0] if row else None
+
+    def get_pg_version(self):
+        '''
+        Target:
+            - get the PostgreSQL version.
+        Return:
+            - a integer which gives the PostgreSQL version.
+        '''
+        return self.conn.info.server_version
+
+    async def get_pretty_pg_version(self):
+        '''
+        Target:
+            - get the pretty PostgreSQL version.
+        Return:
+            - a string which gives the PostgreSQL version and more details.
+        '''
+        try:
+            return await self.fetchval(Queries.GET_PG_PRETTY_VERSION)
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pretty_pg_version": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_VERSION_FAIL, 'yellow')
+            return None
+
+    def get_pid_str(self):
+        '''
+        Target:
+            - get the name of the process id depending on the PostgreSQL
+              version which is being used. Before the version 9.2 this variable
+              was called "procpid", afterwards became "pid".
+        Return:
+            - a string which gives the name of the vaiable process id.
+        '''
+        if self.get_pg_version() < self.PG_PID_VERSION_THRESHOLD:
+            return self.pg_pid_91
+        else:
+            return self.pg_pid_92
+
+    async def is_pg_superuser(self):
+        '''
+        Target:
+            - check if a user connected to PostgreSQL has a superuser role.
+        Return:
+            - a boolean which indicates whether a user is a PostgreSQL
+              superuser or not.
+        '''
+        return await self.fetchval(Queries.IS_PG_SUPERUSER)
+
+    async def get_pg_time_start(self):
+        '''
+        Target:
+            - get the time when PostgreSQL was started.
+        Return:
+            - a date which indicates the time when PostgreSQL was started.
+        '''
+        try:
+            return await self.fetchval(Queries.GET_PG_TIME_START)
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_time_start": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_TIME_START_FAIL,
+                                  'yellow')
+            return None
+
+    async def get_pg_time_up(self):
+        '''
+        Target:
+            - get how long PostgreSQL has been working.
+        Return:
+            - a date which indicates how long PostgreSQL has been working.
+        '''
+        try:
+            return await self.fetchval(Queries.GET_PG_TIME_UP)
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_time_up": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_TIME_UP_FAIL, 'yellow')
+            return None
+
+    async def get_pg_dbs_data(self, ex_templates=True, db_owner=''):
+        '''
+        Target:
+            - do different queries to PostgreSQL depending on the parameters
+              received.
+        Parameters:
+            - ex_templates: flag which determinates whether or not get those
+              databases which are templates.
+            - db_owner: the name of the user whose databases are going to be
+              obtained.
+        Return:
+            - a list with the PostgreSQL databases and their names,
+              datallowconn and owners.
+        '''
+        try:
+            # Get all databases (no templates) of a specific owner
+            if db_owner and ex_templates:
+                return await self.fetchall(
+                    Queries.GET_PG_NO_TEMPLATE_DBS_BY_OWNER, (db_owner, ))
+            # Get all databases (templates too) of a specific owner
+            elif db_owner and ex_templates is False:
+                return await self.fetchall(Queries.GET_PG_DBS_BY_OWNER,
+                                           (db_owner, ))
+            # Get all databases (no templates)
+            elif not db_owner and ex_templates is False:
+                return await self.fetchall(Queries.GET_PG_DBS)
+            else:  # Get all databases (templates too)
+                return await self.fetchall(Queries.GET_PG_NO_TEMPLATE_DBS)
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_dbs_data": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_DBS_DATA, 'yellow')
+            return None
+
+    async def get_pg_db_data(self, dbname):
+        '''
+        Target:
+            - get some info about a specified database.
+        Parameters:
+            - dbname: name of the database whose information is going to be
+              gattered.
+        '''
+        try:
+            return await self.fetchone(Queries.GET_PG_DB_DATA, (dbname, ))
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_db_data": '
+                              '{}.'.format(str(e)))
+            msg = Msg.GET_PG_DB_DATA.format(dbname=dbname)
+            self.logger.highlight('warning', msg, 'yellow')
+            return None
+
+    async def get_pg_dbnames(self, ex_templates=False):
+        '''
+        Target:
+            - get PostgreSQL databases' names.
+        Parameters:
+            - ex_templates: flag which determinates whether or not get those
+              databases which are templates.
+        '''
+        try:
+            if ex_templates:
+                result = await self.fetchall(
+                    Queries.GET_PG_NO_TEMPLATE_DBNAMES)
+            else:
+                result = await self.fetchall(Queries.GET_PG_DBNAMES)
+
+            return [record['datname'] for record in result]
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_dbnames": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_DBNAMES_DATA, 'yellow')
+            return None
+
+    async def get_pg_usernames(self):
+        '''
+        Target:
+            - get PostgreSQL users' names.
+        '''
+        try:
+            result = await self.fetchall(Queries.GET_PG_USERNAMES)
+
+            return [record['usename'] for record in result]
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_usernames": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_USERNAMES_DATA,
+                                  'yellow')
+            return None
+
+    async def get_pg_connpids(self):
+        '''
+        Target:
+            - get PostgreSQL backends' PIDs.
+        '''
+        pid = self.get_pid_str()  # Get PID variable's name
+        formatted_query_get_pg_connpids = Queries.GET_PG_CONNPIDS.format(
+            pid=pid)
+
+        try:
+            result = await self.fetchall(formatted_query_get_pg_connpids)
+
+            return [record['pid'] for record in result]
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_pg_connpids": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_CONNPIDS_DATA,
+                                  'yellow')
+            return None
+
+    async def allow_db_conn(self, dbname):
+        '''
+        Target:
+            - enable connections to a specified PostgreSQL database.
+        Parameters:
+            - dbname: name of the database whose property "datallowconn" is
+              going to be changed to allow connections to itself.
+        Return:
+            - a boolean which indicates if the process succeded.
+        '''
+        try:
+            await self.execute(Queries.ALLOW_CONN_TO_PG_DB, (dbname, ))
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "allow_db_conn": '
+                              '{}.'.format(str(e)))
+            return False
+
+    async def disallow_db_conn(self, dbname):
+        '''
+        Target:
+            - disable connections to a specified PostgreSQL database.
+        Parameters:
+            - dbname: name of the database whose property "datallowconn" is
+              going to be changed to disallow connections to itself.
+        Return:
+            - a boolean which indicates if the process succeded.
+        '''
+        try:
+            await self.execute(Queries.DISALLOW_CONN_TO_PG_DB, (dbname, ))
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "disallow_db_conn": '
+                              '{}.'.format(str(e)))
+            return False
+
+    async def get_datallowconn(self, dbname):
+        '''
+        Target:
+            - get "datallowconn" from a specified PostgreSQL database.
+        Parameters:
+            - dbname: name of the database whose property "datallowconn" is
+              going to be read.
+        Return:
+            - a boolean which indicates the value of "datallowconn".
+        '''
+        try:
+            return await self.fetchval(Queries.GET_PG_DB_DATALLOWCONN,
+                                       (dbname, ))
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_datallowconn": '
+                              '{}.'.format(str(e)))
+            return None
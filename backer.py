@@ -2,9 +2,11 @@
 # -*- encoding: utf-8 -*-
 
 
+import os  # To build the path of the catalog
 import subprocess  # To execute some commands in the shell
 
 from casting.casting import Casting
+from catalog.catalog import Catalog
 from checker.checker import Checker
 from const.const import Default
 from const.const import Messenger as Msg
@@ -34,14 +36,21 @@ class Backer:
     vacuum = True
     # Use other PostgreSQL user during the backup process (only for superusers)
     db_owner = ''
+    # Flag which determinates whether each backup and its table of contents
+    # must be registered in the group's catalog
+    catalog = False
     # An object with connection parameters to connect to PostgreSQL
     connecter = None
+    # An object with the connection parameters to make the dumps with (a
+    # standby server if there is any suitable, otherwise the main one)
+    dump_connecter = None
     logger = None  # Logger to show and log some messages
 
     def __init__(self, connecter=None, bkp_path='', group='',
                  bkp_type='dump', prefix='', in_dbs=[], in_regex='',
                  in_priority=False, ex_dbs=['postgres'], ex_regex='',
-                 ex_templates=True, vacuum=True, db_owner='', logger=None):
+                 ex_templates=True, vacuum=True, db_owner='', catalog=False,
+                 logger=None):
 
         if logger:
             self.logger = logger
@@ -53,6 +62,9 @@ class Backer:
         else:
             self.logger.stop_exe(Msg.NO_CONNECTION_PARAMS)
 
+        # Make the dumps in the main server unless told otherwise
+        self.dump_connecter = self.connecter
+
         # If backup directory is not specified, create a default one to store
         # the backups
         if bkp_path:
@@ -121,6 +133,13 @@ class Backer:
         else:
             self.db_owner = Default.DB_OWNER
 
+        if isinstance(catalog, bool):
+            self.catalog = catalog
+        elif Checker.str_is_bool(catalog):
+            self.catalog = Casting.str_to_bool(catalog)
+        else:
+            self.logger.stop_exe(Msg.INVALID_CATALOG)
+
         msg = Msg.DB_BACKER_VARS.format(
             server=self.connecter.server, user=self.connecter.user,
             port=self.connecter.port, bkp_path=self.bkp_path, group=self.group,
@@ -128,17 +147,54 @@ class Backer:
             in_regex=self.in_regex, in_priority=self.in_priority,
             ex_dbs=self.ex_dbs, ex_regex=self.ex_regex,
             ex_templates=self.ex_templates, vacuum=self.vacuum,
-            db_owner=self.db_owner)
+            db_owner=self.db_owner, catalog=self.catalog)
         self.logger.debug(Msg.DB_BACKER_VARS_INTRO)
         self.logger.debug(msg)
 
-    def backup_db(self, dbname, bkps_dir):
+    def catalog_bkp(self, catalog, dbname, bkp_file, bkp_date):
+        '''
+        Target:
+            - extract the table of contents of a backup and store it in the
+              catalog.
+        Parameters:
+            - catalog: the catalog where the table of contents is stored.
+            - dbname: name of the database the backup belongs to.
+            - bkp_file: absolute path of the backup file.
+            - bkp_date: date and time of the backup (as in its name).
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        # Store the command to do depending on the backup type
+        if self.bkp_type == 'gz':  # Unzip with gzip
+            command = 'gunzip -c {} | pg_restore -l'.format(bkp_file)
+        elif self.bkp_type == 'bz2':  # Unzip with bzip2
+            command = 'bunzip2 -c {} | pg_restore -l'.format(bkp_file)
+        elif self.bkp_type == 'zip':  # Unzip with zip
+            command = 'unzip -p {} | pg_restore -l'.format(bkp_file)
+        else:  # Not zipped
+            command = 'pg_restore -l {}'.format(bkp_file)
+
+        try:
+            # Get the table of contents of the backup
+            toc_text = subprocess.check_output(command, shell=True)
+            toc = Catalog.parse_toc(toc_text.decode())
+
+        except Exception as e:
+            self.logger.debug('Error en la función "catalog_bkp": {}.'.format(
+                str(e)))
+            return False
+
+        return catalog.add_bkp_toc(bkp_file, dbname, bkp_date, toc)
+
+    def backup_db(self, dbname, bkps_dir, catalog=None):
         '''
         Target:
             - make a backup of a specified database.
         Parameters:
             - dbname: name of the database which is going to be backuped.
             - bkps_dir: directory where the backup is going to be stored.
+            - catalog: the catalog where the table of contents of the backup
+              is stored (if any).
         Return:
             - a boolean which indicates the success of the process.
         '''
@@ -159,20 +215,20 @@ class Backer:
         # Store the command to do depending on the backup type
         if self.bkp_type == 'gz':  # Zip with gzip
             command = 'pg_dump {} -Fc -U {} -h {} -p {} | gzip > {}'.format(
-                dbname, self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                dbname, self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         elif self.bkp_type == 'bz2':  # Zip with bzip2
             command = 'pg_dump {} -Fc -U {} -h {} -p {} | bzip2 > {}'.format(
-                dbname, self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                dbname, self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         elif self.bkp_type == 'zip':  # Zip with zip
             command = 'pg_dump {} -Fc -U {} -h {} -p {} | zip > {}'.format(
-                dbname, self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                dbname, self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         else:  # Do not zip
             command = 'pg_dump {} -Fc -U {} -h {} -p {} > {}'.format(
-                dbname, self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                dbname, self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
 
         try:
             # Execute the command in console
@@ -185,6 +241,15 @@ class Backer:
                 str(e)))
             success = False
 
+        if success and catalog:
+            bkp_file = bkp_dir + file_name
+            if not catalog.add_bkp(bkp_file):
+                msg = Msg.CATALOG_BKP_FAIL.format(bkp_path=bkp_file)
+                self.logger.highlight('warning', msg, 'yellow')
+            if not self.catalog_bkp(catalog, dbname, bkp_file, init_ts):
+                msg = Msg.CATALOG_TOC_FAIL.format(bkp_path=bkp_file)
+                self.logger.highlight('warning', msg, 'yellow')
+
         return success
 
     def backup_dbs(self, dbs_all):
@@ -202,6 +267,12 @@ class Backer:
 
         self.logger.info(Msg.DESTINY_DIR.format(path=bkps_dir))
 
+        if self.catalog:
+            catalog = Catalog(os.path.join(self.bkp_path + self.group,
+                                           Default.CATALOG_FILE), self.logger)
+        else:
+            catalog = None
+
         self.logger.highlight('info', Msg.PROCESSING_DB_BACKER, 'white')
 
         if dbs_all:
@@ -228,7 +299,7 @@ class Backer:
                                             self.in_regex, self.in_priority,
                                             self.ex_dbs, self.ex_regex,
                                             self.ex_templates, self.db_owner,
-                                            self.logger)
+                                            logger=self.logger)
 
                         # Vacuum the database
                         success = vacuumer.vacuum_db(dbname)
@@ -246,7 +317,7 @@ class Backer:
 
                     start_time = DateTools.get_current_datetime()
                     # Make the backup of the database
-                    success = self.backup_db(dbname, bkps_dir)
+                    success = self.backup_db(dbname, bkps_dir, catalog)
                     end_time = DateTools.get_current_datetime()
                     # Get and show the process' duration
                     diff = DateTools.get_diff_datetimes(start_time, end_time)
@@ -262,6 +333,9 @@ class Backer:
             self.logger.highlight('warning', Msg.BACKER_HAS_NOTHING_TO_DO,
                                   'yellow', effect='bold')
 
+        if catalog:
+            catalog.close()
+
         self.logger.highlight('info', Msg.BACKER_DONE, 'green', effect='bold')
 
 
@@ -274,12 +348,19 @@ class BackerCluster:
     # Flag which determinates whether the databases must be vacuumed before the
     # backup process
     vacuum = True
+    # Flag which determinates whether each backup must be registered in the
+    # group's catalog
+    catalog = False
     # An object with connection parameters to connect to PostgreSQL
     connecter = None
+    # An object with the connection parameters to make the dumps with (a
+    # standby server if there is any suitable, otherwise the main one)
+    dump_connecter = None
     logger = None  # Logger to show and log some messages
 
     def __init__(self, connecter=None, bkp_path='', group='',
-                 bkp_type='dump', prefix='', vacuum=True, logger=None):
+                 bkp_type='dump', prefix='', vacuum=True, catalog=False,
+                 logger=None):
 
         if logger:
             self.logger = logger
@@ -291,6 +372,9 @@ class BackerCluster:
         else:
             self.logger.stop_exe(Msg.NO_CONNECTION_PARAMS)
 
+        # Make the dumps in the main server unless told otherwise
+        self.dump_connecter = self.connecter
+
         # If backup directory is not specified, create a default one to store
         # the backups
         if bkp_path:
@@ -320,10 +404,18 @@ class BackerCluster:
         else:
             self.logger.stop_exe(Msg.INVALID_VACUUM)
 
+        if isinstance(catalog, bool):
+            self.catalog = catalog
+        elif Checker.str_is_bool(catalog):
+            self.catalog = Casting.str_to_bool(catalog)
+        else:
+            self.logger.stop_exe(Msg.INVALID_CATALOG)
+
         msg = Msg.CL_BACKER_VARS.format(
             server=self.connecter.server, user=self.connecter.user,
             port=self.connecter.port, bkp_path=self.bkp_path, group=self.group,
-            bkp_type=self.bkp_type, prefix=self.prefix, vacuum=self.vacuum)
+            bkp_type=self.bkp_type, prefix=self.prefix, vacuum=self.vacuum,
+            catalog=self.catalog)
         self.logger.debug(Msg.CL_BACKER_VARS_INTRO)
         self.logger.debug(msg)
 
@@ -355,20 +447,20 @@ class BackerCluster:
         # Store the command to do depending on the backup type
         if self.bkp_type == 'gz':  # Zip with gzip
             command = 'pg_dumpall -U {} -h {} -p {} | gzip > {}'.format(
-                self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         elif self.bkp_type == 'bz2':  # Zip with bzip2
             command = 'pg_dumpall -U {} -h {} -p {} | bzip2 > {}'.format(
-                self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         elif self.bkp_type == 'zip':  # Zip with zip
             command = 'pg_dumpall -U {} -h {} -p {} | zip > {}'.format(
-                self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         else:  # Do not zip
             command = 'pg_dumpall -U {} -h {} -p {} > {}'.format(
-                self.connecter.user, self.connecter.server,
-                self.connecter.port, bkp_dir + file_name)
+                self.dump_connecter.user, self.dump_connecter.server,
+                self.dump_connecter.port, bkp_dir + file_name)
         try:
             # Execute the command in console
             result = subprocess.call(command, shell=True)
@@ -380,6 +472,15 @@ class BackerCluster:
                 str(e)))
             success = False
 
+        if success and self.catalog:
+            bkp_file = bkp_dir + file_name
+            catalog = Catalog(os.path.join(self.bkp_path + self.group,
+                                           Default.CATALOG_FILE), self.logger)
+            if not catalog.add_bkp(bkp_file):
+                msg = Msg.CATALOG_BKP_FAIL.format(bkp_path=bkp_file)
+                self.logger.highlight('warning', msg, 'yellow')
+            catalog.close()
+
         return success
 
     def backup_cl(self):
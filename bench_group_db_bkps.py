@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+
+
+# Benchmark of Trimmer.group_db_bkps over a synthetic tree of backups' paths,
+# compared with the old grouping (a pass over every file for each database).
+#
+# Usage: python3 bench_group_db_bkps.py [-d DBS] [-f FILES] [--no-old]
+
+import argparse  # To get the size of the synthetic tree
+import os  # To build the backups' paths
+import re  # To group the backups as the old trimmer did
+import tempfile  # To give the trimmer an existing directory
+import time  # To measure the groupings
+
+from logger.logger import Logger
+from trimmer import Trimmer
+
+
+def get_synthetic_bkps(bkp_path, n_dbs, n_files):
+    '''
+    Target:
+        - build the sorted list of backups which the trimmer would get from a
+          folder organised by year and month, with some files which are not
+          backups among them.
+    Parameters:
+        - bkp_path: the root of the synthetic tree.
+        - n_dbs: number of databases whose backups are stored.
+        - n_files: number of files of the tree.
+    Return:
+        - a list with the absolute paths of the files.
+    '''
+    bkps_list = []
+
+    for i in range(n_files):
+        day = i // n_dbs
+        year = 2000 + day // 360
+        month = day % 360 // 30 + 1
+        dirname = os.path.join(bkp_path, str(year), '{:02d}'.format(month))
+        if i % 50 == 49:
+            filename = 'notes_{}.txt'.format(i)
+        else:
+            filename = 'db_db{}_{}{:02d}{:02d}_030000_UTC.dump'.format(
+                i % n_dbs, year, month, day % 30 + 1)
+        bkps_list.append(os.path.join(dirname, filename))
+
+    return bkps_list
+
+
+def group_db_bkps_old(bkps_list, dbs_to_clean):
+    '''
+    Target:
+        - group the backups by database as the trimmer did before
+          "group_db_bkps" existed.
+    Parameters:
+        - bkps_list: list of backups found in the specified directory.
+        - dbs_to_clean: names of the databases whose backups are grouped.
+    Return:
+        - a dictionary with the databases' names as keys and the lists of
+          their backups as values.
+    '''
+    regex = r'(.+)?db_(.+)_(\d{8}_\d{6}_.+)\.(?:dump|bz2|gz|zip)$'
+    regex = re.compile(regex)
+    db_bkps = {}
+
+    for dbname in dbs_to_clean:
+        db_bkps[dbname] = []
+        for file in bkps_list:
+            filename = os.path.basename(file)
+            if re.match(regex, filename):
+                if regex.search(filename).groups()[1] == dbname:
+                    db_bkps[dbname].append(file)
+
+    return db_bkps
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark of the grouping of backups by database')
+    parser.add_argument('-d', '--dbs', type=int, default=100,
+                        help='number of databases')
+    parser.add_argument('-f', '--files', type=int, default=20000,
+                        help='number of files of the synthetic tree')
+    parser.add_argument('--no-old', action='store_true',
+                        help='do not time the old grouping (it is quadratic)')
+    args = parser.parse_args()
+
+    bkp_path = tempfile.mkdtemp()
+    bkps_list = get_synthetic_bkps(bkp_path, args.dbs, args.files)
+    dbs_to_clean = ['db{}'.format(i) for i in range(args.dbs)]
+
+    trimmer = Trimmer(bkp_path=bkp_path, pg_warnings=False,
+                      logger=Logger(mute=True))
+
+    start = time.perf_counter()
+    db_bkps = trimmer.group_db_bkps(bkps_list, dbs_to_clean)
+    new_time = time.perf_counter() - start
+    print('{} dbs / {} files: group_db_bkps {:.3f} s'.format(
+        args.dbs, args.files, new_time))
+
+    if not args.no_old:
+        start = time.perf_counter()
+        old_db_bkps = group_db_bkps_old(bkps_list, dbs_to_clean)
+        old_time = time.perf_counter() - start
+        print('{} dbs / {} files: old grouping {:.3f} s (same result: {})'
+              .format(args.dbs, args.files, old_time, old_db_bkps == db_bkps))
+
+    os.rmdir(bkp_path)
@@ -59,6 +59,22 @@ class Casting:
         except:
             return False
 
+    @staticmethod
+    def str_to_float(string):
+        '''
+        Target:
+            - converts a string into a float.
+        Parameters:
+            - string: the string to be converted.
+        Return:
+            - the resultant float or False if the conversion was impossible.
+        '''
+        try:
+            result = float(string)
+            return result
+        except:
+            return False
+
     @staticmethod
     def str_to_max_size(string):
         '''
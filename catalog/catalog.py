@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+
+
+import os  # To check the existance of some files
+import re  # To work with regular expressions
+import sqlite3  # To store the catalog in a local file
+import time  # To check whether the watchers of the catalog are alive
+
+from const.const import Default
+from const.const import Messenger
+from const.const import Queries
+from logger.logger import Logger
+
+
+class Catalog:
+    '''This class manages an on-disk index (SQLite) of the backups stored in a
+    directory and of the objects contained in each of them.
+    '''
+    path = ''  # Absolute path of the SQLite file which stores the catalog
+    conn = None  # The SQLite connection
+    logger = None  # A logger to show and log some messages
+
+    # Regular expression which each relevant line of "pg_restore -l" must
+    # match (dump ID; catalog OID, object OID, type, schema, name, owner).
+    # The "TABLE DATA" entries are skipped, as they repeat the tables
+    TOC_REGEX = re.compile(
+        r'^\d+; \d+ \d+ (TABLE|SCHEMA) (?!DATA )(\S+) (\S+)')
+    # Regular expressions which the names of the databases' and clusters'
+    # backups must match ([prefix], database or cluster, date)
+    DB_BKP_REGEX = re.compile(
+        r'(.+)?db_(.+)_(\d{8}_\d{6}_.+)\.(?:dump|bz2|gz|zip)$')
+    CL_BKP_REGEX = re.compile(
+        r'(.+)?ht_(.+_cluster)_(\d{8}_\d{6}_.+)\.(?:dump|bz2|gz|zip)$')
+
+    def __init__(self, path, logger=None):
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = Logger()
+
+        self.path = path
+
+        try:
+            self.conn = sqlite3.connect(self.path)
+            self.conn.executescript(Queries.CATALOG_CREATE_TOC)
+            self.conn.executescript(Queries.CATALOG_CREATE_BKPS)
+            self.conn.executescript(Queries.CATALOG_CREATE_WATCHERS)
+        except Exception as e:
+            self.logger.debug('Error en la función "Catalog": {}.'.format(
+                str(e)))
+            self.logger.stop_exe(Messenger.CATALOG_OPEN_FAIL.format(
+                path=self.path))
+
+    @staticmethod
+    def locate(path):
+        '''
+        Target:
+            - get the catalog which covers a directory, searching it in the
+              directory and its ancestors (the backer stores it in the
+              group's folder).
+        Parameters:
+            - path: the directory whose backups are going to be catalogued.
+        Return:
+            - the path of the catalog found, or the path of a new catalog in
+              the specified directory if there is not any.
+        '''
+        current = os.path.realpath(path)
+
+        while True:
+            cat_path = os.path.join(current, Default.CATALOG_FILE)
+            if os.path.isfile(cat_path):
+                return cat_path
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+
+        return os.path.join(os.path.realpath(path), Default.CATALOG_FILE)
+
+    def close(self):
+        '''
+        Target:
+            - close the catalog.
+        '''
+        try:
+            self.conn.close()
+        except Exception as e:
+            self.logger.debug('Error en la función "close": {}.'.format(
+                str(e)))
+
+    @staticmethod
+    def get_path_range(path):
+        '''
+        Target:
+            - get the bounds of the paths stored under a directory, so that
+              they can be searched through the index of the paths (every
+              path which starts with the directory followed by a separator
+              sorts between them).
+        Parameters:
+            - path: the absolute path of the directory.
+        Return:
+            - a tuple with the lowest path (included) and the highest one
+              (excluded).
+        '''
+        return (path + os.sep, path + chr(ord(os.sep) + 1))
+
+    @staticmethod
+    def parse_toc(toc_text):
+        '''
+        Target:
+            - extract the tables and schemas from the table of contents of a
+              backup.
+        Parameters:
+            - toc_text: output of "pg_restore -l".
+        Return:
+            - a list of tuples (object type, schema, name).
+        '''
+        toc = []
+
+        for line in toc_text.splitlines():
+            match = Catalog.TOC_REGEX.match(line)
+            if match:
+                obj_type, schema, name = match.groups()
+                # Schemas have no schema, so they are indexed by their name
+                if obj_type == 'SCHEMA':
+                    schema = name
+                toc.append((obj_type, schema, name))
+
+        return toc
+
+    @staticmethod
+    def parse_bkp_name(filename):
+        '''
+        Target:
+            - extract the data of a backup from its file's name.
+        Parameters:
+            - filename: the name of the file.
+        Return:
+            - a tuple (kind, prefix, database or cluster, date), where kind is
+              "cluster" or "db", or None if the file is not a backup.
+        '''
+        match = Catalog.CL_BKP_REGEX.match(filename)
+        if match:
+            return ('cluster', match.group(1) or '') + match.groups()[1:]
+
+        match = Catalog.DB_BKP_REGEX.match(filename)
+        if match:
+            return ('db', match.group(1) or '') + match.groups()[1:]
+
+        return None
+
+    def insert_bkp(self, bkp_path, file_info):
+        '''
+        Target:
+            - store a backup in the catalog (without committing).
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+            - file_info: the result of "stat" over the file.
+        Return:
+            - a boolean which indicates whether the file is a backup.
+        '''
+        bkp_data = Catalog.parse_bkp_name(os.path.basename(bkp_path))
+
+        if bkp_data:
+            kind, prefix, name, bkp_date = bkp_data
+            self.conn.execute(Queries.CATALOG_INSERT_BKP, (
+                bkp_path, os.path.dirname(bkp_path), kind, prefix, name,
+                bkp_date, file_info.st_size, file_info.st_mtime,
+                file_info.st_ctime))
+
+        return bool(bkp_data)
+
+    def add_bkp(self, bkp_path):
+        '''
+        Target:
+            - store a new backup in the catalog.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        bkp_path = os.path.realpath(bkp_path)
+
+        try:
+            with self.conn:
+                return self.insert_bkp(bkp_path, os.stat(bkp_path))
+
+        except Exception as e:
+            self.logger.debug('Error en la función "add_bkp": {}.'.format(
+                str(e)))
+            return False
+
+    def remove_bkp(self, bkp_path):
+        '''
+        Target:
+            - remove a backup (and its table of contents) from the catalog.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        bkp_path = os.path.realpath(bkp_path)
+
+        try:
+            with self.conn:
+                self.conn.execute(Queries.CATALOG_DELETE_BKP, (bkp_path, ))
+                self.conn.execute(Queries.CATALOG_DELETE_TOC, (bkp_path, ))
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "remove_bkp": {}.'.format(
+                str(e)))
+            return False
+
+    def reconcile(self, path, full=False):
+        '''
+        Target:
+            - synchronise the catalog with the backups stored in a directory
+              and its subdirectories. Only the status of the catalogued
+              directories is read: the ones whose modification date did not
+              change since the last synchronisation are not listed again (no
+              backup can have been added to or removed from them), and only
+              the files of the changed ones are compared with the catalog.
+              The backups rewritten in place are updated by the modules which
+              rewrite them, or by a full synchronisation.
+        Parameters:
+            - path: the directory whose backups are going to be catalogued.
+            - full: a flag which determinates whether every directory must be
+              listed and the status of every backup read again.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        root = os.path.realpath(path)
+        path_range = Catalog.get_path_range(root)
+
+        try:
+            known_dirs = dict(self.conn.execute(
+                Queries.CATALOG_GET_DIRS, (root, ) + path_range))
+            # Size and modification date of each catalogued backup
+            known_bkps = {
+                bkp_path: (size, mtime) for bkp_path, size, mtime, ctime in
+                self.conn.execute(Queries.CATALOG_GET_BKPS, path_range)}
+            # Directories checked (existing or not) and listed
+            seen_dirs = set()
+            scanned_dirs = set()
+            # The catalogued directories are checked directly, so that the
+            # unchanged ones do not need to be listed to reach their children
+            pending = [root] + [dirname for dirname in known_dirs
+                                if dirname != root]
+
+            with self.conn:
+                while pending:
+                    dirname = pending.pop()
+                    if dirname in seen_dirs:
+                        continue
+                    seen_dirs.add(dirname)
+
+                    try:
+                        dir_mtime = os.stat(dirname).st_mtime
+                        if not full and known_dirs.get(dirname) == dir_mtime:
+                            continue
+                        entries = list(os.scandir(dirname))
+                    except OSError:
+                        # Forget the directories removed outside the program
+                        if dirname in known_dirs:
+                            self.conn.execute(Queries.CATALOG_DELETE_DIR_BKPS,
+                                              (dirname, ))
+                            self.conn.execute(Queries.CATALOG_DELETE_DIR,
+                                              (dirname, ))
+                        continue
+
+                    scanned_dirs.add(dirname)
+
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif not entry.is_file():
+                            continue
+                        elif entry.path in known_bkps:
+                            file_info = entry.stat()
+                            if known_bkps.pop(entry.path) != (
+                                    file_info.st_size, file_info.st_mtime):
+                                self.insert_bkp(entry.path, file_info)
+                        elif Catalog.parse_bkp_name(entry.name):
+                            self.insert_bkp(entry.path, entry.stat())
+
+                    self.conn.execute(Queries.CATALOG_UPSERT_DIR,
+                                      (dirname, dir_mtime))
+
+                # Forget the backups removed outside the program
+                for bkp_path in known_bkps:
+                    if os.path.dirname(bkp_path) in scanned_dirs:
+                        self.conn.execute(Queries.CATALOG_DELETE_BKP,
+                                          (bkp_path, ))
+
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "reconcile": {}.'.format(
+                str(e)))
+            return False
+
+    def set_watcher(self, path, interval):
+        '''
+        Target:
+            - mark a directory as watched (its backups are catalogued as soon
+              as they are created or removed), renewing the mark's date.
+        Parameters:
+            - path: the watched directory.
+            - interval: number of seconds after which the mark is renewed.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        try:
+            with self.conn:
+                self.conn.execute(Queries.CATALOG_UPSERT_WATCHER, (
+                    os.path.realpath(path), time.time(), interval))
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "set_watcher": '
+                              '{}.'.format(str(e)))
+            return False
+
+    def remove_watcher(self, path):
+        '''
+        Target:
+            - remove the mark of a watched directory.
+        Parameters:
+            - path: the watched directory.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        try:
+            with self.conn:
+                self.conn.execute(Queries.CATALOG_DELETE_WATCHER,
+                                  (os.path.realpath(path), ))
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "remove_watcher": '
+                              '{}.'.format(str(e)))
+            return False
+
+    def is_watched(self, path):
+        '''
+        Target:
+            - check whether a directory (or one of its ancestors) is being
+              watched by a running watcher, so the catalog is up to date and
+              does not need to be synchronised. A watcher is considered dead
+              if it did not renew its mark during two intervals.
+        Parameters:
+            - path: the directory to check.
+        Return:
+            - a boolean which indicates whether the directory is watched.
+        '''
+        root = os.path.realpath(path)
+        now = time.time()
+
+        try:
+            watchers = self.conn.execute(
+                Queries.CATALOG_GET_WATCHERS).fetchall()
+        except Exception as e:
+            self.logger.debug('Error en la función "is_watched": '
+                              '{}.'.format(str(e)))
+            return False
+
+        for watched_path, heartbeat, interval in watchers:
+            if (root == watched_path or
+                    root.startswith(watched_path.rstrip(os.sep) + os.sep)) \
+                    and now - heartbeat <= 2 * interval:
+                return True
+
+        return False
+
+    @staticmethod
+    def get_watched_bkps(path, logger=None):
+        '''
+        Target:
+            - get the backups stored in a directory from its catalog, only if
+              the directory is being watched (otherwise the catalog could be
+              out of date).
+        Parameters:
+            - path: the directory where the backups are.
+            - logger: a logger to show and log some messages.
+        Return:
+            - a list with the backups sorted by modification date, or None if
+              the directory is not being watched.
+        '''
+        catalog_path = Catalog.locate(path)
+        bkps_list = None
+
+        if os.path.isfile(catalog_path):
+            bkps_catalog = Catalog(catalog_path, logger)
+            if bkps_catalog.is_watched(path):
+                bkps_list = [bkp[0] for bkp in bkps_catalog.get_bkps(path)]
+            bkps_catalog.close()
+
+        return bkps_list
+
+    def get_bkps(self, path):
+        '''
+        Target:
+            - get the catalogued backups stored in a directory and its
+              subdirectories, sorted by modification date.
+        Parameters:
+            - path: the directory where the backups are.
+        Return:
+            - a list of tuples (path, size, modification date, change date).
+        '''
+        root = os.path.realpath(path)
+
+        return self.conn.execute(Queries.CATALOG_GET_BKPS,
+                                 Catalog.get_path_range(root)).fetchall()
+
+    def add_bkp_toc(self, bkp_path, dbname, bkp_date, toc):
+        '''
+        Target:
+            - store the table of contents of a backup in the catalog,
+              replacing the previous one if it exists.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+            - dbname: name of the database the backup belongs to.
+            - bkp_date: date and time of the backup (as in its name).
+            - toc: a list of tuples (object type, schema, name).
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        try:
+            with self.conn:
+                self.conn.execute(Queries.CATALOG_DELETE_TOC, (bkp_path, ))
+                self.conn.executemany(
+                    Queries.CATALOG_INSERT_TOC,
+                    [(bkp_path, dbname, bkp_date, obj_type, schema, name)
+                     for obj_type, schema, name in toc])
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "add_bkp_toc": '
+                              '{}.'.format(str(e)))
+            return False
+
+    def remove_bkp_toc(self, bkp_path):
+        '''
+        Target:
+            - remove the table of contents of a backup from the catalog.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        try:
+            with self.conn:
+                self.conn.execute(Queries.CATALOG_DELETE_TOC, (bkp_path, ))
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "remove_bkp_toc": '
+                              '{}.'.format(str(e)))
+            return False
+
+    def find_bkp(self, table='', schema='', dbname=''):
+        '''
+        Target:
+            - get the latest backup which contains a table (or a whole
+              schema if no table is specified).
+        Parameters:
+            - table: name of the table to search.
+            - schema: name of the schema of the table (or the schema to
+              search if no table is specified).
+            - dbname: name of the database the backup must belong to (if
+              empty, the backups of every database are considered).
+        Return:
+            - the absolute path of the backup, or None if there is not any.
+        '''
+        if table:
+            query = Queries.CATALOG_FIND_TABLE_BKPS
+            params = (table, schema, schema, dbname, dbname)
+        else:
+            query = Queries.CATALOG_FIND_SCHEMA_BKPS
+            params = (schema, dbname, dbname)
+
+        try:
+            for row in self.conn.execute(query, params):
+                # Skip the backups which were removed outside the program
+                if os.path.isfile(row[0]):
+                    return row[0]
+
+        except Exception as e:
+            self.logger.debug('Error en la función "find_bkp": {}.'.format(
+                str(e)))
+
+        return None
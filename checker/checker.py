@@ -2,6 +2,7 @@
 # -*- encoding: utf-8 -*-
 
 
+import datetime  # To check hours
 import re  # To work with regular expressions
 
 from const.const import Default
@@ -83,6 +84,43 @@ class Checker:
         else:
             return False
 
+    @staticmethod
+    def str_is_valid_ratio(ratio):
+        '''
+        Target:
+            - check if a string could be converted into a valid ratio. It
+              would be any number between zero and one.
+        Parameters:
+            - ratio: the string to be checked.
+        Return:
+            - a boolean with the result.
+        '''
+        try:
+            result = float(ratio)
+            if 0 <= result <= 1:
+                return True
+            else:
+                return False
+        except:
+            return False
+
+    @staticmethod
+    def str_is_valid_hour(hour):
+        '''
+        Target:
+            - check if a string could be converted into a valid hour of the
+              day (HH:MM).
+        Parameters:
+            - hour: the string to be checked.
+        Return:
+            - a boolean with the result.
+        '''
+        try:
+            datetime.datetime.strptime(hour, '%H:%M')
+            return True
+        except:
+            return False
+
     @staticmethod
     def check_regex(regex):
         '''
@@ -105,6 +105,20 @@ class CfgParser:
                 'server': self.cfg.get('postgres', 'server').strip(),
                 'user': self.cfg.get('postgres', 'username').strip(),
                 'port': self.cfg.get('postgres', 'port'),
+                'itersize': self.cfg.get('postgres', 'itersize',
+                                         fallback='2000').strip(),
+                'pool_size': self.cfg.get('pool', 'max_size',
+                                          fallback='10').strip(),
+                'pool_idle_timeout': self.cfg.get('pool', 'idle_timeout',
+                                                  fallback='300').strip(),
+                'pool_max_total': self.cfg.get('pool', 'max_total',
+                                               fallback='20').strip(),
+                'dbs_ttl': self.cfg.get('cache', 'dbs_ttl',
+                                        fallback='0').strip(),
+                'standbys': self.cfg.get('standbys', 'hosts',
+                                         fallback='').strip(),
+                'max_lag': self.cfg.get('standbys', 'max_lag',
+                                        fallback='30').strip(),
             }
         except Exception as e:
             self.logger.debug('Error en la función "parse_connecter": '
@@ -174,6 +188,8 @@ class CfgParser:
                     'excludes', 'ex_templates').strip(),
                 'vacuum': self.cfg.get('other', 'vacuum').strip(),
                 'db_owner': self.cfg.get('other', 'db_owner').strip(),
+                'catalog': self.cfg.get('other', 'catalog',
+                                        fallback='False').strip(),
             }
 
         except Exception as e:
@@ -194,6 +210,8 @@ class CfgParser:
                 'bkp_type': self.cfg.get('file', 'bkp_type').strip(),
                 'prefix': self.cfg.get('file', 'prefix').strip(),
                 'vacuum': self.cfg.get('other', 'vacuum').strip(),
+                'catalog': self.cfg.get('other', 'catalog',
+                                        fallback='False').strip(),
             }
 
         except Exception as e:
@@ -217,6 +235,34 @@ class CfgParser:
                               '{}.'.format(str(e)))
             self.logger.stop_exe(Messenger.DROPPER_CFG_DAMAGED)
 
+    def parse_reindexer(self):
+        '''
+        Target:
+            - get the reindexer variables from a configuration file and store
+              them in a dictionary.
+        '''
+        try:
+            self.bkp_vars = {
+                'in_dbs': self.cfg.get('includes', 'in_dbs'),
+                'in_regex': self.cfg.get('includes', 'in_regex').strip(),
+                'in_priority': self.cfg.get('includes', 'in_priority').strip(),
+                'ex_dbs': self.cfg.get('excludes', 'ex_dbs'),
+                'ex_regex': self.cfg.get('excludes', 'ex_regex').strip(),
+                'ex_templates': self.cfg.get(
+                    'excludes', 'ex_templates').strip(),
+                'db_owner': self.cfg.get('other', 'db_owner').strip(),
+                'bloat_ratio': self.cfg.get('conditions',
+                                            'bloat_ratio').strip(),
+                'workers': self.cfg.get('conditions', 'workers').strip(),
+                'time_budget': self.cfg.get('conditions',
+                                            'time_budget').strip(),
+            }
+
+        except Exception as e:
+            self.logger.debug('Error en la función "parse_reindexer": '
+                              '{}.'.format(str(e)))
+            self.logger.stop_exe(Messenger.REINDEXER_CFG_DAMAGED)
+
     def parse_replicator(self):
         '''
         Target:
@@ -244,6 +290,14 @@ class CfgParser:
             self.bkp_vars = {
                 'bkp_path': self.cfg.get('settings', 'bkp_path'),
                 'new_dbname': self.cfg.get('settings', 'new_dbname'),
+                'swap': self.cfg.get('settings', 'swap',
+                                     fallback='False').strip(),
+                'table': self.cfg.get('settings', 'table',
+                                      fallback='').strip(),
+                'schema': self.cfg.get('settings', 'schema',
+                                       fallback='').strip(),
+                'jobs': self.cfg.get('settings', 'jobs',
+                                     fallback='1').strip(),
             }
 
         except Exception as e:
@@ -320,7 +374,31 @@ class CfgParser:
                 'min_n_bkps': self.cfg.get('conditions', 'min_n_bkps').strip(),
                 'exp_days': self.cfg.get('conditions', 'exp_days').strip(),
                 'max_size': self.cfg.get('conditions', 'max_size').strip(),
+                'keep_daily': self.cfg.get('conditions', 'keep_daily',
+                                           fallback='0').strip(),
+                'keep_weekly': self.cfg.get('conditions', 'keep_weekly',
+                                            fallback='0').strip(),
+                'keep_monthly': self.cfg.get('conditions', 'keep_monthly',
+                                             fallback='0').strip(),
+                'keep_yearly': self.cfg.get('conditions', 'keep_yearly',
+                                            fallback='0').strip(),
+                'enforce_size': self.cfg.get('conditions', 'enforce_size',
+                                             fallback='False').strip(),
+                'max_total_size': self.cfg.get('conditions', 'max_total_size',
+                                               fallback='').strip(),
                 'pg_warnings': self.cfg.get('other', 'pg_warnings').strip(),
+                'catalog': self.cfg.get('other', 'catalog',
+                                        fallback='False').strip(),
+                'full_reconcile': self.cfg.get('other', 'full_reconcile',
+                                               fallback='False').strip(),
+                'name_dates': self.cfg.get('other', 'name_dates',
+                                           fallback='False').strip(),
+                'dry_run': self.cfg.get('other', 'dry_run',
+                                        fallback='False').strip(),
+                'plan_file': self.cfg.get('other', 'plan_file',
+                                          fallback='').strip(),
+                'workers': self.cfg.get('other', 'workers',
+                                        fallback='4').strip(),
             }
 
         except Exception as e:
@@ -341,6 +419,28 @@ class CfgParser:
                 'min_n_bkps': self.cfg.get('conditions', 'min_n_bkps').strip(),
                 'exp_days': self.cfg.get('conditions', 'exp_days').strip(),
                 'max_size': self.cfg.get('conditions', 'max_size').strip(),
+                'keep_daily': self.cfg.get('conditions', 'keep_daily',
+                                           fallback='0').strip(),
+                'keep_weekly': self.cfg.get('conditions', 'keep_weekly',
+                                            fallback='0').strip(),
+                'keep_monthly': self.cfg.get('conditions', 'keep_monthly',
+                                             fallback='0').strip(),
+                'keep_yearly': self.cfg.get('conditions', 'keep_yearly',
+                                            fallback='0').strip(),
+                'enforce_size': self.cfg.get('conditions', 'enforce_size',
+                                             fallback='False').strip(),
+                'catalog': self.cfg.get('other', 'catalog',
+                                        fallback='False').strip(),
+                'full_reconcile': self.cfg.get('other', 'full_reconcile',
+                                               fallback='False').strip(),
+                'name_dates': self.cfg.get('other', 'name_dates',
+                                           fallback='False').strip(),
+                'dry_run': self.cfg.get('other', 'dry_run',
+                                        fallback='False').strip(),
+                'plan_file': self.cfg.get('other', 'plan_file',
+                                          fallback='').strip(),
+                'workers': self.cfg.get('other', 'workers',
+                                        fallback='4').strip(),
             }
 
         except Exception as e:
@@ -364,8 +464,44 @@ class CfgParser:
                 'ex_templates': self.cfg.get(
                     'excludes', 'ex_templates').strip(),
                 'db_owner': self.cfg.get('other', 'db_owner').strip(),
+                'smart': self.cfg.get('other', 'smart',
+                                      fallback='False').strip(),
+                'dead_ratio': self.cfg.get('other', 'dead_ratio',
+                                           fallback='0.2').strip(),
+                'workers': self.cfg.get('other', 'workers',
+                                        fallback='1').strip(),
+                'jobs': self.cfg.get('other', 'jobs', fallback='1').strip(),
+                'max_conns': self.cfg.get('other', 'max_conns',
+                                          fallback='0').strip(),
+                'freeze': self.cfg.get('other', 'freeze',
+                                       fallback='False').strip(),
+                'freeze_age': self.cfg.get('other', 'freeze_age',
+                                           fallback='150000000').strip(),
+                'time_budget': self.cfg.get('other', 'time_budget',
+                                            fallback='0').strip(),
+                'executor': self.cfg.get('other', 'executor',
+                                         fallback='vacuumdb').strip(),
+                'analyze': self.cfg.get('other', 'analyze',
+                                        fallback='False').strip(),
+                'parallel': self.cfg.get('other', 'parallel',
+                                         fallback='0').strip(),
+                'skip_locked': self.cfg.get('other', 'skip_locked',
+                                            fallback='False').strip(),
+                'index_cleanup': self.cfg.get('other', 'index_cleanup',
+                                              fallback='auto').strip(),
+                'profiles': [],
             }
 
+            # Each "profile_<name>" section defines a vacuum profile
+            for section in self.cfg.sections():
+                if section.startswith('profile_'):
+                    profile = {'name': section[len('profile_'):]}
+                    for key in ('start', 'end', 'cost_delay', 'cost_limit',
+                                'parallel', 'workers'):
+                        profile[key] = self.cfg.get(section, key,
+                                                    fallback='').strip()
+                    self.bkp_vars['profiles'].append(profile)
+
         except Exception as e:
             self.logger.debug('Error en la función "parse_vacuumer": '
                               '{}.'.format(str(e)))
@@ -65,6 +65,10 @@ class Configurator:
             self.parser.load_cfg(self.path)
             self.parser.parse_mailer()
 
+        elif self.cfg_type == 'reindex':
+            self.parser.load_cfg(self.path)
+            self.parser.parse_reindexer()
+
         elif self.cfg_type == 'replicate':
             self.parser.load_cfg(self.path)
             self.parser.parse_replicator()
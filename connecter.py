@@ -2,6 +2,11 @@
 # -*- encoding: utf-8 -*-
 
 
+import itertools  # To give a different name to each server-side cursor
+import re  # To number the placeholders of the prepared statements
+import threading  # To share the pool of connections among threads
+import time  # To close the connections which have not been used for a while
+
 import psycopg2  # To work with PostgreSQL
 import psycopg2.extras  # To get real field names from PostgreSQL
 
@@ -24,6 +29,20 @@ class Connecter:
     user = None  # The PostgreSQL user who makes the connection
     port = None  # The target port of the connection
     database = None  # The target database of the connection
+    # Flag which determinates whether the connection belongs to the pool
+    pooled = False
+    # Server's metadata already queried (version, superuser, databases...),
+    # with the moment it was stored
+    metadata = None
+    # Number of seconds during which the stored lists of databases are valid
+    # (0 means until they are invalidated)
+    dbs_ttl = 0
+    # Number of rows fetched at a time by the server-side cursors
+    itersize = 2000
+    # Counter to give a different name to each server-side cursor
+    n_cursors = itertools.count(1)
+    # Names of the statements prepared in the connection, by query
+    prepared = None
     logger = None  # A logger to show and log some messages
 
     # PostgreSQL version (from this one on some variables change their names)
@@ -31,7 +50,8 @@ class Connecter:
     pg_pid_91 = 'procpid'  # Name for PostgreSQL PID variable till version 9.1
     pg_pid_92 = 'pid'  # Name for PostgreSQL PID variable since version 9.2
 
-    def __init__(self, server, user, port, database=None, logger=None):
+    def __init__(self, server, user, port, database=None, logger=None,
+                 required=True):
 
         if logger:
             self.logger = logger
@@ -49,6 +69,9 @@ class Connecter:
         else:
             self.logger.stop_exe(Msg.INVALID_PORT)
 
+        self.metadata = {}
+        self.prepared = {}
+
         if database is None:
             self.database = Default.CONNECTION_DATABASE
         elif database:
@@ -67,13 +90,21 @@ class Connecter:
         except Exception as e:
             self.logger.debug('Error en la función "pg_connect": {}.'.format(
                 str(e)))
+            # Let the caller try another server if this one is not required
+            if not required:
+                raise
             self.logger.stop_exe(Msg.CONNECT_FAIL)
 
     def pg_disconnect(self):
         '''
         Target:
-            - disconnect from PostgreSQL.
+            - disconnect from PostgreSQL, or give the connection back to the
+              pool if it belongs to it.
         '''
+        if self.pooled:
+            ConnecterPool.release(self)
+            return
+
         try:
             self.cursor.close()
             self.conn.close()
@@ -82,6 +113,160 @@ class Connecter:
                               '{}.'.format(str(e)))
             self.logger.stop_exe(Msg.DISCONNECT_FAIL)
 
+    def set_dbs_ttl(self, dbs_ttl):
+        '''
+        Target:
+            - set the number of seconds during which the stored lists of
+              databases are valid.
+        Parameters:
+            - dbs_ttl: the number of seconds, or 0 to keep the lists until
+              they are invalidated.
+        '''
+        if Checker.str_is_int(dbs_ttl) and int(dbs_ttl) >= 0:
+            self.dbs_ttl = Casting.str_to_int(dbs_ttl)
+        else:
+            self.logger.stop_exe(Msg.INVALID_DBS_TTL)
+
+    def set_itersize(self, itersize):
+        '''
+        Target:
+            - set the number of rows fetched at a time by the server-side
+              cursors.
+        Parameters:
+            - itersize: the number of rows.
+        '''
+        if Checker.str_is_int(itersize) and int(itersize) > 0:
+            self.itersize = Casting.str_to_int(itersize)
+        else:
+            self.logger.stop_exe(Msg.INVALID_ITERSIZE)
+
+    @staticmethod
+    def get_positional_query(query):
+        '''
+        Target:
+            - turn the placeholders of a query ("%s") into the positional ones
+              which PostgreSQL expects in a prepared statement ("$1", "$2"...).
+        Parameters:
+            - query: the query to change.
+        Return:
+            - the query with positional placeholders.
+        '''
+        n_params = itertools.count(1)
+
+        return re.sub(r'%s', lambda match: '${}'.format(next(n_params)),
+                      query)
+
+    def execute_prepared(self, query, params=()):
+        '''
+        Target:
+            - run a query through a prepared statement, so that it is parsed
+              and planned only once per connection. The statement is prepared
+              the first time the query is run. Only queries which PostgreSQL
+              can prepare (SELECT, INSERT, UPDATE, DELETE or VALUES) are
+              allowed. The result is read through the connection cursor.
+        Parameters:
+            - query: the query to run, with "%s" placeholders.
+            - params: the parameters of the query.
+        '''
+        stmt_name = self.prepared.get(query)
+
+        if stmt_name is None:
+            stmt_name = 'py_pg_tools_stmt_{}'.format(len(self.prepared) + 1)
+            self.cursor.execute(Queries.PREPARE_PG_STMT.format(
+                stmt_name=stmt_name,
+                query=self.get_positional_query(query)))
+            self.prepared[query] = stmt_name
+
+        if params:
+            placeholders = '({})'.format(', '.join(['%s'] * len(params)))
+        else:
+            placeholders = ''
+
+        self.cursor.execute(Queries.EXECUTE_PG_STMT.format(
+            stmt_name=stmt_name, placeholders=placeholders), params)
+
+    def stream_query(self, query, params=None, itersize=None):
+        '''
+        Target:
+            - run a query through a server-side cursor and get its rows a few
+              at a time, so that big results are never kept in memory at
+              once. The cursor is declared "WITH HOLD" to work with
+              autocommit, so other queries can be run through the connection
+              while the rows are being read.
+        Parameters:
+            - query: the query to run.
+            - params: the parameters of the query.
+            - itersize: the number of rows fetched at a time. If it is not
+              specified, the connecter's one is used.
+        Return:
+            - a generator which yields the rows as named tuples.
+        '''
+        cursor = self.conn.cursor(
+            name='py_pg_tools_{}'.format(next(self.n_cursors)),
+            cursor_factory=psycopg2.extras.NamedTupleCursor, withhold=True)
+        cursor.itersize = itersize or self.itersize
+
+        try:
+            cursor.execute(query, params)
+            for row in cursor:
+                yield row
+        finally:
+            cursor.close()
+
+    def get_metadata(self, key, ttl=0):
+        '''
+        Target:
+            - get a piece of the server's metadata which was already queried.
+        Parameters:
+            - key: a tuple which identifies the metadata. Its first element is
+              the group it belongs to.
+            - ttl: the number of seconds during which the metadata is valid
+              (0 means until it is invalidated).
+        Return:
+            - a tuple with a boolean which indicates whether the metadata was
+              stored and is still valid, and the metadata itself.
+        '''
+        if key not in self.metadata:
+            return False, None
+
+        value, stored = self.metadata[key]
+
+        if ttl and time.time() - stored >= ttl:
+            del self.metadata[key]
+            return False, None
+
+        return True, value
+
+    def set_metadata(self, key, value):
+        '''
+        Target:
+            - store a piece of the server's metadata to avoid querying it
+              again.
+        Parameters:
+            - key: a tuple which identifies the metadata. Its first element is
+              the group it belongs to.
+            - value: the metadata to store.
+        '''
+        self.metadata[key] = (value, time.time())
+
+    def invalidate_metadata(self, group=None):
+        '''
+        Target:
+            - forget the stored metadata of the server, so that it is queried
+              again the next time it is needed. Must be called after changing
+              it (e.g. after creating, renaming or dropping a database).
+        Parameters:
+            - group: the group of metadata to forget ("version", "superuser",
+              "pid_str" or "dbs"). If it is not specified, all the metadata
+              is forgotten.
+        '''
+        if group is None:
+            self.metadata = {}
+        else:
+            for key in list(self.metadata):
+                if key[0] == group:
+                    del self.metadata[key]
+
     def get_pg_version(self):
         '''
         Target:
@@ -98,11 +283,16 @@ class Connecter:
         Return:
             - a string which gives the PostgreSQL version and more details.
         '''
+        stored, pretty_pg_version = self.get_metadata(('version', ))
+        if stored:
+            return pretty_pg_version
+
         try:
             self.cursor.execute(Queries.GET_PG_PRETTY_VERSION)
-            pretty_pg_version = self.cursor.fetchone()
+            pretty_pg_version = self.cursor.fetchone()[0]
+            self.set_metadata(('version', ), pretty_pg_version)
 
-            return pretty_pg_version[0]
+            return pretty_pg_version
 
         except Exception as e:
             # Rollback to avoid errors in next queries because of waiting
@@ -113,6 +303,28 @@ class Connecter:
             self.logger.highlight('warning', Msg.GET_PG_VERSION_FAIL, 'yellow')
             return None
 
+    def get_replay_lag(self):
+        '''
+        Target:
+            - get how far behind its primary server a standby server is.
+        Return:
+            - the number of seconds which the standby server is behind, or
+              None if the server is not a standby or its lag is unknown.
+        '''
+        try:
+            self.cursor.execute(Queries.GET_PG_REPLAY_LAG)
+            row = self.cursor.fetchone()
+
+        except Exception as e:
+            self.logger.debug('Error en la función "get_replay_lag": '
+                              '{}.'.format(str(e)))
+            return None
+
+        if not row['in_recovery'] or row['replay_lag'] is None:
+            return None
+
+        return float(row['replay_lag'])
+
     def get_pid_str(self):
         '''
         Target:
@@ -122,12 +334,20 @@ class Connecter:
         Return:
             - a string which gives the name of the vaiable process id.
         '''
+        stored, pid_str = self.get_metadata(('pid_str', ))
+        if stored:
+            return pid_str
+
         pg_version = self.get_pg_version()  # Get PostgreSQL version
 
         if pg_version < self.PG_PID_VERSION_THRESHOLD:
-            return self.pg_pid_91
+            pid_str = self.pg_pid_91
         else:
-            return self.pg_pid_92
+            pid_str = self.pg_pid_92
+
+        self.set_metadata(('pid_str', ), pid_str)
+
+        return pid_str
 
     def is_pg_superuser(self):
         '''
@@ -137,8 +357,13 @@ class Connecter:
             - a boolean which indicates whether a user is a PostgreSQL
               superuser or not.
         '''
+        stored, pg_superuser = self.get_metadata(('superuser', ))
+        if stored:
+            return pg_superuser
+
         self.cursor.execute(Queries.IS_PG_SUPERUSER)
         row = self.cursor.fetchone()
+        self.set_metadata(('superuser', ), row['usesuper'])
 
         return row['usesuper']
 
@@ -201,6 +426,11 @@ class Connecter:
             - a list with the PostgreSQL databases and their names,
               datallowconn and owners.
         '''
+        key = ('dbs', 'data', ex_templates, db_owner)
+        stored, dbs = self.get_metadata(key, self.dbs_ttl)
+        if stored:
+            return list(dbs)
+
         try:
             # Get all databases (no templates) of a specific owner
             if db_owner and ex_templates:
@@ -216,6 +446,8 @@ class Connecter:
                 self.cursor.execute(Queries.GET_PG_NO_TEMPLATE_DBS)
 
             dbs = self.cursor.fetchall()
+            self.set_metadata(key, dbs)
+            dbs = list(dbs)
 
         except Exception as e:
             # Rollback to avoid errors in next queries because of waiting
@@ -312,6 +544,121 @@ class Connecter:
 
         return conn
 
+    @staticmethod
+    def sort_by_list(rows, column, values):
+        '''
+        Target:
+            - sort the rows got by a query in the order of the values which
+              were asked for.
+        Parameters:
+            - rows: the rows to sort.
+            - column: the column which contains the values asked for.
+            - values: the values asked for, in the order to follow.
+        Return:
+            - a list with the rows of the values which were found.
+        '''
+        rows_by_value = {str(row[column]): row for row in rows}
+
+        return [rows_by_value[str(value)] for value in values
+                if str(value) in rows_by_value]
+
+    def get_pg_dbs_data_by_name(self, dbnames):
+        '''
+        Target:
+            - get some info about several databases in only one query.
+        Parameters:
+            - dbnames: names of the databases whose information is going to
+              be gattered.
+        Return:
+            - a list with the info of the databases which were found, in the
+              specified order.
+        '''
+        try:
+            self.cursor.execute(Queries.GET_PG_DBS_DATA_BY_NAME,
+                                (list(dbnames), ))
+            dbs = self.sort_by_list(self.cursor.fetchall(), 'datname',
+                                    dbnames)
+
+        except Exception as e:
+            # Rollback to avoid errors in next queries because of waiting
+            # this transaction to finish
+            self.conn.rollback()
+            self.logger.debug('Error en la función "get_pg_dbs_data_by_name": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_DBS_DATA, 'yellow')
+            dbs = None
+
+        return dbs
+
+    def get_pg_users_data(self, usernames):
+        '''
+        Target:
+            - get some info about several users in only one query.
+        Parameters:
+            - usernames: names of the users whose information is going to be
+              gattered.
+        Return:
+            - a list with the info of the users which were found, in the
+              specified order.
+        '''
+        try:
+            pg_version = self.get_pg_version()  # Get PostgreSQL version
+
+            if pg_version < self.PG_PID_VERSION_THRESHOLD:
+                self.cursor.execute(Queries.GET_PG91_USERS_DATA,
+                                    (list(usernames), ))
+            else:
+                self.cursor.execute(Queries.GET_PG92_USERS_DATA,
+                                    (list(usernames), ))
+            users = self.sort_by_list(self.cursor.fetchall(), 'usename',
+                                      usernames)
+
+        except Exception as e:
+            # Rollback to avoid errors in next queries because of waiting
+            # this transaction to finish
+            self.conn.rollback()
+            self.logger.debug('Error en la función "get_pg_users_data": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_USERS_DATA, 'yellow')
+            users = None
+
+        return users
+
+    def get_pg_conns_data(self, connpids):
+        '''
+        Target:
+            - get some info about several backends in only one query.
+        Parameters:
+            - connpids: PIDs of the backends whose information is going to be
+              gattered.
+        Return:
+            - a list with the info of the backends which were found, in the
+              specified order.
+        '''
+        pid = self.get_pid_str()  # Get PID variable's name
+
+        try:
+            pg_version = self.get_pg_version()  # Get PostgreSQL version
+
+            if pg_version < self.PG_PID_VERSION_THRESHOLD:
+                self.cursor.execute(Queries.GET_PG91_CONNS_DATA,
+                                    (list(connpids), ))
+            else:
+                self.cursor.execute(Queries.GET_PG92_CONNS_DATA,
+                                    (list(connpids), ))
+            conns = self.sort_by_list(self.cursor.fetchall(), pid, connpids)
+
+        except Exception as e:
+            # Rollback to avoid errors in next queries because of waiting
+            # this transaction to finish
+            self.conn.rollback()
+            self.logger.debug('Error en la función "get_pg_conns_data": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Msg.GET_PG_CONNS_DATA, 'yellow')
+            conns = None
+
+        return conns
+
     def get_pg_dbnames(self, ex_templates=False):
         '''
         Target:
@@ -321,6 +668,11 @@ class Connecter:
             - ex_templates: flag which determinates whether or not get those
               databases which are templates.
         '''
+        key = ('dbs', 'names', ex_templates)
+        stored, dbnames = self.get_metadata(key, self.dbs_ttl)
+        if stored:
+            return list(dbnames)
+
         try:
             if ex_templates:
                 self.cursor.execute(Queries.GET_PG_NO_TEMPLATE_DBNAMES)
@@ -331,6 +683,7 @@ class Connecter:
             dbnames = []
             for record in result:
                 dbnames.append(record['datname'])
+            self.set_metadata(key, list(dbnames))
 
         except Exception as e:
             # Rollback to avoid errors in next queries because of waiting
@@ -408,7 +761,8 @@ class Connecter:
             - a boolean which indicates if the process succeded.
         '''
         try:
-            self.cursor.execute(Queries.ALLOW_CONN_TO_PG_DB, (dbname, ))
+            self.execute_prepared(Queries.ALLOW_CONN_TO_PG_DB, (dbname, ))
+            self.invalidate_metadata('dbs')
             return True
 
         except Exception as e:
@@ -430,7 +784,8 @@ class Connecter:
             - a boolean which indicates if the process succeded.
         '''
         try:
-            self.cursor.execute(Queries.DISALLOW_CONN_TO_PG_DB, (dbname, ))
+            self.execute_prepared(Queries.DISALLOW_CONN_TO_PG_DB, (dbname, ))
+            self.invalidate_metadata('dbs')
             return True
 
         except Exception as e:
@@ -452,7 +807,7 @@ class Connecter:
             - a boolean which indicates the value of "datallowconn".
         '''
         try:
-            self.cursor.execute(Queries.GET_PG_DB_DATALLOWCONN, (dbname, ))
+            self.execute_prepared(Queries.GET_PG_DB_DATALLOWCONN, (dbname, ))
             result = self.cursor.fetchone()
             return result[0]
 
@@ -463,3 +818,387 @@ class Connecter:
             self.logger.debug('Error en la función "get_datallowconn": '
                               '{}.'.format(str(e)))
             return None
+
+
+class ConnecterPool:
+    '''This class keeps the connections to PostgreSQL which are not being
+    used, so that any module can borrow them instead of connecting (and
+    authenticating) again. The connections are grouped by host, port, user
+    and database.
+    '''
+    max_size = 10  # Maximum number of connections of each group
+    max_total = 20  # Maximum number of connections of all the groups
+    # Number of seconds after which an unused connection is closed
+    idle_timeout = 300
+    # Unused connecters of each group, with the moment they were given back
+    idle = {}
+    n_conns = {}  # Number of connections opened in each group
+    # Lock to borrow and give back the connections, and to wait for them
+    lock = threading.Condition()
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def configure(cls, max_size=None, idle_timeout=None, max_total=None,
+                  logger=None):
+        '''
+        Target:
+            - set the limits of the pool.
+        Parameters:
+            - max_size: the maximum number of connections of each group.
+            - idle_timeout: the number of seconds after which an unused
+              connection is closed.
+            - max_total: the maximum number of connections of all the groups.
+            - logger: a logger to show and log some messages.
+        '''
+        if not logger:
+            logger = Logger()
+
+        if max_size is None:
+            cls.max_size = Default.POOL_MAX_SIZE
+        elif Checker.str_is_int(max_size) and int(max_size) > 0:
+            cls.max_size = Casting.str_to_int(max_size)
+        else:
+            logger.stop_exe(Msg.INVALID_POOL_MAX_SIZE)
+
+        if idle_timeout is None:
+            cls.idle_timeout = Default.POOL_IDLE_TIMEOUT
+        elif Checker.str_is_int(idle_timeout) and int(idle_timeout) >= 0:
+            cls.idle_timeout = Casting.str_to_int(idle_timeout)
+        else:
+            logger.stop_exe(Msg.INVALID_POOL_IDLE_TIMEOUT)
+
+        if max_total is None:
+            cls.max_total = Default.POOL_MAX_TOTAL
+        elif Checker.str_is_int(max_total) and int(max_total) > 0:
+            cls.max_total = Casting.str_to_int(max_total)
+        else:
+            logger.stop_exe(Msg.INVALID_POOL_MAX_TOTAL)
+
+    @classmethod
+    def cap_total(cls, max_total):
+        '''
+        Target:
+            - lower the maximum number of connections of all the groups, if
+              it is higher than the received one.
+        Parameters:
+            - max_total: the maximum number of connections which can be
+              opened at a time.
+        '''
+        with cls.lock:
+            cls.max_total = min(cls.max_total, max_total)
+
+    @staticmethod
+    def get_key(server, user, port, database=None):
+        '''
+        Target:
+            - get the group of a connection.
+        Parameters:
+            - server: the target host of the connection.
+            - user: the PostgreSQL user who makes the connection.
+            - port: the target port of the connection.
+            - database: the target database of the connection.
+        Return:
+            - a tuple with the host, port, user and database.
+        '''
+        if Checker.str_is_int(port):
+            port = Casting.str_to_int(port)
+        if database is None:
+            database = Default.CONNECTION_DATABASE
+
+        return (server, port, user, database)
+
+    @staticmethod
+    def is_healthy(connecter):
+        '''
+        Target:
+            - check whether a connection still works.
+        Parameters:
+            - connecter: the connecter to check.
+        Return:
+            - a boolean which indicates whether the connection works.
+        '''
+        if connecter.conn.closed:
+            return False
+
+        try:
+            connecter.cursor.execute(Queries.CHECK_PG_CONN)
+            connecter.cursor.fetchone()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def close(connecter):
+        '''
+        Target:
+            - close a connection of the pool, ignoring any error (it may be
+              already broken).
+        Parameters:
+            - connecter: the connecter to close.
+        '''
+        connecter.pooled = False
+
+        try:
+            connecter.cursor.close()
+            connecter.conn.close()
+        except Exception:
+            pass
+
+    @classmethod
+    def expire(cls):
+        '''
+        Target:
+            - take out of the pool the connections which have not been used
+              for longer than the idle timeout. The lock must be held, and
+              the connections must be closed once it is released.
+        Return:
+            - a list with the connecters to close.
+        '''
+        now = time.time()
+        expired = []
+
+        for key, idle_conns in cls.idle.items():
+            kept_conns = []
+            for connecter, released in idle_conns:
+                if now - released < cls.idle_timeout:
+                    kept_conns.append((connecter, released))
+                else:
+                    expired.append(connecter)
+                    cls.n_conns[key] -= 1
+            cls.idle[key] = kept_conns
+
+        return expired
+
+    @classmethod
+    def evict(cls):
+        '''
+        Target:
+            - take out of the pool the unused connection which was given back
+              the longest time ago, whatever its group is. The lock must be
+              held, and the connection must be closed once it is released.
+        Return:
+            - the connecter to close, or None if there are no unused
+              connections.
+        '''
+        oldest_key = None
+        oldest_released = None
+
+        for key, idle_conns in cls.idle.items():
+            # The connections of each group are given back in order
+            if idle_conns and (oldest_released is None or
+                               idle_conns[0][1] < oldest_released):
+                oldest_key = key
+                oldest_released = idle_conns[0][1]
+
+        if oldest_key is None:
+            return None
+
+        connecter, released = cls.idle[oldest_key].pop(0)
+        cls.n_conns[oldest_key] -= 1
+
+        return connecter
+
+    @classmethod
+    def get_connecter(cls, server, user, port, database=None, logger=None,
+                      required=True):
+        '''
+        Target:
+            - borrow a working connection from the pool, or open a new one if
+              there are none unused. If the group has already the maximum
+              number of connections, wait until one is given back. If all the
+              groups together have it, close the unused connection of any
+              group which was given back the longest time ago, or wait until
+              one is given back if there are none unused.
+        Parameters:
+            - server: the target host of the connection.
+            - user: the PostgreSQL user who makes the connection.
+            - port: the target port of the connection.
+            - database: the target database of the connection.
+            - logger: a logger to show and log some messages.
+            - required: a flag which determinates whether the execution must
+              stop if the connection cannot be opened. Otherwise, the error
+              is raised.
+        Return:
+            - a connecter which must be given back through "pg_disconnect".
+        '''
+        key = cls.get_key(server, user, port, database)
+
+        while True:
+            connecter = None
+
+            with cls.lock:
+                to_close = cls.expire()
+                while True:
+                    idle_conns = cls.idle.get(key, [])
+                    if idle_conns:
+                        connecter, released = idle_conns.pop()
+                        break
+                    if cls.n_conns.get(key, 0) < cls.max_size:
+                        # Make room for the new connection if the limit of
+                        # all the groups has been reached
+                        while sum(cls.n_conns.values()) >= cls.max_total:
+                            evicted = cls.evict()
+                            if evicted is None:
+                                break
+                            to_close.append(evicted)
+                        if sum(cls.n_conns.values()) < cls.max_total:
+                            cls.n_conns[key] = cls.n_conns.get(key, 0) + 1
+                            break
+                    cls.lock.wait()
+
+            # Close the connections and check the unused one without holding
+            # the lock, so the rest of the threads are not blocked meanwhile
+            for expired in to_close:
+                cls.close(expired)
+
+            # A place for a new connection was taken
+            if connecter is None:
+                break
+
+            if cls.is_healthy(connecter):
+                if logger:
+                    connecter.logger = logger
+                return connecter
+
+            cls.close(connecter)
+            with cls.lock:
+                cls.n_conns[key] -= 1
+                cls.lock.notify_all()
+
+        try:
+            connecter = Connecter(server=server, user=user, port=port,
+                                  database=database, logger=logger,
+                                  required=required)
+        except BaseException:
+            # Free the place of the connection which could not be opened
+            with cls.lock:
+                cls.n_conns[key] -= 1
+                cls.lock.notify_all()
+            raise
+
+        connecter.pooled = True
+
+        return connecter
+
+    @staticmethod
+    def parse_standbys(standbys, port, logger=None):
+        '''
+        Target:
+            - get the host and port of each standby server from a string.
+        Parameters:
+            - standbys: a string with the standby servers as "host:port",
+              separated by commas. The port can be omitted.
+            - port: the port of the standby servers whose port is omitted.
+            - logger: a logger to show and log some messages.
+        Return:
+            - a list of tuples with the host and port of each standby server.
+        '''
+        if not logger:
+            logger = Logger()
+
+        standbys_list = []
+
+        for standby in Casting.str_to_list(standbys):
+            server, sep, standby_port = standby.partition(':')
+            if not sep:
+                standby_port = port
+            if not server or not Checker.str_is_int(standby_port):
+                logger.stop_exe(Msg.INVALID_STANDBYS)
+            standbys_list.append((server, Casting.str_to_int(standby_port)))
+
+        return standbys_list
+
+    @classmethod
+    def get_read_connecter(cls, connecter, standbys, max_lag, logger=None):
+        '''
+        Target:
+            - borrow a connection to the first standby server whose replay lag
+              is acceptable, to do read-only work there instead of in the
+              primary server.
+        Parameters:
+            - connecter: the connecter to the primary server, whose user and
+              database are used.
+            - standbys: a list of tuples with the host and port of each
+              standby server, in order of preference.
+            - max_lag: the maximum number of seconds which a standby server
+              can be behind its primary server.
+            - logger: a logger to show and log some messages.
+        Return:
+            - a connecter to a standby server, or the received one if there
+              is none suitable.
+        '''
+        if not logger:
+            logger = connecter.logger
+
+        for server, port in standbys:
+
+            try:
+                standby = cls.get_connecter(
+                    server=server, user=connecter.user, port=port,
+                    database=connecter.database, logger=logger,
+                    required=False)
+            except Exception:
+                standby = None
+
+            if standby:
+                lag = standby.get_replay_lag()
+                if lag is not None and lag <= max_lag:
+                    message = Msg.READING_FROM_STANDBY.format(
+                        server=server, port=port, lag=round(lag, 2))
+                    logger.info(message)
+                    return standby
+                standby.pg_disconnect()
+
+            message = Msg.STANDBY_DISCARDED.format(server=server, port=port,
+                                                   max_lag=max_lag)
+            logger.highlight('warning', message, 'yellow')
+
+        if standbys:
+            logger.highlight('warning', Msg.NO_STANDBY_AVAILABLE, 'yellow')
+
+        return connecter
+
+    @classmethod
+    def release(cls, connecter):
+        '''
+        Target:
+            - give a connection back to the pool, resetting the settings of
+              its session.
+        Parameters:
+            - connecter: the connecter to give back.
+        '''
+        key = cls.get_key(connecter.server, connecter.user, connecter.port,
+                          connecter.database)
+
+        try:
+            connecter.cursor.execute(Queries.RESET_PG_SESSION)
+            healthy = True
+        except Exception:
+            healthy = False
+
+        if not healthy:
+            cls.close(connecter)
+
+        with cls.lock:
+            if healthy:
+                cls.idle.setdefault(key, []).append((connecter, time.time()))
+            else:
+                cls.n_conns[key] -= 1
+            # Wake every waiting thread, since they may wait for the same
+            # group or for any connection to be closed
+            cls.lock.notify_all()
+
+    @classmethod
+    def close_all(cls):
+        '''
+        Target:
+            - close every unused connection of the pool.
+        '''
+        with cls.lock:
+            for key, idle_conns in cls.idle.items():
+                for connecter, released in idle_conns:
+                    cls.close(connecter)
+                cls.n_conns[key] -= len(idle_conns)
+            cls.idle = {}
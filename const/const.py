@@ -81,6 +81,11 @@ class Messenger:
     B_DB_OWNER_HELP = 'only if the user who is running the program is a ' \
                       'PostgreSQL superuser, this option allows him to ' \
                       'play other PostgreSQL role writting its username'
+    B_CATALOG_HELP = 'register each backup and its table of contents in ' \
+                     'the group\'s catalog, to list them and search which ' \
+                     'backup contains a table later'
+    B_NO_CATALOG_HELP = 'do not register the backups in the group\'s ' \
+                        'catalog'
     B_TERMINATE_HELP = 'terminate every connection (except yours) to each ' \
                        'database which is going to be dumped'
 
@@ -117,6 +122,22 @@ class Messenger:
     I_TIME_START_HELP = 'gives the moment when PostgreSQL was started'
     I_TIME_UP_HELP = 'gives how long PostgreSQL has been working'
 
+    REINDEXER_HELP = 'REINDEXER: rebuilds concurrently the bloated indexes ' \
+                     'of a specified group of PostgreSQL databases'
+    RX_CONFIG_HELP = 'load a configuration file (.cfg) to get the reindex ' \
+                     'conditions'
+    RX_DB_NAME_HELP = 'specify the name/s of the PostgreSQL database/s ' \
+                      'whose indexes are going to be rebuilt'
+    RX_DB_OWNER_HELP = 'only if the user who is running the program is a ' \
+                       'PostgreSQL superuser, this option allows him to ' \
+                       'play other PostgreSQL role writting its username'
+    RX_BLOAT_RATIO_HELP = 'specify the estimated ratio of bloat (between 0 ' \
+                          'and 1) from which an index is rebuilt'
+    RX_WORKERS_HELP = 'specify the maximum number of indexes rebuilt at a ' \
+                      'time in each database'
+    RX_TIME_BUDGET_HELP = 'specify the number of seconds after which no ' \
+                          'more indexes are rebuilt'
+
     REPLICATOR_HELP = 'REPLICATOR: clones the specified PostgreSQL database'
     R_CONFIG_HELP = 'load a configuration file (.cfg) to get the replicator ' \
                     'conditions'
@@ -138,6 +159,35 @@ class Messenger:
                              '(cluster) which is going to be loaded'
     RS_CLUSTER_HELP = 'specifies whether the specified path is a ' \
                       'database\'s backup or a cluster\'s backup'
+    RS_SWAP_HELP = 'restore the backup in a shadow database while the ' \
+                   'target one keeps working, and replace the target with ' \
+                   'it at the end (the old database is kept with an ' \
+                   'archive name)'
+    RS_CATALOG_HELP = 'specifies the path of a backups\' catalog and the ' \
+                      'name of the PostgreSQL database where the data is ' \
+                      'going to be restored, respectively. The latest ' \
+                      'backup which contains the specified table or schema ' \
+                      'is restored'
+    RS_TABLE_HELP = 'restore only the specified table of the backup'
+    RS_JOBS_HELP = 'specify the number of jobs used by pg_restore to ' \
+                   'restore several objects of the backup at a time (only ' \
+                   'uncompressed backups can be restored in parallel)'
+    RS_SCHEMA_HELP = 'restore only the specified schema of the backup (or ' \
+                     'restrict the table to it)'
+    RS_VERIFY_FOLDER_HELP = 'restore the latest backups of the specified ' \
+                            'folder in a throwaway local PostgreSQL ' \
+                            'cluster to check that they are restorable ' \
+                            '(the results are stored in the folder\'s ' \
+                            'manifest)'
+    RS_VERIFY_SAMPLE_HELP = 'number of databases whose latest backup is ' \
+                            'going to be verified, chosen at random (0 ' \
+                            'means all of them)'
+    RS_VERIFY_WORKERS_HELP = 'number of backups which are going to be ' \
+                             'restored at the same time during the ' \
+                             'verification'
+    RS_VERIFY_BIN_DIR_HELP = 'directory which contains the PostgreSQL ' \
+                             'binaries (initdb, pg_ctl) used to create the ' \
+                             'throwaway cluster'
 
     SCHEDULER_HELP = 'SCHEDULER: add to, remove or show some lines from the ' \
                      'program\'s CRON file, to execute it automatically'
@@ -182,9 +232,44 @@ class Messenger:
                         'conditions'
     TR_EXPIRY_DAYS_HELP = 'specify the number of days which have to be ' \
                           'elapsed to consider a backup expired'
+    TR_KEEP_DAILY_HELP = 'specify the number of days whose newest backup ' \
+                         'has to be kept (grandfather-father-son retention, ' \
+                         'replaces the expiry days)'
+    TR_KEEP_WEEKLY_HELP = 'specify the number of weeks whose newest backup ' \
+                          'has to be kept (grandfather-father-son retention)'
+    TR_KEEP_MONTHLY_HELP = 'specify the number of months whose newest ' \
+                           'backup has to be kept (grandfather-father-son ' \
+                           'retention)'
+    TR_KEEP_YEARLY_HELP = 'specify the number of years whose newest backup ' \
+                          'has to be kept (grandfather-father-son retention)'
     TR_MAX_SIZE_HELP = 'when the size of a group of a database\'s backups ' \
                        'exceeds this maximum size, a message will be shown ' \
                        'to let the user know it'
+    TR_ENFORCE_SIZE_HELP = 'when the size of a group of a database\'s ' \
+                           'backups exceeds the maximum size, remove the ' \
+                           'oldest ones until it fits (the minimum number ' \
+                           'of backups is always kept)'
+    TR_MAX_TOTAL_SIZE_HELP = 'specify the maximum size of all the trimmed ' \
+                             'databases\' backups together. The oldest ones ' \
+                             'are removed until they fit'
+    TR_NAME_DATES_HELP = 'take the age and order of the backups from the ' \
+                         'dates written in their names instead of reading ' \
+                         'their status (the result does not change after ' \
+                         'copying the backups)'
+    TR_DRY_RUN_HELP = 'do not remove any backup, only show the trim plan ' \
+                      '(the backups which would be removed) in JSON format'
+    TR_PLAN_FILE_HELP = 'write the trim plan in the specified file (JSON ' \
+                        'format) instead of the standard output'
+    TR_WORKERS_HELP = 'specify the maximum number of backups removed at a ' \
+                      'time'
+    TR_CATALOG_HELP = 'list the backups and get their sizes and dates from ' \
+                      'the catalog (synchronised incrementally with the ' \
+                      'folder) instead of scanning the whole folder'
+    TR_NO_CATALOG_HELP = 'scan the whole folder to list the backups'
+    TR_FULL_RECONCILE_HELP = 'read every subfolder and backup again to ' \
+                             'synchronise the catalog, instead of only the ' \
+                             'subfolders which changed (to notice the ' \
+                             'backups rewritten in place by other programs)'
 
     VACUUMER_HELP = 'VACUUMER: makes a vacuum of a specified group of ' \
                     'PostgreSQL databases'
@@ -195,9 +280,46 @@ class Messenger:
     V_DB_OWNER_HELP = 'only if the user who is running the program is a ' \
                       'PostgreSQL superuser, this option allows him to play ' \
                       'other PostgreSQL role writting its username'
+    V_SMART_HELP = 'vacuum only the tables whose ratio of dead tuples ' \
+                   'exceeds the threshold, instead of the whole databases'
+    V_DEAD_RATIO_HELP = 'specify the ratio of dead tuples (between 0 and 1) ' \
+                        'from which a table is vacuumed in smart mode'
+    V_WORKERS_HELP = 'specify the maximum number of databases vacuumed at ' \
+                     'a time'
+    V_JOBS_HELP = 'specify the number of connections used by vacuumdb to ' \
+                  'vacuum several tables of a database at a time'
+    V_MAX_CONNS_HELP = 'specify the maximum number of connections opened at ' \
+                       'a time by the vacuum (the databases vacuumed at a ' \
+                       'time are reduced to fit it)'
+    V_FREEZE_HELP = 'freeze (VACUUM FREEZE) only the databases and tables ' \
+                    'whose transaction id age exceeds the threshold, ' \
+                    'oldest first, to prevent the wraparound'
+    V_FREEZE_AGE_HELP = 'specify the transaction id age from which a ' \
+                        'database or table is frozen in freeze mode'
+    V_TIME_BUDGET_HELP = 'specify the number of seconds after which no more ' \
+                         'databases or tables are vacuumed'
+    V_EXECUTOR_HELP = 'specify how the whole databases are vacuumed: ' \
+                      'spawning vacuumdb or sending VACUUM statements ' \
+                      'through a connection to each database (sql)'
+    V_ANALYZE_HELP = 'update the statistics of the tables too'
+    V_PARALLEL_HELP = 'specify the number of parallel workers used to ' \
+                      'vacuum the indexes of each table (PostgreSQL 13 or ' \
+                      'later)'
+    V_SKIP_LOCKED_HELP = 'skip the tables which cannot be locked at once ' \
+                         '(PostgreSQL 12 or later)'
+    V_INDEX_CLEANUP_HELP = 'specify whether the indexes are cleaned up ' \
+                           '(PostgreSQL 12 or later, or 14 with vacuumdb; ' \
+                           '"on" needs vacuumdb 16)'
     V_TERMINATE_HELP = 'terminate every connection (except yours) to each ' \
                        'database which is going to be vacuumed'
 
+    WATCHER_HELP = 'WATCHER: keeps the catalog of a backups\' folder up to ' \
+                   'date while running, listening to the changes in the ' \
+                   'folder (Linux only)'
+    W_BKP_FOLDER_HELP = 'select the path of the folder to be watched'
+    W_HEARTBEAT_HELP = 'specify the number of seconds after which the ' \
+                       'watcher lets the rest of modules know it is alive'
+
     CONFIG_CONNECTION_HELP = 'load a configuration file (.cfg) to get the ' \
                              'PostgreSQL connection parameters'
 
@@ -242,11 +364,17 @@ class Messenger:
                           '-vpg/--version-pg | -vnpg/--version-num-pg | ' \
                           '-ts/--time-start | -tu/--time-up] must be ' \
                           'specified'
+    REINDEXER_ARGS_ERROR = 'insufficient parameters to work - [-C/--config ' \
+                           '| -d/--db-name] must be specified'
     REPLICATOR_ARGS_ERROR = 'insufficient parameters to work - ' \
                             '[-C/--config | -d/--db-name] must be specified'
     RESTORER_ARGS_ERROR = 'insufficient parameters to work - [-C/--config | ' \
                           '-d/--db-backup | (-c/--cluster & ' \
-                          '-p/--cluster-backup)] must be specified'
+                          '-p/--cluster-backup) | -k/--catalog | ' \
+                          '-vf/--verify-folder] must be specified'
+    RESTORER_CATALOG_ARGS_ERROR = 'insufficient parameters to work - ' \
+                                  '[-t/--table | -n/--schema] must be ' \
+                                  'specified along with -k/--catalog'
     SCHEDULER_ARGS_ERROR_1 = 'argument -a/--add: not allowed with argument ' \
                              '-rC/--remove-config'
     SCHEDULER_ARGS_ERROR_2 = 'argument -r/--remove: not allowed with ' \
@@ -258,12 +386,16 @@ class Messenger:
                            '| (-f/--bkp-folder & (-d/--db-name | ' \
                            '-c/--cluster))] must be specified'
     TRIMMER_ARGS_ERROR_2 = 'insufficient parameters to work - ' \
-                           '[-n/--n-backups & -e/--expiry-days] must be ' \
-                           'specified'
+                           '[-n/--n-backups & (-e/--expiry-days | ' \
+                           '-gd/--keep-daily | -gw/--keep-weekly | ' \
+                           '-gm/--keep-monthly | -gy/--keep-yearly)] must ' \
+                           'be specified'
     TRIMMER_CONNECTION_ARGS_ERROR = 'connection parameters no needed to ' \
                                     'work with clusters\' trimmer'
     VACUUMER_ARGS_ERROR = 'insufficient parameters to work - [-C/--config ' \
                           '| -d/--db-name] must be specified'
+    WATCHER_ARGS_ERROR = 'insufficient parameters to work - ' \
+                         '[-f/--bkp-folder] must be specified'
     CONNECTION_ARGS_ERROR = 'insufficient connection parameters to work - ' \
                             '[-cC/--config-connection | (-ch/--host & ' \
                             '-cp/--port & -cu/--user)] must be specified'
@@ -273,16 +405,20 @@ class Messenger:
     BEGINNING_EXE_CL_BACKER = 'INICIANDO EJECUCIÓN DE BACKER (CLÚSTER)'
     BEGINNING_EXE_DROPPER = 'INICIANDO EJECUCIÓN DE DROPPER'
     BEGINNING_EXE_INFORMER = 'INICIANDO EJECUCIÓN DE INFORMER'
+    BEGINNING_EXE_REINDEXER = 'INICIANDO EJECUCIÓN DE REINDEXER'
     BEGINNING_EXE_REPLICATOR = 'INICIANDO EJECUCIÓN DE REPLICATOR'
     BEGINNING_EXE_DB_RESTORER = 'INICIANDO EJECUCIÓN DE RESTORER (BASES DE ' \
                                 'DATOS)'
     BEGINNING_EXE_CL_RESTORER = 'INICIANDO EJECUCIÓN DE RESTORER (CLÚSTER)'
+    BEGINNING_EXE_VERIFIER = 'INICIANDO EJECUCIÓN DE RESTORER ' \
+                             '(VERIFICACIÓN DE COPIAS)'
     BEGINNING_EXE_TERMINATOR = 'INICIANDO EJECUCIÓN DE TERMINATOR'
     BEGINNING_EXE_DB_TRIMMER = 'INICIANDO EJECUCIÓN DE TRIMMER (BASES DE ' \
                                'DATOS)'
     BEGINNING_EXE_CL_TRIMMER = 'INICIANDO EJECUCIÓN DE TRIMMER (CLÚSTER)'
     BEGINNING_EXE_SCHEDULER = 'INICIANDO EJECUCIÓN DE SCHEDULER'
     BEGINNING_EXE_VACUUMER = 'INICIANDO EJECUCIÓN DE VACUUMER'
+    BEGINNING_EXE_WATCHER = 'INICIANDO EJECUCIÓN DE WATCHER'
 
     ACTIVE_CONNS_ERROR = 'No se pudo completar la operación, ya que hay ' \
                          'procesos en curso usando la base de datos ' \
@@ -300,24 +436,38 @@ class Messenger:
                      '{bkp_type}, PREFIX: {prefix}, IN_DBS: {in_dbs}, ' \
                      'IN_REGEX: {in_regex}, IN_PRIORITY: {in_priority}, ' \
                      'EX_DBS: {ex_dbs}, EX_REGEX: {ex_regex}, EX_TEMPLATES: ' \
-                     '{ex_templates}, VACUUM: {vacuum}, DB_OWNER: {db_owner}.'
+                     '{ex_templates}, VACUUM: {vacuum}, DB_OWNER: ' \
+                     '{db_owner}, CATALOG: {catalog}.'
     CL_BACKER_VARS_INTRO = 'VARIABLES DE BACKER (CLÚSTER):'
     CL_BACKER_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
                      'BKP_PATH: {bkp_path}, GROUP: {group}, BKP_TYPE: ' \
-                     '{bkp_type}, PREFIX: {prefix}, VACUUM: {vacuum}.'
+                     '{bkp_type}, PREFIX: {prefix}, VACUUM: {vacuum}, ' \
+                     'CATALOG: {catalog}.'
     DROPPER_VARS_INTRO = 'VARIABLES DE DROPPER:'
     DROPPER_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
                    'DBNAMES: {dbnames}.'
+    REINDEXER_VARS_INTRO = 'VARIABLES DE REINDEXER:'
+    REINDEXER_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
+                     'IN_DBS: {in_dbs}, IN_REGEX: {in_regex}, IN_PRIORITY: ' \
+                     '{in_priority}, EX_DBS: {ex_dbs}, EX_REGEX: ' \
+                     '{ex_regex}, EX_TEMPLATES: {ex_templates}, DB_OWNER: ' \
+                     '{db_owner}, BLOAT_RATIO: {bloat_ratio}, WORKERS: ' \
+                     '{workers}, TIME_BUDGET: {time_budget}.'
     REPLICATOR_VARS_INTRO = 'VARIABLES DE REPLICATOR:'
     REPLICATOR_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
                       'ORIGINAL_DBNAME: {original_dbname}, NEW_DBNAME: ' \
                       '{new_dbname}.'
     DB_RESTORER_VARS_INTRO = 'VARIABLES DE RESTORER (BASE DE DATOS):'
     DB_RESTORER_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
-                       'DB_BACKUP: {db_backup}, NEW_DBNAME: {new_dbname}.'
+                       'DB_BACKUP: {db_backup}, NEW_DBNAME: {new_dbname}, ' \
+                       'SWAP: {swap}, TABLE: {table}, SCHEMA: {schema}, ' \
+                       'JOBS: {jobs}.'
     CL_RESTORER_VARS_INTRO = 'VARIABLES DE RESTORER (CLÚSTER):'
     CL_RESTORER_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
                        'DB_BACKUP: {db_backup}, NEW_DBNAME: {new_dbname}.'
+    VERIFIER_VARS_INTRO = 'VARIABLES DE RESTORER (VERIFICACIÓN DE COPIAS):'
+    VERIFIER_VARS = 'BKP_PATH: {bkp_path}, SAMPLE: {sample}, WORKERS: ' \
+                    '{workers}, PG_BIN_DIR: {pg_bin_dir}.'
     TERMINATOR_VARS_INTRO = 'VARIABLES DE TERMINATOR:'
     TERMINATOR_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
                       'TARGET_ALL: {target_all}, TARGET_USER: ' \
@@ -328,16 +478,38 @@ class Messenger:
                       '{in_priority}, EX_DBS: {ex_dbs}, EX_REGEX: ' \
                       '{ex_regex},  MIN_N_BKPS: {min_n_bkps}, EXP_DAYS: ' \
                       '{exp_days}, MAX_SIZE: {max_size}, PG_WARNINGS: ' \
-                      '{pg_warnings}.'
+                      '{pg_warnings}, CATALOG: {catalog}, FULL_RECONCILE: ' \
+                      '{full_reconcile}, KEEP_DAILY: {keep_daily}, ' \
+                      'KEEP_WEEKLY: {keep_weekly}, ' \
+                      'KEEP_MONTHLY: {keep_monthly}, KEEP_YEARLY: ' \
+                      '{keep_yearly}, ENFORCE_SIZE: {enforce_size}, ' \
+                      'MAX_TOTAL_SIZE: {max_total_size}, NAME_DATES: ' \
+                      '{name_dates}, DRY_RUN: {dry_run}, PLAN_FILE: ' \
+                      '{plan_file}, WORKERS: {workers}.'
     CL_TRIMMER_VARS_INTRO = 'VARIABLES DE TRIMMER (CLÚSTER):'
     CL_TRIMMER_VARS = 'BKP_PATH: {bkp_path}, PREFIX: {prefix}, MIN_N_BKPS: ' \
                       '{min_n_bkps}, EXP_DAYS: {exp_days}, MAX_SIZE: ' \
-                      '{max_size}, PG_WARNINGS: {pg_warnings}.'
+                      '{max_size}, CATALOG: {catalog}, FULL_RECONCILE: ' \
+                      '{full_reconcile}, KEEP_DAILY: {keep_daily}, ' \
+                      'KEEP_WEEKLY: {keep_weekly}, ' \
+                      'KEEP_MONTHLY: {keep_monthly}, KEEP_YEARLY: ' \
+                      '{keep_yearly}, ENFORCE_SIZE: {enforce_size}, ' \
+                      'NAME_DATES: {name_dates}, DRY_RUN: {dry_run}, ' \
+                      'PLAN_FILE: {plan_file}, WORKERS: {workers}.'
     VACUUMER_VARS_INTRO = 'VARIABLES DE VACUUMER:'
     VACUUMER_VARS = 'SERVER: {server}, USER: {user}, PORT: {port}, ' \
                     'IN_DBS: {in_dbs}, IN_REGEX: {in_regex}, IN_PRIORITY: ' \
                     '{in_priority}, EX_DBS: {ex_dbs}, EX_REGEX: {ex_regex}, ' \
-                    'EX_TEMPLATES: {ex_templates}, DB_OWNER: {db_owner}.'
+                    'EX_TEMPLATES: {ex_templates}, DB_OWNER: {db_owner}, ' \
+                    'SMART: {smart}, DEAD_RATIO: {dead_ratio}, WORKERS: ' \
+                    '{workers}, JOBS: {jobs}, MAX_CONNS: {max_conns}, ' \
+                    'FREEZE: {freeze}, FREEZE_AGE: {freeze_age}, ' \
+                    'TIME_BUDGET: {time_budget}, EXECUTOR: {executor}, ' \
+                    'ANALYZE: {analyze}, PARALLEL: {parallel}, ' \
+                    'SKIP_LOCKED: {skip_locked}, INDEX_CLEANUP: ' \
+                    '{index_cleanup}, PROFILES: {profiles}.'
+    WATCHER_VARS_INTRO = 'VARIABLES DE WATCHER:'
+    WATCHER_VARS = 'BKP_PATH: {bkp_path}, HEARTBEAT: {heartbeat}.'
 
     ACTION_DB_NO_SUPERUSER = 'El usuario especificado para la conexión a ' \
                              'PostgreSQL no tiene rol de superusuario: sólo ' \
@@ -379,14 +551,19 @@ class Messenger:
     ALTERER_DONE = 'Fin del proceso Alterer.'
     BEGINNING_DB_TRIMMER = 'Iniciando limpieza de copias de seguridad de la ' \
                            'base de datos "{dbname}"...'
-    DELETING_OBSOLETE_BACKUP = 'Copia de seguridad obsoleta: eliminando el ' \
-                               'archivo "%s"...'
+    GFS_BACKUP_PLANNED = 'Copia de seguridad fuera de la política de ' \
+                         'retención: se eliminará el archivo "%s".'
+    OBSOLETE_BACKUP_PLANNED = 'Copia de seguridad obsoleta: se eliminará el ' \
+                              'archivo "%s".'
     NO_DB_BACKUP_DELETED = 'No se ha eliminado ninguna copia de la base de ' \
                            'datos "{dbname}".'
     DB_BKPS_SIZE_EXCEEDED = 'El tamaño del total de copias de seguridad en ' \
                             'disco de la base de datos {dbname} es de ' \
                             '{tsize_unit} {unit}, que es mayor que el ' \
                             'máximo especificado ({size} {unit}).'
+    OVERSIZED_BACKUP_PLANNED = 'Tamaño de copias de seguridad en disco ' \
+                               'mayor que el máximo especificado: se ' \
+                               'eliminará el archivo "%s".'
     DB_TRIMMER_DONE = 'Limpieza de copias de seguridad de la base de ' \
                       'datos "{dbname}" completada (Duración del proceso: ' \
                       '{diff}).'
@@ -400,6 +577,19 @@ class Messenger:
                             '({size} {unit}).'
     CL_TRIMMER_DONE = 'Limpieza de copias de seguridad del clúster del ' \
                       'servidor completada (Duración del proceso: {diff}).'
+    TRIM_DRY_RUN = 'Simulación: no se ha eliminado ningún archivo ' \
+                   '({n_bkps} copias de seguridad se eliminarían).'
+    APPLYING_TRIM_PLAN = 'Eliminando {n_bkps} copias de seguridad ' \
+                         '({workers} a la vez)...'
+    TRIM_REMOVE_FAIL = 'No se ha podido eliminar el archivo "%s".'
+    TRIM_REMOVE_DONE = 'Eliminado el archivo "%s".'
+    TRIM_PLAN_WRITTEN = 'Plan de limpieza guardado en "{plan_file}".'
+    TRIM_PLAN_FAIL = 'No se ha podido guardar el plan de limpieza en ' \
+                     '"{plan_file}".'
+    TOTAL_BKPS_SIZE_EXCEEDED = 'El tamaño del total de copias de seguridad ' \
+                               'en disco es de {tsize_unit} {unit}, que es ' \
+                               'mayor que la capacidad máxima especificada ' \
+                               '({size} {unit}).'
     TRIMMER_DONE = 'Fin del proceso Trimmer.'
     NO_CONNECTION_PARAMS = 'No se han especificado todos los parámetros ' \
                            'necesarios para la conexión a PostgreSQL.'
@@ -420,6 +610,8 @@ class Messenger:
                           '"{dbname}"...'
     DB_BACKER_DONE = 'Copia de seguridad de la base de datos "{dbname}" ' \
                      'completada (Duración del proceso: {diff}).'
+    CATALOG_TOC_FAIL = 'No fue posible guardar en el catálogo el índice de ' \
+                       'la copia de seguridad "{bkp_path}".'
     DB_BACKER_FAIL = 'La copia de seguridad de la base de datos "{dbname}" ' \
                      'no se pudo completar.'
     BACKER_DONE = 'Fin del proceso Backer.'
@@ -436,11 +628,60 @@ class Messenger:
                        '(Duración del proceso: {diff}).'
     DB_VACUUMER_FAIL = 'La limpieza de la base de datos "{dbname}" no se ' \
                        'pudo completar.'
+    VACUUMING_TABLE = 'Limpiando la tabla {table_name} (tuplas muertas: ' \
+                      '{n_dead_tup}, ratio: {ratio:.2f}, último ' \
+                      'autovacuum: {last_autovacuum})...'
+    TABLE_VACUUMER_FAIL = 'La limpieza de la tabla {table_name} no se pudo ' \
+                          'completar.'
+    SMART_VACUUMER_DONE = 'Base de datos "{dbname}": tablas limpiadas: ' \
+                          '{n_vacuumed}, tablas omitidas: {n_skipped} ' \
+                          '(tiempo ahorrado estimado frente a la limpieza ' \
+                          'completa: {saved}).'
+    TABLE_VACUUMER_DONE = 'Limpieza de la tabla {table_name} completada ' \
+                          '({seconds:.2f} s).'
+    SQL_VACUUMER_DONE = 'Base de datos "{dbname}": tablas limpiadas: ' \
+                        '{n_vacuumed} de {n_tables} (la más lenta: ' \
+                        '{table_name}, {seconds:.2f} s).'
+    FREEZING_TABLE = 'Congelando la tabla {table_name} (edad: {xid_age})...'
+    FREEZE_VACUUMER_DONE = 'Base de datos "{dbname}": tablas congeladas: ' \
+                           '{n_frozen}, tablas pendientes: {n_pending}.'
+    DB_XID_AGE = 'Edad de la base de datos "{dbname}": {xid_age}.'
+    GET_XID_AGE_FAIL = 'No fue posible obtener la edad de las bases de ' \
+                       'datos.'
+    TIME_BUDGET_EXHAUSTED = 'Tiempo disponible agotado: la base de datos ' \
+                            '"{dbname}" no se procesará.'
+    BEGINNING_REINDEXER = 'Iniciando reconstrucción de índices...'
+    REINDEXER_DONE = 'Fin del proceso Reindexer.'
+    REINDEXING_INDEX = 'Reconstruyendo el índice {index_name} (tamaño: ' \
+                       '{size} bytes, hinchazón estimada: {ratio:.2f})...'
+    INDEX_REINDEXER_FAIL = 'La reconstrucción del índice {index_name} no se ' \
+                           'pudo completar.'
+    INVALID_INDEX_DROPPED = 'Eliminado el índice inválido {index_name} que ' \
+                            'dejó la reconstrucción fallida.'
+    INVALID_INDEX_DROP_FAIL = 'No se ha podido eliminar el índice inválido ' \
+                              '{index_name} que dejó la reconstrucción ' \
+                              'fallida: debe eliminarse manualmente.'
+    DB_REINDEXER_DONE = 'Base de datos "{dbname}": índices reconstruidos: ' \
+                        '{n_reindexed} de {n_bloated} (espacio recuperado: ' \
+                        '{reclaimed} MB).'
+    DB_REINDEXER_FAIL = 'La reconstrucción de índices de la base de datos ' \
+                        '"{dbname}" no se pudo completar.'
+    VACUUM_PROFILE_APPLIED = 'Aplicando el perfil de limpieza "{name}" ' \
+                             '(VACUUM_COST_DELAY: {cost_delay}, ' \
+                             'VACUUM_COST_LIMIT: {cost_limit}, PARALLEL: ' \
+                             '{parallel}, WORKERS: {workers}).'
+    VACUUM_PROFILE_FAIL = 'No fue posible aplicar el perfil de limpieza ' \
+                          '"{name}" en la base de datos "{dbname}".'
+    VACUUM_CONNS_CAPPED = 'Se limpiarán {workers} bases de datos a la vez ' \
+                          'con {jobs} conexión/es cada una para no superar ' \
+                          'el máximo de {max_conns} conexiones.'
     TERMINATE_USER_CONN_DONE = 'Conexiones del usuario "{target_user}" a ' \
                                'PostgreSQL terminadas.'
     TERMINATE_DB_CONN_DONE = 'Conexiones a la base de datos ' \
                              '"{target_dbname}" terminadas.'
     TERMINATE_ALL_CONN_DONE = 'Conexiones a PostgreSQL terminadas.'
+    N_TERMINATED_CONNS = 'Terminadas {n_terminated} de {n_matched} ' \
+                         'conexiones.'
     TERMINATOR_DONE = 'Fin del proceso Terminator.'
     TERMINATE_USER_CONN_FAIL = 'No fue posible terminar las conexiones del ' \
                                'usuario "{target_user}" a PostgreSQL.'
@@ -544,6 +785,16 @@ class Messenger:
     NO_PG_TIME_UP_TO_SHOW = 'No hay información acerca del tiempo que ' \
                             'lleva PostgreSQL en marcha.'
 
+    READING_FROM_STANDBY = 'Las consultas de lectura se harán en el ' \
+                           'servidor en espera "{server}:{port}" (retraso ' \
+                           'de {lag} segundos).'
+    STANDBY_DISCARDED = 'No se usará el servidor en espera ' \
+                        '"{server}:{port}": no está disponible, no es un ' \
+                        'servidor en espera o su retraso supera los ' \
+                        '{max_lag} segundos.'
+    NO_STANDBY_AVAILABLE = 'No hay ningún servidor en espera disponible, ' \
+                           'las consultas de lectura se harán en el ' \
+                           'servidor principal.'
     CONNECT_FAIL = 'Se produjo un error al realizar la conexión a ' \
                    'PostgreSQL. Por favor, revise que el servidor, puerto y ' \
                    'usuario especificados sean correctos.'
@@ -559,6 +810,10 @@ class Messenger:
                      'la base de datos "{dbname}" de PostgreSQL.'
     GET_PG_DBS_DATA = 'Ha ocurrido un problema al recuperar información de ' \
                       'las bases de datos en PostgreSQL.'
+    GET_PG_USERS_DATA = 'Ha ocurrido un problema al recuperar información ' \
+                        'de los usuarios de PostgreSQL.'
+    GET_PG_CONNS_DATA = 'Ha ocurrido un problema al recuperar información ' \
+                        'de los procesos conectados a PostgreSQL.'
     GET_PG_USER_DATA = 'Ha ocurrido un problema al recuperar información ' \
                        'del usuario "{username}" de PostgreSQL.'
     GET_PG_CONN_DATA = 'Ha ocurrido un problema al recuperar información ' \
@@ -606,6 +861,40 @@ class Messenger:
     RESTORE_DB_FAIL = 'No fue posible restaurar la copia "{db_backup}" ' \
                       'especificada de PostgreSQL con el nombre ' \
                       '"{new_dbname}".'
+    BEGINNING_DB_SWAP_RESTORER = 'Restaurando la copia "{db_backup}" en ' \
+                                 'la base de datos temporal ' \
+                                 '"{shadow_dbname}"...'
+    SWAPPING_DBS = 'Reemplazando la base de datos "{new_dbname}" por la ' \
+                   'copia restaurada...'
+    SWAP_DB_DONE = 'Reemplazada con éxito la base de datos "{new_dbname}" ' \
+                   'por la copia restaurada. La base de datos anterior se ' \
+                   'conserva con el nombre "{archive_dbname}" (Duración del ' \
+                   'corte: {diff}).'
+    SWAP_DB_FAIL = 'No fue posible reemplazar la base de datos ' \
+                   '"{new_dbname}": la copia restaurada se conserva con el ' \
+                   'nombre "{shadow_dbname}".'
+    NO_BKP_IN_CATALOG = 'No se ha encontrado en el catálogo ninguna copia ' \
+                        'de seguridad que contenga la tabla "{table}" del ' \
+                        'esquema "{schema}".'
+    NO_BKPS_DIR_TO_VERIFY = 'El directorio especificado que contiene las ' \
+                            'copias a verificar no existe.'
+    NO_BKPS_TO_VERIFY = 'No se han encontrado copias de seguridad que ' \
+                        'verificar en "{bkp_path}".'
+    STARTING_EPHEMERAL_CLUSTER = 'Iniciando un clúster temporal de ' \
+                                 'PostgreSQL en "{tmp_dir}" (puerto ' \
+                                 '{port})...'
+    EPHEMERAL_CLUSTER_FAIL = 'No fue posible iniciar el clúster temporal de ' \
+                             'PostgreSQL.'
+    VERIFYING_BKPS = 'Verificando {n_bkps} copias de seguridad...'
+    VERIFY_BKP_DONE = 'Verificada con éxito la copia "{db_backup}": ' \
+                      '{n_tables} tablas, {n_rows} filas estimadas ' \
+                      '({throughput} MB/s, duración del proceso: ' \
+                      '{duration} s).'
+    VERIFY_BKP_FAIL = 'La copia "{db_backup}" no superó la verificación.'
+    VERIFY_MANIFEST_FAIL = 'No fue posible guardar los resultados de la ' \
+                           'verificación en "{manifest}".'
+    VERIFIER_DONE = 'Fin del proceso de verificación: {n_passed} copias ' \
+                    'correctas, {n_failed} fallidas.'
     BEGINNING_CL_RESTORER = 'Restaurando la copia "{cluster_backup}"...'
     RESTORE_CL_DONE = 'Restaurada con éxito la copia "{cluster_backup}" en ' \
                       'PostgreSQL (Duración del proceso: {diff}).'
@@ -630,6 +919,81 @@ class Messenger:
     INVALID_VACUUM = 'El valor de la variable para determinar si se realiza ' \
                      'una limpieza de bases de datos previa a la operación ' \
                      'es incorrecto.'
+    INVALID_SMART = 'El valor de la variable para determinar si sólo se ' \
+                    'limpian las tablas con tuplas muertas es incorrecto.'
+    INVALID_DEAD_RATIO = 'El ratio de tuplas muertas a partir del cual se ' \
+                         'limpia una tabla es incorrecto.'
+    INVALID_VACUUM_WORKERS = 'El número de bases de datos a limpiar a la ' \
+                             'vez es incorrecto.'
+    INVALID_VACUUM_JOBS = 'El número de conexiones a usar en la limpieza ' \
+                          'de cada base de datos es incorrecto.'
+    INVALID_VACUUM_MAX_CONNS = 'El número máximo de conexiones a usar en la ' \
+                               'limpieza es incorrecto.'
+    INVALID_FREEZE = 'El valor de la variable para determinar si se ' \
+                     'congelan las tablas más antiguas es incorrecto.'
+    INVALID_FREEZE_AGE = 'La edad a partir de la cual se congela una base ' \
+                         'de datos o tabla es incorrecta.'
+    INVALID_TIME_BUDGET = 'El tiempo disponible para la limpieza es ' \
+                          'incorrecto.'
+    INVALID_VACUUM_EXECUTOR = 'La herramienta establecida para limpiar las ' \
+                              'bases de datos es incorrecta.'
+    INVALID_VACUUM_ANALYZE = 'El valor de la variable para determinar si ' \
+                             'se analizan las tablas durante la limpieza es ' \
+                             'incorrecto.'
+    INVALID_VACUUM_PARALLEL = 'El número de procesos para limpiar los ' \
+                              'índices de cada tabla es incorrecto.'
+    INVALID_SKIP_LOCKED = 'El valor de la variable para determinar si se ' \
+                          'omiten las tablas bloqueadas es incorrecto.'
+    INVALID_INDEX_CLEANUP = 'El valor de la variable para determinar si se ' \
+                            'limpian los índices es incorrecto.'
+    INVALID_BLOAT_RATIO = 'El ratio de hinchazón a partir del cual se ' \
+                          'reconstruye un índice es incorrecto.'
+    INVALID_REINDEX_WORKERS = 'El número de índices a reconstruir a la vez ' \
+                              'es incorrecto.'
+    INVALID_POOL_MAX_SIZE = 'El número máximo de conexiones de la reserva ' \
+                            'es incorrecto.'
+    INVALID_POOL_IDLE_TIMEOUT = 'El tiempo tras el cual se cierra una ' \
+                                'conexión de la reserva sin usar es ' \
+                                'incorrecto.'
+    INVALID_POOL_MAX_TOTAL = 'El número máximo de conexiones abiertas a la ' \
+                             'vez es incorrecto.'
+    INVALID_ITERSIZE = 'El número de filas a recuperar a la vez de un ' \
+                       'cursor es incorrecto.'
+    INVALID_STANDBYS = 'La lista de servidores en espera es incorrecta.'
+    INVALID_MAX_LAG = 'El retraso máximo de un servidor en espera es ' \
+                      'incorrecto.'
+    INVALID_DBS_TTL = 'El tiempo durante el cual es válida la lista de ' \
+                      'bases de datos consultada es incorrecto.'
+    INVALID_VACUUM_PROFILE = 'Los parámetros del perfil de limpieza ' \
+                             '"{name}" son incorrectos.'
+    INVALID_SWAP = 'El valor de la variable para determinar si se restaura ' \
+                   'la copia en una base de datos temporal que reemplace a ' \
+                   'la de destino es incorrecto.'
+    INVALID_SELECTIVE_SWAP = 'No es posible restaurar solo una tabla o un ' \
+                             'esquema en una base de datos temporal que ' \
+                             'reemplace a la de destino.'
+    INVALID_RESTORE_JOBS = 'El número de procesos a usar en la ' \
+                           'restauración es incorrecto.'
+    INVALID_CATALOG = 'El valor de la variable para determinar si se ' \
+                      'guarda el índice de las copias en el catálogo es ' \
+                      'incorrecto.'
+    INVALID_FULL_RECONCILE = 'El valor de la variable para determinar si se ' \
+                             'vuelve a leer todo el directorio al ' \
+                             'sincronizar el catálogo es incorrecto.'
+    INVALID_GFS_KEEP = 'El número de copias de seguridad diarias, ' \
+                       'semanales, mensuales o anuales a conservar es ' \
+                       'incorrecto.'
+    CATALOG_SYNC_FAIL = 'No fue posible sincronizar el catálogo de copias ' \
+                        'de seguridad: se recorrerá el directorio.'
+    CATALOG_BKP_FAIL = 'No fue posible registrar en el catálogo la copia ' \
+                       'de seguridad "{bkp_path}".'
+    CATALOG_OPEN_FAIL = 'No fue posible abrir el catálogo de copias de ' \
+                        'seguridad "{path}".'
+    INVALID_VERIFY_SAMPLE = 'El número de copias de seguridad a verificar ' \
+                            'es incorrecto.'
+    INVALID_VERIFY_WORKERS = 'El número de copias de seguridad a restaurar ' \
+                             'a la vez durante la verificación es ' \
+                             'incorrecto.'
     INVALID_BKP_TYPE = 'El formato de copia de seguridad establecido es ' \
                        'incorrecto.'
     INVALID_MIN_BKPS = 'El número mínimo establecido de copias de seguridad ' \
@@ -640,6 +1004,18 @@ class Messenger:
     INVALID_MAX_TSIZE = 'El tamaño máximo total establecido del conjunto de ' \
                         'copias de seguridad de un determinado elemento es ' \
                         'incorrecto.'
+    INVALID_DRY_RUN = 'El valor de la variable para determinar si sólo se ' \
+                      'simula la limpieza es incorrecto.'
+    INVALID_ENFORCE_SIZE = 'El valor de la variable para determinar si se ' \
+                           'eliminan las copias más antiguas al superar el ' \
+                           'tamaño máximo es incorrecto.'
+    INVALID_MAX_TOTAL_SIZE = 'La capacidad máxima establecida para el total ' \
+                             'de copias de seguridad es incorrecta.'
+    INVALID_NAME_DATES = 'El valor de la variable para determinar si se ' \
+                         'toman las fechas de las copias de sus nombres es ' \
+                         'incorrecto.'
+    INVALID_TRIM_WORKERS = 'El número de copias de seguridad a eliminar a ' \
+                           'la vez es incorrecto.'
     INVALID_PG_WARNINGS = 'El valor de la variable para activar mensajes ' \
                           'de aviso de PostgreSQL es incorrecto.'
     INVALID_TARGET_ALL = 'El valor de la variable para terminar todas las ' \
@@ -717,6 +1093,11 @@ class Messenger:
                              'seguridad de clústers de PostgreSQL está ' \
                              'dañado. Por favor, revise que los nombres por ' \
                              'defecto de secciones y atributos son correctos.'
+    REINDEXER_CFG_DAMAGED = 'El archivo de configuración con las ' \
+                            'condiciones para la reconstrucción de índices ' \
+                            'en PostgreSQL está dañado. Por favor, revise ' \
+                            'que los nombres por defecto de secciones y ' \
+                            'atributos son correctos.'
     VACUUMER_CFG_DAMAGED = 'El archivo de configuración con las ' \
                            'condiciones para la limpieza de bases de datos ' \
                            'en PostgreSQL está dañado. Por favor, revise ' \
@@ -825,6 +1206,21 @@ class Messenger:
                             'archivo crontab del usuario.'
     SCHEDULER_DONE = 'Fin del proceso Scheduler.'
 
+    INVALID_HEARTBEAT = 'El intervalo de aviso del watcher es incorrecto.'
+    WATCHER_NOT_SUPPORTED = 'No fue posible vigilar el directorio: inotify ' \
+                            'no está disponible en este sistema.'
+    ASYNC_NOT_SUPPORTED = 'No fue posible usar conexiones asíncronas: el ' \
+                          'paquete psycopg (versión 3) no está instalado.'
+    WATCH_DIR_FAIL = 'No fue posible vigilar el directorio "{dirname}".'
+    WATCHER_SYNC_FAIL = 'No fue posible sincronizar el catálogo de copias ' \
+                        'de seguridad con el directorio.'
+    WATCHING_DIR = 'Vigilando el directorio "{bkp_path}"...'
+    WATCHER_OVERFLOW = 'Se han perdido cambios del directorio: ' \
+                       'sincronizando el catálogo...'
+    WATCHER_BKP_ADDED = 'Nueva copia de seguridad registrada: "%s".'
+    WATCHER_BKP_REMOVED = 'Copia de seguridad eliminada del catálogo: "%s".'
+    WATCHER_DONE = 'Fin del proceso Watcher.'
+
     ALLOW_CONN_TO_PG_DB_FAIL = 'No fue posible reestablecer los permisos de ' \
                                'conexión a la base de datos "{dbname}". Las ' \
                                'conexiones están inhabilitadas hasta cambio ' \
@@ -842,19 +1238,30 @@ class Messenger:
 
 class Default:
 
-    ARGV1_CHOICES = ['a', 'B', 'd', 'i', 'r', 'R', 't', 'T', 'v']
+    ARGV1_CHOICES = ['a', 'B', 'd', 'i', 'r', 'R', 't', 'T', 'v', 'w', 'x']
+    ASYNC_LIMIT = 10
     BKP_PATH = '/opt/backups/pg_backups/'
+    BLOAT_RATIO = 0.3
     BKP_TYPE = 'dump'
     BKP_TYPES = ['dump', 'gz', 'bz2', 'zip']
+    CATALOG = False
+    CATALOG_FILE = 'catalog.sqlite'
     DB_BKPS_DIR = '/db_backups/'
     DB_OWNER = ''
+    DEAD_RATIO = 0.2
+    DRY_RUN = False
     CL_BKPS_DIR = '/cl_backups/'
     CONNECTION_DATABASE = 'postgres'
     EX_DBS = []
     EX_REGEX = ''
+    FULL_RECONCILE = False
     EX_TEMPLATES = True
+    ENFORCE_SIZE = False
     EXP_DAYS = 365
+    FREEZE = False
+    FREEZE_AGE = 150000000
     # EXT_IP_WEB = 'http://www.trackip.net/ip'
+    GFS_KEEP = 0
     GROUP = 'default_group'
     IN_DBS = []
     IN_REGEX = ''
@@ -864,14 +1271,47 @@ class Default:
     LOG_LEVELS = ['debug', 'info', 'warning', 'error', 'critical']
     MAIL_LEVEL = 1
     MAIL_LEVELS = [0, 1, 2, 3]
+    MAX_LAG = 30  # Seconds
     MAX_SIZE = '10000MB'
+    MAX_TOTAL_SIZE = ''
     MIN_N_BKPS = 1
     MUTE = False
+    NAME_DATES = False
+    PG_BIN_DIR = ''
+    PG_IDENTIFIER_MAX_LEN = 63
+    PLAN_FILE = ''
+    POOL_IDLE_TIMEOUT = 300  # Seconds
+    POOL_MAX_SIZE = 10
+    POOL_MAX_TOTAL = 20
     PREFIX = ''
+    REINDEX_MIN_SIZE = 1048576  # Bytes
+    REINDEX_WORKERS = 2
+    RESTORE_JOBS = 1
     RESTORING_TEMPLATE = 'template0'
+    SCAN_WORKERS = 8
+    SMART_VACUUM = False
+    SWAP = False
+    TIME_BUDGET = 0
+    TRIM_WORKERS = 4
     VACUUM = True
+    VACUUM_ANALYZE = False
+    VACUUM_EXECUTOR = 'vacuumdb'
+    VACUUM_EXECUTORS = ['vacuumdb', 'sql']
+    VACUUM_INDEX_CLEANUP = 'auto'
+    VACUUM_INDEX_CLEANUPS = ['auto', 'on', 'off']
+    VACUUM_JOBS = 1
+    VACUUM_MAX_CONNS = 0
+    VACUUM_PARALLEL = 0
+    VACUUM_SKIP_LOCKED = False
+    VACUUM_WORKERS = 1
     VALID_BOOLS = ['True', 'true', 'False', 'false']
     VALID_EXP_DAYS = [-1, int]
+    VERIFY_MANIFEST = 'restore_manifest.json'
+    VERIFY_RESTORE_OPTIONS = '--no-owner --no-privileges'
+    VERIFY_SAMPLE = 0
+    VERIFY_TMP_PREFIX = 'py_pg_tools_verify_'
+    VERIFY_WORKERS = 2
+    WATCHER_HEARTBEAT = 60
 
     def __init__(self):
         pass
@@ -884,22 +1324,126 @@ class Queries:
         'SET datallowconn = TRUE '
         'WHERE datname = (%s);'
     )
-    BACKEND_PG_ALL_EXISTS = (
-        "SELECT 1 "
-        "FROM pg_stat_activity "
-        "WHERE {pg_pid} <> pg_backend_pid();"
+    ANALYZE_PG_DB = (
+        'ANALYZE;'
     )
     BACKEND_PG_DB_EXISTS = (
         "SELECT 1 "
         "FROM pg_stat_activity "
-        "WHERE datname = '{target_db}' "
+        "WHERE datname = (%s) "
         "AND {pg_pid} <> pg_backend_pid();"
     )
-    BACKEND_PG_USER_EXISTS = (
-        "SELECT 1 "
-        "FROM pg_stat_activity "
-        "WHERE usename = '{target_user}' "
-        "AND usename <> CURRENT_USER;"
+    CATALOG_CREATE_TOC = (
+        'CREATE TABLE IF NOT EXISTS toc ('
+        'bkp_path TEXT NOT NULL, '
+        'dbname TEXT NOT NULL, '
+        'bkp_date TEXT NOT NULL, '
+        'obj_type TEXT NOT NULL, '
+        'schema_name TEXT NOT NULL, '
+        'obj_name TEXT NOT NULL); '
+        'CREATE INDEX IF NOT EXISTS toc_obj_idx '
+        'ON toc (obj_name, obj_type); '
+        'CREATE INDEX IF NOT EXISTS toc_bkp_idx '
+        'ON toc (bkp_path);'
+    )
+    CATALOG_CREATE_BKPS = (
+        'CREATE TABLE IF NOT EXISTS backups ('
+        'bkp_path TEXT PRIMARY KEY, '
+        'bkp_dir TEXT NOT NULL, '
+        'kind TEXT NOT NULL, '
+        'prefix TEXT NOT NULL, '
+        'name TEXT NOT NULL, '
+        'bkp_date TEXT NOT NULL, '
+        'size INTEGER NOT NULL, '
+        'mtime REAL NOT NULL, '
+        'ctime REAL NOT NULL); '
+        'CREATE INDEX IF NOT EXISTS backups_dir_idx '
+        'ON backups (bkp_dir); '
+        'CREATE INDEX IF NOT EXISTS backups_mtime_idx '
+        'ON backups (mtime); '
+        'CREATE TABLE IF NOT EXISTS dirs ('
+        'dir_path TEXT PRIMARY KEY, '
+        'mtime REAL NOT NULL);'
+    )
+    CATALOG_CREATE_WATCHERS = (
+        'CREATE TABLE IF NOT EXISTS watchers ('
+        'watched_path TEXT PRIMARY KEY, '
+        'heartbeat REAL NOT NULL, '
+        'interval REAL NOT NULL);'
+    )
+    CATALOG_DELETE_BKP = (
+        'DELETE FROM backups '
+        'WHERE bkp_path = ?;'
+    )
+    CATALOG_DELETE_DIR = (
+        'DELETE FROM dirs '
+        'WHERE dir_path = ?;'
+    )
+    CATALOG_DELETE_DIR_BKPS = (
+        'DELETE FROM backups '
+        'WHERE bkp_dir = ?;'
+    )
+    CATALOG_DELETE_TOC = (
+        'DELETE FROM toc '
+        'WHERE bkp_path = ?;'
+    )
+    CATALOG_DELETE_WATCHER = (
+        'DELETE FROM watchers '
+        'WHERE watched_path = ?;'
+    )
+    CATALOG_FIND_SCHEMA_BKPS = (
+        "SELECT DISTINCT bkp_path, bkp_date "
+        "FROM toc "
+        "WHERE obj_type = 'SCHEMA' "
+        "AND obj_name = ? "
+        "AND (? = '' OR dbname = ?) "
+        "ORDER BY bkp_date DESC;"
+    )
+    CATALOG_FIND_TABLE_BKPS = (
+        "SELECT DISTINCT bkp_path, bkp_date "
+        "FROM toc "
+        "WHERE obj_type = 'TABLE' "
+        "AND obj_name = ? "
+        "AND (? = '' OR schema_name = ?) "
+        "AND (? = '' OR dbname = ?) "
+        "ORDER BY bkp_date DESC;"
+    )
+    CATALOG_GET_BKPS = (
+        'SELECT bkp_path, size, mtime, ctime '
+        'FROM backups '
+        'WHERE bkp_path >= ? AND bkp_path < ? '
+        'ORDER BY mtime;'
+    )
+    CATALOG_GET_DIRS = (
+        'SELECT dir_path, mtime '
+        'FROM dirs '
+        'WHERE dir_path = ? '
+        'OR (dir_path >= ? AND dir_path < ?);'
+    )
+    CATALOG_GET_WATCHERS = (
+        'SELECT watched_path, heartbeat, interval '
+        'FROM watchers;'
+    )
+    CATALOG_INSERT_BKP = (
+        'INSERT OR REPLACE INTO backups (bkp_path, bkp_dir, kind, prefix, '
+        'name, bkp_date, size, mtime, ctime) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);'
+    )
+    CATALOG_INSERT_TOC = (
+        'INSERT INTO toc (bkp_path, dbname, bkp_date, obj_type, '
+        'schema_name, obj_name) '
+        'VALUES (?, ?, ?, ?, ?, ?);'
+    )
+    CATALOG_UPSERT_DIR = (
+        'INSERT OR REPLACE INTO dirs (dir_path, mtime) '
+        'VALUES (?, ?);'
+    )
+    CATALOG_UPSERT_WATCHER = (
+        'INSERT OR REPLACE INTO watchers (watched_path, heartbeat, interval) '
+        'VALUES (?, ?, ?);'
+    )
+    CHECK_PG_CONN = (
+        'SELECT 1;'
     )
     CHANGE_PG_DB_OWNER = (
         "ALTER DATABASE {dbname} OWNER TO {new_role};"
@@ -916,6 +1460,15 @@ class Queries:
     DROP_PG_DB = (
         'DROP DATABASE {dbname};'
     )
+    DROP_PG_DB_QUOTED = (
+        'DROP DATABASE "{dbname}";'
+    )
+    DROP_PG_INDEX_CONCURRENTLY = (
+        'DROP INDEX CONCURRENTLY IF EXISTS {index_name};'
+    )
+    EXECUTE_PG_STMT = (
+        'EXECUTE {stmt_name}{placeholders};'
+    )
     GET_CURRENT_PG_USER = (
         "SELECT CURRENT_USER;"
     )
@@ -941,6 +1494,10 @@ class Queries:
         'SELECT datname, pg_get_userbyid(datdba) as owner, datallowconn '
         'FROM pg_database;'
     )
+    GET_PG_DBS_XID_AGE = (
+        'SELECT datname, age(datfrozenxid) AS xid_age '
+        'FROM pg_database;'
+    )
     GET_PG_DBS_BY_OWNER = (
         'SELECT datname, pg_get_userbyid(datdba) as owner, datallowconn '
         'FROM pg_database '
@@ -971,14 +1528,103 @@ class Queries:
         'FROM pg_database '
         'WHERE datname = (%s);'
     )
+    GET_PG_DBS_DATA_BY_NAME = (
+        'SELECT datname, pg_get_userbyid(datdba) as owner, '
+        'pg_encoding_to_char(encoding) as encoding, datcollate, datctype, '
+        'datistemplate, datallowconn, datconnlimit, datlastsysoid, '
+        'datfrozenxid, dattablespace, datacl, '
+        'pg_size_pretty(pg_database_size(datname)) as size '
+        'FROM pg_database '
+        'WHERE datname = ANY(%s);'
+    )
+    GET_PG_DB_TABLES_STATS = (
+        "SELECT count(*) AS n_tables, "
+        "COALESCE(sum(GREATEST(c.reltuples, 0)), 0)::bigint AS n_rows "
+        "FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE c.relkind = 'r' "
+        "AND n.nspname NOT IN ('pg_catalog', 'information_schema') "
+        "AND n.nspname !~ '^pg_toast';"
+    )
     GET_PG_DB_SOME_DATA = (
         'SELECT datname, pg_get_userbyid(datdba) as owner, datallowconn '
         'FROM pg_database '
         'WHERE datname = (%s);'
     )
+    GET_PG_INDEXES_BLOAT = (
+        "SELECT quote_ident(n.nspname) || '.' || quote_ident(c.relname) "
+        "AS index_name, pg_relation_size(c.oid) AS size, c.relpages AS pages, "
+        "ceil(c.reltuples * (12 + COALESCE(w.width, 8)) / "
+        "(current_setting('block_size')::numeric * 0.9 - 40))::bigint + 1 "
+        "AS expected_pages "
+        "FROM pg_index i "
+        "JOIN pg_class c ON c.oid = i.indexrelid "
+        "JOIN pg_class t ON t.oid = i.indrelid "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "JOIN pg_am am ON am.oid = c.relam "
+        "LEFT JOIN LATERAL ("
+        "SELECT sum(s.avg_width) AS width "
+        "FROM pg_attribute a "
+        "JOIN pg_stats s ON s.schemaname = n.nspname "
+        "AND s.tablename = t.relname AND s.attname = a.attname "
+        "WHERE a.attrelid = c.oid) w ON true "
+        "WHERE am.amname = 'btree' "
+        "AND i.indisvalid "
+        "AND c.relpages > 0 "
+        "AND c.reltuples >= 0 "
+        "AND n.nspname NOT IN ('pg_catalog', 'information_schema') "
+        "AND n.nspname !~ '^pg_toast';"
+    )
+    GET_PG_INVALID_CCNEW_INDEXES = (
+        "SELECT quote_ident(n.nspname) || '.' || quote_ident(c.relname) "
+        "AS index_name "
+        "FROM pg_index i "
+        "JOIN pg_class c ON c.oid = i.indexrelid "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE NOT i.indisvalid "
+        "AND c.relname ~ '_ccnew[0-9]*$' "
+        "AND i.indrelid = ("
+        "SELECT indrelid FROM pg_index WHERE indexrelid = (%s)::regclass);"
+    )
     GET_PG_PRETTY_VERSION = (
         'select version();'
     )
+    GET_PG_RELATION_SIZE = (
+        'SELECT pg_relation_size((%s)::regclass);'
+    )
+    GET_PG_REPLAY_LAG = (
+        'SELECT pg_is_in_recovery() AS in_recovery, '
+        'CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() '
+        'THEN 0 '
+        'ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) '
+        'END AS replay_lag;'
+    )
+    GET_PG_TABLES_TO_VACUUM = (
+        "SELECT quote_ident(n.nspname) || '.' || quote_ident(c.relname) "
+        "AS table_name "
+        "FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "LEFT JOIN pg_stat_all_tables s ON s.relid = c.oid "
+        "WHERE c.relkind IN ('r', 'm') "
+        "AND c.relpersistence <> 't' "
+        "ORDER BY s.n_dead_tup DESC NULLS LAST;"
+    )
+    GET_PG_TABLES_VACUUM_STATS = (
+        "SELECT quote_ident(schemaname) || '.' || quote_ident(relname) "
+        "AS table_name, n_live_tup, n_dead_tup, last_autovacuum, "
+        "pg_relation_size(relid) AS size "
+        "FROM pg_stat_user_tables "
+        "ORDER BY n_dead_tup DESC;"
+    )
+    GET_PG_TABLES_XID_AGE = (
+        "SELECT quote_ident(n.nspname) || '.' || quote_ident(c.relname) "
+        "AS table_name, age(c.relfrozenxid) AS xid_age "
+        "FROM pg_class c "
+        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE c.relkind IN ('r', 'm') "
+        "AND age(c.relfrozenxid) >= (%s) "
+        "ORDER BY age(c.relfrozenxid) DESC;"
+    )
     GET_PG_TIME_START = (
         'SELECT pg_postmaster_start_time();'
     )
@@ -1003,6 +1649,32 @@ class Queries:
         'FROM pg_stat_activity '
         'WHERE pid = (%s);'
     )
+    GET_PG91_ALL_CONNS_DATA = (
+        'SELECT datid, datname, procpid, usesysid, usename, '
+        'application_name, client_addr, client_hostname, client_port, '
+        'backend_start, xact_start, query_start, waiting '
+        'FROM pg_stat_activity;'
+    )
+    GET_PG92_ALL_CONNS_DATA = (
+        'SELECT datid, datname, pid, usesysid, usename, application_name, '
+        'client_addr, client_hostname, client_port, backend_start, '
+        'xact_start, query_start, state_change, waiting, state, query '
+        'FROM pg_stat_activity;'
+    )
+    GET_PG91_CONNS_DATA = (
+        'SELECT datid, datname, procpid, usesysid, usename, '
+        'application_name, client_addr, client_hostname, client_port, '
+        'backend_start, xact_start, query_start, waiting '
+        'FROM pg_stat_activity '
+        'WHERE procpid = ANY(%s::int[]);'
+    )
+    GET_PG92_CONNS_DATA = (
+        'SELECT datid, datname, pid, usesysid, usename, application_name, '
+        'client_addr, client_hostname, client_port, backend_start, '
+        'xact_start, query_start, state_change, waiting, state, query '
+        'FROM pg_stat_activity '
+        'WHERE pid = ANY(%s::int[]);'
+    )
     GET_PG91_USER_DATA = (
         'SELECT usename, usesysid, usecreatedb, usesuper, usecatupd, '
         'passwd, valuntil, useconfig '
@@ -1015,6 +1687,18 @@ class Queries:
         'FROM pg_user '
         'WHERE usename = (%s);'
     )
+    GET_PG91_USERS_DATA = (
+        'SELECT usename, usesysid, usecreatedb, usesuper, usecatupd, '
+        'passwd, valuntil, useconfig '
+        'FROM pg_user '
+        'WHERE usename = ANY(%s);'
+    )
+    GET_PG92_USERS_DATA = (
+        'SELECT usename, usesysid, usecreatedb, usesuper, usecatupd, '
+        'userepl, passwd, valuntil, useconfig '
+        'FROM pg_user '
+        'WHERE usename = ANY(%s);'
+    )
     IS_PG_SUPERUSER = (
         'SELECT usesuper '
         'FROM pg_user '
@@ -1030,9 +1714,28 @@ class Queries:
         'FROM pg_user '
         'WHERE usename=(%s);'
     )
+    PREPARE_PG_STMT = (
+        'PREPARE {stmt_name} AS {query}'
+    )
+    RESET_PG_SESSION = (
+        'CLOSE ALL; '
+        'RESET ALL;'
+    )
+    REINDEX_PG_INDEX_CONCURRENTLY = (
+        'REINDEX INDEX CONCURRENTLY {index_name};'
+    )
+    RENAME_PG_DB = (
+        'ALTER DATABASE "{dbname}" RENAME TO "{new_dbname}";'
+    )
     REASSIGN_PG_DB_TBLS_OWNER = (
         "REASSIGN OWNED BY {old_role} TO {new_role};"
     )
+    SET_VACUUM_COST_DELAY = (
+        'SET vacuum_cost_delay = {cost_delay};'
+    )
+    SET_VACUUM_COST_LIMIT = (
+        'SET vacuum_cost_limit = {cost_limit};'
+    )
     TERMINATE_BACKEND_PG_ALL = (
         "SELECT pg_terminate_backend({pg_pid}) "
         "FROM pg_stat_activity "
@@ -1041,7 +1744,7 @@ class Queries:
     TERMINATE_BACKEND_PG_DB = (
         "SELECT pg_terminate_backend({pg_pid}) "
         "FROM pg_stat_activity "
-        "WHERE datname = '{target_db}' "
+        "WHERE datname = (%s) "
         "AND {pg_pid} <> pg_backend_pid();"
     )
     TERMINATE_BACKEND_PG_USER = (
@@ -1050,6 +1753,9 @@ class Queries:
         "WHERE usename = '{target_user}' "
         "AND usename <> CURRENT_USER;"
     )
+    VACUUM_PG_TABLE = (
+        'VACUUM {options}{table_name};'
+    )
 
     def __init__(self):
         pass
@@ -67,6 +67,19 @@ class DateTools:
 
         return month
 
+    @staticmethod
+    def str_to_datetime(date_str, fmt='%Y%m%d_%H%M%S'):
+        '''
+        Target:
+            - turns a date stored in a string into a datetime object.
+        Parameters:
+            - date_str: the string with the date.
+            - fmt: the date format used.
+        Return:
+            - a datetime object with the received date.
+        '''
+        return datetime.datetime.strptime(date_str, fmt)
+
     @staticmethod
     def get_current_datetime():
         '''
@@ -4,11 +4,13 @@
 
 import os  # to work with directories and files
 import re  # to work with regular expressions
+from concurrent import futures  # to scan several directories at a time
 
 from getpass import getuser
 
 from const.const import Messenger
 from const.const import Default
+from date_tools.date_tools import DateTools
 from logger.logger import Logger
 
 
@@ -96,26 +98,113 @@ class Dir:
         return cfg_file
 
     @staticmethod
-    def sorted_flist(path):
+    def sorted_flist(path, name_dates=False):
         '''
         Target:
             - generate a list which contains every file in the specified
-              directory (and its subdirectories) sorted by modification date.
+              directory (and its subdirectories) sorted by modification date,
+              or by the date written in their names (without reading any file's
+              status). The whole list is stored and sorted in memory, so the
+              callers which only filter the files should use "scan_files"
+              instead.
         Parameters:
             - path: the directory where the files are.
+            - name_dates: a flag which determinates whether the files must be
+              sorted by the date written in their names.
         Return:
             - a sorted list with all the files in the directory.
         '''
-        files_list = []
+        if name_dates:
+            files_list = [Dir.get_entry_path(entry)
+                          for entry in Dir.scan_files(path)]
+            # Files without a date in their names go first
+            sorted_list = sorted(
+                files_list, key=lambda f: Dir.get_bkp_timestamp(f) or 0)
+        else:
+            # The status of each file was read by the scanner's threads
+            files_list = [(entry.stat().st_mtime, Dir.get_entry_path(entry))
+                          for entry in Dir.scan_files(path, stat=True)]
+            files_list.sort(key=lambda f: f[0])
+            sorted_list = [f for mtime, f in files_list]
 
-        for dirname, dirnames, filenames in os.walk(path):
-            for file in filenames:
-                filepath = os.path.realpath(os.path.join(dirname, file))
-                files_list.append(filepath)
+        return sorted_list
 
-        sorted_list = sorted(files_list, key=lambda f: os.stat(f).st_mtime)
+    @staticmethod
+    def scan_dir(dirname, stat=False):
+        '''
+        Target:
+            - list the files and subdirectories of a directory (not
+              recursively) with a single "scandir" call.
+        Parameters:
+            - dirname: the directory to list.
+            - stat: a flag which determinates whether the status of each file
+              must be read (and cached in its entry) too.
+        Return:
+            - a list with the entries of the files and a list with the paths
+              of the subdirectories.
+        '''
+        files = []
+        subdirs = []
 
-        return sorted_list
+        try:
+            with os.scandir(dirname) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if stat:
+                            entry.stat()  # The result is cached in the entry
+                        files.append(entry)
+        except OSError:  # The directory was removed or cannot be read
+            pass
+
+        return files, subdirs
+
+    @staticmethod
+    def scan_files(path, stat=False, workers=Default.SCAN_WORKERS):
+        '''
+        Target:
+            - generate the entries of every file in the specified directory
+              (and its subdirectories), scanning several subdirectories at a
+              time. The entries are yielded as soon as their directory is
+              scanned, so the whole list is never stored.
+        Parameters:
+            - path: the directory where the files are.
+            - stat: a flag which determinates whether the status of each file
+              must be read (and cached in its entry) by the scanner's threads.
+            - workers: maximum number of directories scanned at a time.
+        Return:
+            - a generator of "os.DirEntry" objects.
+        '''
+        with futures.ThreadPoolExecutor(workers) as executor:
+            pending = {executor.submit(Dir.scan_dir, os.path.realpath(path),
+                                       stat)}
+            while pending:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED)
+                for task in done:
+                    files, subdirs = task.result()
+                    for subdir in subdirs:
+                        pending.add(executor.submit(Dir.scan_dir, subdir,
+                                                    stat))
+                    for entry in files:
+                        yield entry
+
+    @staticmethod
+    def get_entry_path(entry):
+        '''
+        Target:
+            - get the real path of a file given by the scanner (only symbolic
+              links need to be resolved, as the scan starts in a real path).
+        Parameters:
+            - entry: the "os.DirEntry" object of the file.
+        Return:
+            - the absolute real path of the file.
+        '''
+        if entry.is_symlink():
+            return os.path.realpath(entry.path)
+        else:
+            return entry.path
 
     @staticmethod
     def get_dbs_bkped(bkps_list=[]):
@@ -157,6 +246,49 @@ class Dir:
 
         return bkped_dbs
 
+    @staticmethod
+    def get_bkp_datetime(bkp_path):
+        '''
+        Target:
+            - extract the date and time of a backup from its file's name
+              (the timezone is ignored).
+        Parameters:
+            - bkp_path: the path of the backup's file.
+        Return:
+            - a datetime object with the backup's date, or None if the name
+              does not contain a valid date.
+        '''
+        # Regular expression which matches the last date in the name
+        regex = r'.*_(\d{8}_\d{6})_'
+        match = re.match(regex, os.path.basename(bkp_path))
+
+        if match:
+            try:
+                return DateTools.str_to_datetime(match.group(1))
+            except ValueError:
+                pass
+
+        return None
+
+    @staticmethod
+    def get_bkp_timestamp(bkp_path):
+        '''
+        Target:
+            - get the date and time of a backup written in its file's name, as
+              seconds since the epoch (the name's date is considered local).
+        Parameters:
+            - bkp_path: the path of the backup's file.
+        Return:
+            - a float with the backup's date, or None if the name does not
+              contain a valid date.
+        '''
+        bkp_dt = Dir.get_bkp_datetime(bkp_path)
+
+        if bkp_dt:
+            return bkp_dt.timestamp()
+        else:
+            return None
+
     @staticmethod
     def show_pg_warnings(pg_dbs=[], bkped_dbs=[], logger=None):
         '''
@@ -218,15 +350,36 @@ class Dir:
             pass
 
     @staticmethod
-    def remove_empty_dirs(path):
+    def remove_empty_dirs(path, touched_dirs=None):
         '''
         Target:
             - remove every subdirectory if empty (even the whole directory in
-              case it turns empty).
+              case it turns empty). If some touched directories are specified,
+              only those and their parents (up to the specified directory) are
+              checked, instead of walking the whole directory.
         Parameters:
             - path: the absolute path of the directory.
+            - touched_dirs: the directories which lost some files.
         '''
-        for root, dirnames, filenames in os.walk(path, topdown=False):
-            for dirname in dirnames:
-                Dir.remove_empty_dir(os.path.realpath(os.path.join(root,
-                                                                   dirname)))
+        if touched_dirs is None:
+            for root, dirnames, filenames in os.walk(path, topdown=False):
+                for dirname in dirnames:
+                    Dir.remove_empty_dir(os.path.realpath(
+                        os.path.join(root, dirname)))
+            return
+
+        path = os.path.realpath(path)
+        dirs_to_check = set()
+
+        # Get the touched directories and their parents inside the path
+        for dirname in touched_dirs:
+            dirname = os.path.realpath(dirname)
+            while dirname not in dirs_to_check and dirname != path and \
+                    os.path.commonpath([dirname, path]) == path:
+                dirs_to_check.add(dirname)
+                dirname = os.path.dirname(dirname)
+
+        # The deepest directories first, so that their parents can be empty
+        for dirname in sorted(dirs_to_check, key=lambda d: d.count(os.sep),
+                              reverse=True):
+            Dir.remove_empty_dir(dirname)
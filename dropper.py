@@ -53,16 +53,16 @@ class Dropper:
         delete = False
 
         try:
-            self.connecter.cursor.execute(Queries.PG_DB_EXISTS, (dbname, ))
+            self.connecter.execute_prepared(Queries.PG_DB_EXISTS, (dbname, ))
             result = self.connecter.cursor.fetchone()
 
             if result:
 
                 pg_pid = self.connecter.get_pid_str()
                 formatted_sql = Queries.BACKEND_PG_DB_EXISTS.format(
-                    pg_pid=pg_pid, target_db=dbname)
+                    pg_pid=pg_pid)
 
-                self.connecter.cursor.execute(formatted_sql)
+                self.connecter.execute_prepared(formatted_sql, (dbname, ))
                 result = self.connecter.cursor.fetchone()
 
                 # If there are not any connections to the target database...
@@ -72,8 +72,8 @@ class Dropper:
                     # the databases they own
                     if not pg_superuser:
 
-                        self.connecter.cursor.execute(Queries.GET_PG_DB_OWNER,
-                                                      (dbname, ))
+                        self.connecter.execute_prepared(
+                            Queries.GET_PG_DB_OWNER, (dbname, ))
                         db = self.connecter.cursor.fetchone()
 
                         if db['owner'] != self.connecter.user:
@@ -109,6 +109,7 @@ class Dropper:
                         start_time = DateTools.get_current_datetime()
                         # Drop the database
                         self.connecter.cursor.execute(fmt_query_drop_db)
+                        self.connecter.invalidate_metadata('dbs')
                         end_time = DateTools.get_current_datetime()
                         # Get and show the process' duration
                         diff = DateTools.get_diff_datetimes(start_time,
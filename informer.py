@@ -4,6 +4,7 @@
 
 #from casting.casting import Casting
 from const.const import Messenger
+from const.const import Queries
 from logger.logger import Logger
 
 
@@ -11,6 +12,10 @@ class Informer:
 
     # An object with connection parameters to connect to PostgreSQL
     connecter = None
+    # An object with the connection parameters to query the databases, users
+    # and version with (a standby server if there is any suitable, otherwise
+    # the main one)
+    read_connecter = None
     logger = None  # Logger to show and log some messages
     connpids = []
     dbnames = []  # List of databases to get some info about
@@ -29,6 +34,9 @@ class Informer:
         else:
             self.logger.stop_exe(Messenger.NO_CONNECTION_PARAMS)
 
+        # Query the main server unless told otherwise
+        self.read_connecter = self.connecter
+
         self.connpids = connpids
         self.dbnames = dbnames
         self.usernames = usernames
@@ -47,7 +55,7 @@ class Informer:
         self.logger.highlight('info', message, 'white')
 
         # Get all the names of PostgreSQL databases and show them
-        dbnames = self.connecter.get_pg_dbnames()
+        dbnames = self.read_connecter.get_pg_dbnames()
 
         if dbnames:
             for dbname in dbnames:
@@ -70,7 +78,7 @@ class Informer:
         self.logger.highlight('info', message, 'white')
 
         # Get all the names of PostgreSQL users and show them
-        usernames = self.connecter.get_pg_usernames()
+        usernames = self.read_connecter.get_pg_usernames()
 
         if usernames:
             for username in usernames:
@@ -115,16 +123,16 @@ class Informer:
         message = '*' * msg_len
         self.logger.highlight('info', message, 'white')
 
-        dbs_data = []
         # Get every PostgreSQL database if no list specified, otherwise, keep
         # the specified list (given by console arguments)
         if self.dbnames == []:
-            self.dbnames = self.connecter.get_pg_dbnames()
+            self.dbnames = self.read_connecter.get_pg_dbnames()
 
-        for dbname in self.dbnames:  # Get data of each selected database
-            result = self.connecter.get_pg_db_data(dbname)
-            if result:
-                dbs_data.append(result)
+        # Get data of every selected database at once
+        dbs_data = []
+        if self.dbnames:
+            dbs_data = self.read_connecter.get_pg_dbs_data_by_name(
+                self.dbnames)
 
         if dbs_data:
             for db in dbs_data:
@@ -171,19 +179,20 @@ class Informer:
         message = '*' * msg_len
         self.logger.highlight('info', message, 'white')
 
-        users_data = []
         # Get every PostgreSQL user if no list specified, otherwise, keep
         # the specified list (given by console arguments)
 
         if self.usernames == []:
-            self.usernames = self.connecter.get_pg_usernames()
+            self.usernames = self.read_connecter.get_pg_usernames()
 
-        for username in self.usernames:  # Get data of each selected user
-            result = self.connecter.get_pg_user_data(username)
-            if result:
-                users_data.append(result)
+        # Get data of every selected user at once
+        users_data = []
+        if self.usernames:
+            users_data = self.read_connecter.get_pg_users_data(
+                self.usernames)
 
-        pg_version = self.connecter.get_pg_version()  # Get PostgreSQL version
+        # Get PostgreSQL version
+        pg_version = self.read_connecter.get_pg_version()
 
         if users_data:
             for user in users_data:
@@ -210,6 +219,52 @@ class Informer:
             message = Messenger.NO_USER_DATA_TO_SHOW
             self.logger.highlight('warning', message, 'yellow', effect='bold')
 
+    def show_pg_conn_data(self, conn, pg_version):
+        '''
+        Target:
+            - show some info about a PostgreSQL backend.
+        Parameters:
+            - conn: the info of the backend.
+            - pg_version: the PostgreSQL version.
+        '''
+        if pg_version >= self.connecter.PG_PID_VERSION_THRESHOLD:
+            message = Messenger.PID + str(conn['pid'])
+        else:
+            message = Messenger.PROCPID + str(conn['procpid'])
+        self.logger.highlight('info', message, 'cyan')
+        message = Messenger.DATID + str(conn['datid'])
+        self.logger.info(message)
+        message = Messenger.DATNAME + str(conn['datname'])
+        self.logger.info(message)
+        message = Messenger.USESYSID + str(conn['usesysid'])
+        self.logger.info(message)
+        message = Messenger.USENAME + str(conn['usename'])
+        self.logger.info(message)
+        message = Messenger.APPLICATION_NAME + str(conn['application_name'])
+        self.logger.info(message)
+        message = Messenger.CLIENT_ADDR + str(conn['client_addr'])
+        self.logger.info(message)
+        message = Messenger.CLIENT_HOSTNAME + str(conn['client_hostname'])
+        self.logger.info(message)
+        message = Messenger.CLIENT_PORT + str(conn['client_port'])
+        self.logger.info(message)
+        message = Messenger.BACKEND_START + str(conn['backend_start'])
+        self.logger.info(message)
+        message = Messenger.XACT_START + str(conn['xact_start'])
+        self.logger.info(message)
+        message = Messenger.QUERY_START + str(conn['query_start'])
+        self.logger.info(message)
+        if pg_version >= self.connecter.PG_PID_VERSION_THRESHOLD:
+            message = Messenger.STATE_CHANGE + str(conn['state_change'])
+            self.logger.info(message)
+        message = Messenger.WAITING + str(conn['waiting'])
+        self.logger.info(message)
+        if pg_version >= self.connecter.PG_PID_VERSION_THRESHOLD:
+            message = Messenger.STATE + str(conn['state'])
+            self.logger.info(message)
+            message = Messenger.QUERY + str(conn['query'])
+            self.logger.info(message)
+
     def show_pg_conns_data(self):
         '''
         Target:
@@ -223,62 +278,36 @@ class Informer:
         message = '*' * msg_len
         self.logger.highlight('info', message, 'white')
 
-        conns_data = []
+        pg_version = self.connecter.get_pg_version()  # Get PostgreSQL version
+
         # Get every PostgreSQL connection if no list specified, otherwise, keep
         # the specified list (given by console arguments)
         if self.connpids == []:
-            self.connpids = self.connecter.get_pg_connpids()
-
-        for connpid in self.connpids:  # Get data of each selected backend
-            result = self.connecter.get_pg_conn_data(connpid)
-            if result:
-                conns_data.append(result)
-
-        pg_version = self.connecter.get_pg_version()  # Get PostgreSQL version
-
-        if conns_data:
-            for conn in conns_data:
-                if pg_version >= self.connecter.PG_PID_VERSION_THRESHOLD:
-                    message = Messenger.PID + str(conn['pid'])
-                else:
-                    message = Messenger.PROCPID + str(conn['procpid'])
-                self.logger.highlight('info', message, 'cyan')
-                message = Messenger.DATID + str(conn['datid'])
-                self.logger.info(message)
-                message = Messenger.DATNAME + str(conn['datname'])
-                self.logger.info(message)
-                message = Messenger.USESYSID + str(conn['usesysid'])
-                self.logger.info(message)
-                message = Messenger.USENAME + str(conn['usename'])
-                self.logger.info(message)
-                message = Messenger.APPLICATION_NAME + str(
-                    conn['application_name'])
-                self.logger.info(message)
-                message = Messenger.CLIENT_ADDR + str(conn['client_addr'])
-                self.logger.info(message)
-                message = Messenger.CLIENT_HOSTNAME + str(
-                    conn['client_hostname'])
-                self.logger.info(message)
-                message = Messenger.CLIENT_PORT + str(conn['client_port'])
-                self.logger.info(message)
-                message = Messenger.BACKEND_START + str(conn['backend_start'])
-                self.logger.info(message)
-                message = Messenger.XACT_START + str(conn['xact_start'])
-                self.logger.info(message)
-                message = Messenger.QUERY_START + str(conn['query_start'])
-                self.logger.info(message)
-                if pg_version >= self.connecter.PG_PID_VERSION_THRESHOLD:
-                    message = Messenger.STATE_CHANGE + str(
-                        conn['state_change'])
-                    self.logger.info(message)
-                message = Messenger.WAITING + str(conn['waiting'])
-                self.logger.info(message)
-                if pg_version >= self.connecter.PG_PID_VERSION_THRESHOLD:
-                    message = Messenger.STATE + str(conn['state'])
-                    self.logger.info(message)
-                    message = Messenger.QUERY + str(conn['query'])
-                    self.logger.info(message)
+            if pg_version < self.connecter.PG_PID_VERSION_THRESHOLD:
+                query = Queries.GET_PG91_ALL_CONNS_DATA
+            else:
+                query = Queries.GET_PG92_ALL_CONNS_DATA
+            # Read the connections a few at a time, as there may be lots of
+            # them
+            conns_data = (conn._asdict()
+                          for conn in self.connecter.stream_query(query))
         else:
+            # Get data of every selected backend at once
+            conns_data = self.connecter.get_pg_conns_data(self.connpids)
+
+        n_conns = 0
+
+        try:
+            for conn in conns_data or []:
+                self.show_pg_conn_data(conn, pg_version)
+                n_conns += 1
+        except Exception as e:
+            self.logger.debug('Error en la función "show_pg_conns_data": '
+                              '{}.'.format(str(e)))
+            self.logger.highlight('warning', Messenger.GET_PG_CONNS_DATA,
+                                  'yellow')
+
+        if not n_conns:
             message = Messenger.NO_CONN_DATA_TO_SHOW
             self.logger.highlight('warning', message, 'yellow', effect='bold')
 
@@ -295,7 +324,7 @@ class Informer:
         message = '*' * msg_len
         self.logger.highlight('info', message, 'white')
 
-        pretty_pg_version = self.connecter.get_pretty_pg_version()
+        pretty_pg_version = self.read_connecter.get_pretty_pg_version()
         if pretty_pg_version:
             self.logger.info(pretty_pg_version)
         else:
@@ -307,7 +336,7 @@ class Informer:
         Target:
             - show PostgreSQL version in numeric format.
         '''
-        pg_version = self.connecter.get_pg_version()
+        pg_version = self.read_connecter.get_pg_version()
         print(pg_version)
 
     def show_pg_time_start(self):
@@ -40,6 +40,7 @@ class Mailer:
         'T': 'Trimmer',
         't': 'Terminator',
         'v': 'Vacuumer',
+        'x': 'Reindexer',
     }
 
     OP_RESULTS = {
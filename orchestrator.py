@@ -5,8 +5,12 @@
 from alterer import Alterer
 from backer import Backer
 from backer import BackerCluster
+from casting.casting import Casting
+from catalog.catalog import Catalog
+from checker.checker import Checker
 from configurator import Configurator
-from connecter import Connecter
+from connecter import ConnecterPool
+from const.const import Default
 from const.const import Messenger
 from const.const import Queries
 from db_selector.db_selector import DbSelector
@@ -14,20 +18,27 @@ from dir_tools.dir_tools import Dir
 from dropper import Dropper
 from informer import Informer
 from logger.logger import Logger
+from reindexer import Reindexer
 from replicator import Replicator
 from restorer import Restorer
 from restorer import RestorerCluster
+from restorer import RestorerVerifier
 from scheduler import Scheduler
 from terminator import Terminator
 from trimmer import Trimmer
 from trimmer import TrimmerCluster
 from vacuumer import Vacuumer
+from watcher import Watcher
 
 
 class Orchestrator:
 
     action = None  # The action to do
     args = []  # The list of parameters received in console
+    # Standby servers (host and port) to do the read-only work in
+    standbys = []
+    # Maximum number of seconds which a standby server can be behind
+    max_lag = Default.MAX_LAG
     logger = None  # A logger to show and log some messages
 
     def __init__(self, action, args):
@@ -174,22 +185,57 @@ class Orchestrator:
             if self.args.pg_port:
                 parser.conn_vars['port'] = self.args.pg_port
 
-            # Create the connecter with the specified variables
-            connecter = Connecter(server=parser.conn_vars['server'],
-                                  user=parser.conn_vars['user'],
-                                  port=parser.conn_vars['port'],
-                                  logger=self.logger)
+            # Set the limits of the pool of connections
+            ConnecterPool.configure(
+                max_size=parser.conn_vars['pool_size'],
+                idle_timeout=parser.conn_vars['pool_idle_timeout'],
+                max_total=parser.conn_vars['pool_max_total'],
+                logger=self.logger)
+
+            # Borrow a connecter with the specified variables from the pool
+            connecter = ConnecterPool.get_connecter(
+                server=parser.conn_vars['server'],
+                user=parser.conn_vars['user'],
+                port=parser.conn_vars['port'], logger=self.logger)
+
+            # Set how long the queried lists of databases can be reused
+            connecter.set_dbs_ttl(parser.conn_vars['dbs_ttl'])
+            # Set how many rows are read at a time from big results
+            connecter.set_itersize(parser.conn_vars['itersize'])
+
+            # Get the standby servers to do the read-only work in
+            self.standbys = ConnecterPool.parse_standbys(
+                parser.conn_vars['standbys'], connecter.port, self.logger)
+            if Checker.str_is_int(parser.conn_vars['max_lag']) and \
+                    int(parser.conn_vars['max_lag']) >= 0:
+                self.max_lag = Casting.str_to_int(parser.conn_vars['max_lag'])
+            else:
+                self.logger.stop_exe(Messenger.INVALID_MAX_LAG)
 
         # If the user did not specify a connecter config file through console..
         else:
 
-            # Create the connecter with the console variables
-            connecter = Connecter(server=self.args.pg_host,
-                                  user=self.args.pg_user,
-                                  port=self.args.pg_port, logger=self.logger)
+            # Borrow a connecter with the console variables from the pool
+            connecter = ConnecterPool.get_connecter(
+                server=self.args.pg_host, user=self.args.pg_user,
+                port=self.args.pg_port, logger=self.logger)
 
         return connecter
 
+    def get_read_connecter(self, connecter):
+        '''
+        Target:
+            - get a connecter to do read-only work (like backups or
+              information queries) in a standby server, if any of them is
+              available and not too far behind the primary one.
+        Parameters:
+            - connecter: the connecter to the primary server.
+        Return:
+            - a connecter to a standby server, or the received one.
+        '''
+        return ConnecterPool.get_read_connecter(connecter, self.standbys,
+                                                self.max_lag, self.logger)
+
     def get_alterer(self, connecter):
         '''
         Target:
@@ -272,6 +318,10 @@ class Orchestrator:
                 parser.bkp_vars['vacuum'] = False
             if self.args.db_owner:
                 parser.bkp_vars['db_owner'] = self.args.db_owner
+            if self.args.catalog:
+                parser.bkp_vars['catalog'] = True
+            elif self.args.no_catalog:
+                parser.bkp_vars['catalog'] = False
 
             # Create the backer with the specified variables
             backer = Backer(connecter, parser.bkp_vars['bkp_path'],
@@ -285,7 +335,8 @@ class Orchestrator:
                             parser.bkp_vars['ex_regex'],
                             parser.bkp_vars['ex_templates'],
                             parser.bkp_vars['vacuum'],
-                            parser.bkp_vars['db_owner'], self.logger)
+                            parser.bkp_vars['db_owner'],
+                            parser.bkp_vars['catalog'], self.logger)
 
         # If the user did not specify a backer config file through console...
         else:
@@ -310,7 +361,7 @@ class Orchestrator:
                             in_dbs=self.args.db_name,
                             ex_templates=ex_templates, vacuum=vacuum,
                             db_owner=self.args.db_owner,
-                            logger=self.logger)
+                            catalog=self.args.catalog, logger=self.logger)
 
         return backer
 
@@ -342,13 +393,18 @@ class Orchestrator:
                 parser.bkp_vars['vacuum'] = True
             elif self.args.no_vacuum:
                 parser.bkp_vars['vacuum'] = False
+            if self.args.catalog:
+                parser.bkp_vars['catalog'] = True
+            elif self.args.no_catalog:
+                parser.bkp_vars['catalog'] = False
 
             # Create the backer with the specified variables
             backer = BackerCluster(connecter, parser.bkp_vars['bkp_path'],
                                    parser.bkp_vars['group'],
                                    parser.bkp_vars['bkp_type'],
                                    parser.bkp_vars['prefix'],
-                                   parser.bkp_vars['vacuum'], self.logger)
+                                   parser.bkp_vars['vacuum'],
+                                   parser.bkp_vars['catalog'], self.logger)
 
         # If the user did not specify a backer config file through console...
         else:
@@ -363,7 +419,8 @@ class Orchestrator:
             backer = BackerCluster(connecter, bkp_path=self.args.bkp_path,
                                    group=self.args.group,
                                    bkp_type=self.args.backup_format,
-                                   vacuum=vacuum, logger=self.logger)
+                                   vacuum=vacuum, catalog=self.args.catalog,
+                                   logger=self.logger)
 
         return backer
 
@@ -418,6 +475,69 @@ class Orchestrator:
 
         return informer
 
+    def get_reindexer(self, connecter):
+        '''
+        Target:
+            - get a reindexer object with variables to rebuild the bloated
+              indexes of databases in PostgreSQL.
+        Parameters:
+            - connecter: an object with connection parameters to connect to
+              PostgreSQL.
+        Return:
+            - a reindexer which will rebuild the indexes of PostgreSQL
+              databases.
+        '''
+        # If the user specified a reindexer config file through console...
+        if self.args.config:
+
+            config_type = 'reindex'
+            # Get the variables from the config file
+            parser = Orchestrator.get_cfg_vars(config_type, self.args.config,
+                                               self.logger)
+
+            # Overwrite the config variables with the console ones if necessary
+            if self.args.db_name:
+                parser.bkp_vars['in_dbs'] = self.args.db_name
+                parser.bkp_vars['ex_dbs'] = []
+                parser.bkp_vars['in_regex'] = ''
+                parser.bkp_vars['ex_regex'] = ''
+            if self.args.db_owner:
+                parser.bkp_vars['db_owner'] = self.args.db_owner
+            if self.args.bloat_ratio is not None:
+                parser.bkp_vars['bloat_ratio'] = self.args.bloat_ratio
+            if self.args.workers:
+                parser.bkp_vars['workers'] = self.args.workers
+            if self.args.time_budget is not None:
+                parser.bkp_vars['time_budget'] = self.args.time_budget
+
+            # Create the reindexer with the specified variables
+            reindexer = Reindexer(connecter,
+                                  parser.bkp_vars['in_dbs'],
+                                  parser.bkp_vars['in_regex'],
+                                  parser.bkp_vars['in_priority'],
+                                  parser.bkp_vars['ex_dbs'],
+                                  parser.bkp_vars['ex_regex'],
+                                  parser.bkp_vars['ex_templates'],
+                                  parser.bkp_vars['db_owner'],
+                                  parser.bkp_vars['bloat_ratio'],
+                                  parser.bkp_vars['workers'],
+                                  parser.bkp_vars['time_budget'],
+                                  self.logger)
+
+        # If the user did not specify a reindexer config file through
+        # console...
+        else:
+
+            # Create the reindexer with the console variables
+            reindexer = Reindexer(connecter, in_dbs=self.args.db_name,
+                                  db_owner=self.args.db_owner,
+                                  bloat_ratio=self.args.bloat_ratio,
+                                  workers=self.args.workers,
+                                  time_budget=self.args.time_budget,
+                                  logger=self.logger)
+
+        return reindexer
+
     def get_replicator(self, connecter):
         '''
         Target:
@@ -477,16 +597,45 @@ class Orchestrator:
             if self.args.db_backup:
                 parser.bkp_vars['bkp_path'] = self.args.db_backup[0]
                 parser.bkp_vars['new_dbname'] = self.args.db_backup[1]
+            if self.args.swap:
+                parser.bkp_vars['swap'] = True
+            if self.args.table:
+                parser.bkp_vars['table'] = self.args.table
+            if self.args.schema:
+                parser.bkp_vars['schema'] = self.args.schema
+            if self.args.jobs:
+                parser.bkp_vars['jobs'] = self.args.jobs
 
-            # Create the restorer with the specified variables
-            restorer = Restorer(connecter, parser.bkp_vars['bkp_path'],
-                                parser.bkp_vars['new_dbname'], self.logger)
+            bkp_vars = parser.bkp_vars
 
         # If the user did not specify a restorer config file through console...
         else:
-            # Create the restorer with the console variables
-            restorer = Restorer(connecter, self.args.db_backup[0],
-                                self.args.db_backup[1], self.logger)
+            bkp_vars = {
+                'swap': self.args.swap,
+                'table': self.args.table or '',
+                'schema': self.args.schema or '',
+                'jobs': self.args.jobs,
+            }
+            if self.args.db_backup:
+                bkp_vars['bkp_path'] = self.args.db_backup[0]
+                bkp_vars['new_dbname'] = self.args.db_backup[1]
+
+        # Search in the catalog the latest backup with the table or schema
+        if self.args.catalog:
+            catalog = Catalog(self.args.catalog[0], self.logger)
+            bkp_vars['bkp_path'] = catalog.find_bkp(bkp_vars['table'],
+                                                    bkp_vars['schema'])
+            catalog.close()
+            if not bkp_vars['bkp_path']:
+                self.logger.stop_exe(Messenger.NO_BKP_IN_CATALOG.format(
+                    table=bkp_vars['table'], schema=bkp_vars['schema']))
+            bkp_vars['new_dbname'] = self.args.catalog[1]
+
+        # Create the restorer with the specified variables
+        restorer = Restorer(connecter, bkp_vars['bkp_path'],
+                            bkp_vars['new_dbname'], bkp_vars['swap'],
+                            bkp_vars['table'], bkp_vars['schema'],
+                            bkp_vars['jobs'], self.logger)
 
         return restorer
 
@@ -654,6 +803,28 @@ class Orchestrator:
                 parser.bkp_vars['exp_days'] = self.args.expiry_days
             if self.args.max_size:
                 parser.bkp_vars['max_size'] = self.args.max_size
+            if self.args.catalog:
+                parser.bkp_vars['catalog'] = True
+            elif self.args.no_catalog:
+                parser.bkp_vars['catalog'] = False
+            for keep_var in ('keep_daily', 'keep_weekly', 'keep_monthly',
+                             'keep_yearly'):
+                if getattr(self.args, keep_var) is not None:
+                    parser.bkp_vars[keep_var] = getattr(self.args, keep_var)
+            if self.args.enforce_size:
+                parser.bkp_vars['enforce_size'] = True
+            if self.args.name_dates:
+                parser.bkp_vars['name_dates'] = True
+            if self.args.dry_run:
+                parser.bkp_vars['dry_run'] = True
+            if self.args.plan_file:
+                parser.bkp_vars['plan_file'] = self.args.plan_file
+            if self.args.workers:
+                parser.bkp_vars['workers'] = self.args.workers
+            if self.args.full_reconcile:
+                parser.bkp_vars['full_reconcile'] = True
+            if self.args.max_total_size:
+                parser.bkp_vars['max_total_size'] = self.args.max_total_size
             if parser.bkp_vars['pg_warnings']:
                 connecter = self.get_connecter()
             else:
@@ -670,7 +841,19 @@ class Orchestrator:
                               parser.bkp_vars['min_n_bkps'],
                               parser.bkp_vars['exp_days'],
                               parser.bkp_vars['max_size'],
-                              parser.bkp_vars['pg_warnings'], connecter,
+                              parser.bkp_vars['pg_warnings'],
+                              parser.bkp_vars['catalog'],
+                              parser.bkp_vars['keep_daily'],
+                              parser.bkp_vars['keep_weekly'],
+                              parser.bkp_vars['keep_monthly'],
+                              parser.bkp_vars['keep_yearly'],
+                              parser.bkp_vars['enforce_size'],
+                              parser.bkp_vars['max_total_size'],
+                              parser.bkp_vars['name_dates'],
+                              parser.bkp_vars['dry_run'],
+                              parser.bkp_vars['plan_file'],
+                              parser.bkp_vars['workers'],
+                              parser.bkp_vars['full_reconcile'], connecter,
                               self.logger)
 
         # If the user did not specify a trimmer config file through console...
@@ -686,7 +869,20 @@ class Orchestrator:
                               in_dbs=self.args.db_name,
                               min_n_bkps=self.args.n_backups,
                               exp_days=self.args.expiry_days,
-                              max_size=self.args.max_size, logger=self.logger)
+                              max_size=self.args.max_size,
+                              catalog=self.args.catalog,
+                              keep_daily=self.args.keep_daily,
+                              keep_weekly=self.args.keep_weekly,
+                              keep_monthly=self.args.keep_monthly,
+                              keep_yearly=self.args.keep_yearly,
+                              enforce_size=self.args.enforce_size,
+                              max_total_size=self.args.max_total_size,
+                              name_dates=self.args.name_dates,
+                              dry_run=self.args.dry_run,
+                              plan_file=self.args.plan_file,
+                              workers=self.args.workers,
+                              full_reconcile=self.args.full_reconcile,
+                              logger=self.logger)
 
         return trimmer
 
@@ -716,19 +912,58 @@ class Orchestrator:
                 parser.bkp_vars['exp_days'] = self.args.expiry_days
             if self.args.max_size:
                 parser.bkp_vars['max_size'] = self.args.max_size
+            if self.args.catalog:
+                parser.bkp_vars['catalog'] = True
+            elif self.args.no_catalog:
+                parser.bkp_vars['catalog'] = False
+            for keep_var in ('keep_daily', 'keep_weekly', 'keep_monthly',
+                             'keep_yearly'):
+                if getattr(self.args, keep_var) is not None:
+                    parser.bkp_vars[keep_var] = getattr(self.args, keep_var)
+            if self.args.enforce_size:
+                parser.bkp_vars['enforce_size'] = True
+            if self.args.name_dates:
+                parser.bkp_vars['name_dates'] = True
+            if self.args.dry_run:
+                parser.bkp_vars['dry_run'] = True
+            if self.args.plan_file:
+                parser.bkp_vars['plan_file'] = self.args.plan_file
+            if self.args.workers:
+                parser.bkp_vars['workers'] = self.args.workers
+            if self.args.full_reconcile:
+                parser.bkp_vars['full_reconcile'] = True
 
             # Create the trimmer with the specified variables
             trimmer = TrimmerCluster(parser.bkp_vars['bkp_path'],
                                      parser.bkp_vars['prefix'],
                                      parser.bkp_vars['min_n_bkps'],
                                      parser.bkp_vars['exp_days'],
-                                     parser.bkp_vars['max_size'], self.logger)
+                                     parser.bkp_vars['max_size'],
+                                     parser.bkp_vars['catalog'],
+                                     parser.bkp_vars['keep_daily'],
+                                     parser.bkp_vars['keep_weekly'],
+                                     parser.bkp_vars['keep_monthly'],
+                                     parser.bkp_vars['keep_yearly'],
+                                     parser.bkp_vars['enforce_size'],
+                                     parser.bkp_vars['name_dates'],
+                                     parser.bkp_vars['dry_run'],
+                                     parser.bkp_vars['plan_file'],
+                                     parser.bkp_vars['workers'],
+                                     parser.bkp_vars['full_reconcile'],
+                                     self.logger)
         else:
             # Create the trimmer with the console variables
             trimmer = TrimmerCluster(self.args.bkp_folder, self.args.prefix,
                                      self.args.n_backups,
                                      self.args.expiry_days, self.args.max_size,
-                                     self.logger)
+                                     self.args.catalog, self.args.keep_daily,
+                                     self.args.keep_weekly,
+                                     self.args.keep_monthly,
+                                     self.args.keep_yearly,
+                                     self.args.enforce_size,
+                                     self.args.name_dates, self.args.dry_run,
+                                     self.args.plan_file, self.args.workers,
+                                     self.args.full_reconcile, self.logger)
 
         return trimmer
 
@@ -759,6 +994,32 @@ class Orchestrator:
                 parser.bkp_vars['ex_regex'] = ''
             if self.args.db_owner:
                 parser.bkp_vars['db_owner'] = self.args.db_owner
+            if self.args.smart:
+                parser.bkp_vars['smart'] = True
+            if self.args.dead_ratio is not None:
+                parser.bkp_vars['dead_ratio'] = self.args.dead_ratio
+            if self.args.workers:
+                parser.bkp_vars['workers'] = self.args.workers
+            if self.args.jobs:
+                parser.bkp_vars['jobs'] = self.args.jobs
+            if self.args.max_conns is not None:
+                parser.bkp_vars['max_conns'] = self.args.max_conns
+            if self.args.freeze:
+                parser.bkp_vars['freeze'] = True
+            if self.args.freeze_age is not None:
+                parser.bkp_vars['freeze_age'] = self.args.freeze_age
+            if self.args.time_budget is not None:
+                parser.bkp_vars['time_budget'] = self.args.time_budget
+            if self.args.executor:
+                parser.bkp_vars['executor'] = self.args.executor
+            if self.args.analyze:
+                parser.bkp_vars['analyze'] = True
+            if self.args.parallel is not None:
+                parser.bkp_vars['parallel'] = self.args.parallel
+            if self.args.skip_locked:
+                parser.bkp_vars['skip_locked'] = True
+            if self.args.index_cleanup:
+                parser.bkp_vars['index_cleanup'] = self.args.index_cleanup
 
             # Create the vacuumer with the specified variables
             vacuumer = Vacuumer(connecter,
@@ -769,6 +1030,20 @@ class Orchestrator:
                                 parser.bkp_vars['ex_regex'],
                                 parser.bkp_vars['ex_templates'],
                                 parser.bkp_vars['db_owner'],
+                                parser.bkp_vars['smart'],
+                                parser.bkp_vars['dead_ratio'],
+                                parser.bkp_vars['workers'],
+                                parser.bkp_vars['jobs'],
+                                parser.bkp_vars['max_conns'],
+                                parser.bkp_vars['freeze'],
+                                parser.bkp_vars['freeze_age'],
+                                parser.bkp_vars['time_budget'],
+                                parser.bkp_vars['executor'],
+                                parser.bkp_vars['analyze'],
+                                parser.bkp_vars['parallel'],
+                                parser.bkp_vars['skip_locked'],
+                                parser.bkp_vars['index_cleanup'],
+                                parser.bkp_vars['profiles'],
                                 self.logger)
 
         # If the user did not specify a vacuumer config file through console...
@@ -777,6 +1052,19 @@ class Orchestrator:
             # Create the vacuumer with the console variables
             vacuumer = Vacuumer(connecter, in_dbs=self.args.db_name,
                                 db_owner=self.args.db_owner,
+                                smart=self.args.smart,
+                                dead_ratio=self.args.dead_ratio,
+                                workers=self.args.workers,
+                                jobs=self.args.jobs,
+                                max_conns=self.args.max_conns,
+                                freeze=self.args.freeze,
+                                freeze_age=self.args.freeze_age,
+                                time_budget=self.args.time_budget,
+                                executor=self.args.executor,
+                                analyze=self.args.analyze,
+                                parallel=self.args.parallel,
+                                skip_locked=self.args.skip_locked,
+                                index_cleanup=self.args.index_cleanup,
                                 logger=self.logger)
 
         return vacuumer
@@ -840,6 +1128,9 @@ class Orchestrator:
             self.logger.debug(Messenger.BEGINNING_EXE_DB_BACKER)
             backer = self.get_db_backer(connecter)
 
+        # Make the dumps in a standby server if possible
+        backer.dump_connecter = self.get_read_connecter(connecter)
+
         # If necessary, add group and bkp_path to the mailer to be sent within
         # the process information
         if self.args.config_mailer:
@@ -894,6 +1185,8 @@ class Orchestrator:
             backer.backup_cl()  # Make cluster's backup
 
         # Close connection to PostgreSQL
+        if backer.dump_connecter is not connecter:
+            backer.dump_connecter.pg_disconnect()
         connecter.pg_disconnect()
 
     def setup_dropper(self):
@@ -925,6 +1218,13 @@ class Orchestrator:
         connecter = self.get_connecter()
         self.logger.debug(Messenger.BEGINNING_EXE_INFORMER)
         informer = self.get_informer(connecter)
+        # Query the databases, users and version in a standby server if
+        # possible (the connections and times are the main server's ones)
+        if self.args.details_dbs is not None or self.args.list_dbs or \
+                self.args.details_users is not None or \
+                self.args.list_users or self.args.version_pg or \
+                self.args.version_num_pg:
+            informer.read_connecter = self.get_read_connecter(connecter)
 
         if self.args.details_conns is not None:
             informer.show_pg_conns_data()
@@ -947,6 +1247,44 @@ class Orchestrator:
         if self.args.time_up:
             informer.show_pg_time_up()
 
+        # Close connection to PostgreSQL
+        if informer.read_connecter is not connecter:
+            informer.read_connecter.pg_disconnect()
+        connecter.pg_disconnect()
+
+    def setup_reindexer(self):
+        '''
+        Target:
+            - executes the reindexer taking into account the value of its
+              variables.
+        '''
+        connecter = self.get_connecter()
+        self.logger.debug(Messenger.BEGINNING_EXE_REINDEXER)
+        reindexer = self.get_reindexer(connecter)
+
+        # Check if the role of user connected to PostgreSQL is superuser
+        pg_superuser = connecter.is_pg_superuser()
+        if not pg_superuser:
+            # Users who are not superusers will only be able to rebuild the
+            # indexes of the databases they own
+            reindexer.db_owner = connecter.user
+            self.logger.warning(Messenger.ACTION_DB_NO_SUPERUSER)
+
+        # Get PostgreSQL databases' names, connection permissions and owners
+        dbs_all = connecter.get_pg_dbs_data(reindexer.ex_templates,
+                                            reindexer.db_owner)
+
+        # Show and log their names
+        Orchestrator.show_dbs(dbs_all, self.logger)
+
+        # Get the target databases in a list
+        reindex_list = DbSelector.get_filtered_dbs(
+            dbs_all, reindexer.in_dbs, reindexer.ex_dbs, reindexer.in_regex,
+            reindexer.ex_regex, reindexer.in_priority, self.logger)
+
+        # Rebuild the bloated indexes of the target databases
+        reindexer.reindex_dbs(reindex_list)
+
         # Close connection to PostgreSQL
         connecter.pg_disconnect()
 
@@ -985,8 +1323,18 @@ class Orchestrator:
         '''
         Target:
             - restore a specified backup file as a new database or cluster in
-              PostgreSQL.
+              PostgreSQL, or check that the latest backups of a folder are
+              restorable.
         '''
+        if self.args.verify_folder:  # Verify backups in a throwaway cluster
+            verifier = RestorerVerifier(
+                self.args.verify_folder, self.args.verify_sample,
+                self.args.verify_workers, self.args.verify_bin_dir,
+                self.logger)
+            self.logger.debug(Messenger.BEGINNING_EXE_VERIFIER)
+            verifier.verify_bkps()
+            return
+
         connecter = self.get_connecter()
 
         if self.args.cluster:  # Restore a cluster (must be created first)
@@ -1112,8 +1460,9 @@ class Orchestrator:
             self.logger.mailer.add_bkp_path(trimmer.bkp_path)
 
         # Get a list with all the files stored in the specified directory and
-        # its subdirectories, sorted by modification date
-        bkps_list = Dir.sorted_flist(trimmer.bkp_path)
+        # its subdirectories, sorted by modification date (or names' dates)
+        bkps_list = trimmer.get_bkps_list()
+        bkped_dbs = None
 
         if bkps_list:  # If there are any files in the specified directory...
 
@@ -1160,8 +1509,9 @@ class Orchestrator:
                 pg_dbs.append(db['datname'])
 
             # On the other hand, store the databases' names which have a backup
-            # in the specified directory
-            bkped_dbs = Dir.get_dbs_bkped(bkps_list)
+            # in the specified directory (if they were not extracted yet)
+            if bkped_dbs is None:
+                bkped_dbs = Dir.get_dbs_bkped(bkps_list)
 
             # Compare both lists and show the resultant messages
             Dir.show_pg_warnings(pg_dbs, bkped_dbs, self.logger)
@@ -1211,6 +1561,19 @@ class Orchestrator:
         # Close connection to PostgreSQL
         connecter.pg_disconnect()
 
+    def setup_watcher(self):
+        '''
+        Target:
+            - keep the catalog of a backups' directory up to date until the
+              process is terminated.
+        '''
+        self.logger.debug(Messenger.BEGINNING_EXE_WATCHER)
+
+        # Create the watcher with the console variables
+        watcher = Watcher(self.args.bkp_folder, self.args.heartbeat,
+                          self.logger)
+        watcher.watch()
+
     def detect_module(self):
         '''
         Target:
@@ -1246,9 +1609,18 @@ class Orchestrator:
         elif self.action == 'v':  # Call vacuumer
             self.setup_vacuumer()
 
+        elif self.action == 'w':  # Call watcher
+            self.setup_watcher()
+
+        elif self.action == 'x':  # Call reindexer
+            self.setup_reindexer()
+
         else:  # Do nothing
             pass
 
+        # Close the connections kept in the pool
+        ConnecterPool.close_all()
+
         # Send the emails if necessary
         if self.logger.mailer:
             if self.logger.mailer.level <= self.logger.police:
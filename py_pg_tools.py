@@ -134,6 +134,12 @@ if __name__ == '__main__':
 
     backer.add_argument('-o', '--db-owner', help=Messenger.B_DB_OWNER_HELP)
 
+    groupD = backer.add_mutually_exclusive_group()
+    groupD.add_argument('-k', '--catalog', action='store_true',
+                        help=Messenger.B_CATALOG_HELP)
+    groupD.add_argument('-K', '--no-catalog', action='store_true',
+                        help=Messenger.B_NO_CATALOG_HELP)
+
     backer.add_argument('-t', '--terminate', action='store_true',
                         help=Messenger.B_TERMINATE_HELP)
 
@@ -251,6 +257,54 @@ if __name__ == '__main__':
     informer.add_argument('-Lm', '--logger-mute', action='store_true',
                           help=Messenger.LOGGER_MUTE_HELP)
 
+    # ******************************* REINDEXER *******************************
+
+    reindexer = sub_parsers.add_parser('x', help=Messenger.REINDEXER_HELP)
+
+    reindexer.add_argument('-cC', '--config-connection',
+                           help=Messenger.CONFIG_CONNECTION_HELP)
+
+    reindexer.add_argument('-ch', '--pg-host', help=Messenger.HOST_HELP)
+
+    reindexer.add_argument('-cp', '--pg-port', type=int,
+                           help=Messenger.PORT_HELP)
+
+    reindexer.add_argument('-cu', '--pg-user', help=Messenger.USER_HELP)
+
+    reindexer.add_argument('-C', '--config', help=Messenger.RX_CONFIG_HELP)
+
+    reindexer.add_argument('-d', '--db-name', nargs='+',
+                           help=Messenger.RX_DB_NAME_HELP)
+
+    reindexer.add_argument('-o', '--db-owner',
+                           help=Messenger.RX_DB_OWNER_HELP)
+
+    reindexer.add_argument('-r', '--bloat-ratio', type=float,
+                           help=Messenger.RX_BLOAT_RATIO_HELP)
+
+    reindexer.add_argument('-w', '--workers', type=int,
+                           help=Messenger.RX_WORKERS_HELP)
+
+    reindexer.add_argument('-b', '--time-budget', type=int,
+                           help=Messenger.RX_TIME_BUDGET_HELP)
+
+    reindexer.add_argument('-Lc', '--config-logger',
+                           help=Messenger.CONFIG_LOGGER_HELP)
+
+    reindexer.add_argument('-Lf', '--logger-logfile',
+                           help=Messenger.LOGGER_LOGFILE_HELP)
+
+    reindexer.add_argument('-Ll', '--logger-level',
+                           help=Messenger.LOGGER_LEVEL_HELP,
+                           choices=['debug', 'info', 'warning', 'error',
+                                    'critical'])
+
+    reindexer.add_argument('-Lm', '--logger-mute', action='store_true',
+                           help=Messenger.LOGGER_MUTE_HELP)
+
+    reindexer.add_argument('-zc', '--config-mailer',
+                           help=Messenger.CONFIG_MAIL_HELP)
+
     # ****************************** REPLICATOR *******************************
 
     replicator = sub_parsers.add_parser('r', help=Messenger.REPLICATOR_HELP)
@@ -311,10 +365,33 @@ if __name__ == '__main__':
                         help=Messenger.RS_DB_BACKUP_HELP)
     groupA.add_argument('-p', '--cluster-backup',
                         help=Messenger.RS_CLUSTER_BACKUP_HELP)
+    groupA.add_argument('-k', '--catalog', nargs=2,
+                        help=Messenger.RS_CATALOG_HELP)
+    groupA.add_argument('-vf', '--verify-folder',
+                        help=Messenger.RS_VERIFY_FOLDER_HELP)
 
     restorer.add_argument('-c', '--cluster', action='store_true',
                           help=Messenger.RS_CLUSTER_HELP)
 
+    restorer.add_argument('-s', '--swap', action='store_true',
+                          help=Messenger.RS_SWAP_HELP)
+
+    restorer.add_argument('-t', '--table', help=Messenger.RS_TABLE_HELP)
+
+    restorer.add_argument('-n', '--schema', help=Messenger.RS_SCHEMA_HELP)
+
+    restorer.add_argument('-j', '--jobs', type=int,
+                          help=Messenger.RS_JOBS_HELP)
+
+    restorer.add_argument('-vs', '--verify-sample', type=int,
+                          help=Messenger.RS_VERIFY_SAMPLE_HELP)
+
+    restorer.add_argument('-vw', '--verify-workers', type=int,
+                          help=Messenger.RS_VERIFY_WORKERS_HELP)
+
+    restorer.add_argument('-vb', '--verify-bin-dir',
+                          help=Messenger.RS_VERIFY_BIN_DIR_HELP)
+
     restorer.add_argument('-Lc', '--config-logger',
                           help=Messenger.CONFIG_LOGGER_HELP)
 
@@ -435,8 +512,47 @@ if __name__ == '__main__':
     trimmer.add_argument('-e', '--expiry-days', type=int,
                          help=Messenger.TR_EXPIRY_DAYS_HELP)
 
+    trimmer.add_argument('-gd', '--keep-daily', type=int,
+                         help=Messenger.TR_KEEP_DAILY_HELP)
+
+    trimmer.add_argument('-gw', '--keep-weekly', type=int,
+                         help=Messenger.TR_KEEP_WEEKLY_HELP)
+
+    trimmer.add_argument('-gm', '--keep-monthly', type=int,
+                         help=Messenger.TR_KEEP_MONTHLY_HELP)
+
+    trimmer.add_argument('-gy', '--keep-yearly', type=int,
+                         help=Messenger.TR_KEEP_YEARLY_HELP)
+
     trimmer.add_argument('-s', '--max-size', help=Messenger.TR_MAX_SIZE_HELP)
 
+    trimmer.add_argument('-E', '--enforce-size', action='store_true',
+                         help=Messenger.TR_ENFORCE_SIZE_HELP)
+
+    trimmer.add_argument('-S', '--max-total-size',
+                         help=Messenger.TR_MAX_TOTAL_SIZE_HELP)
+
+    trimmer.add_argument('-N', '--name-dates', action='store_true',
+                         help=Messenger.TR_NAME_DATES_HELP)
+
+    trimmer.add_argument('-D', '--dry-run', action='store_true',
+                         help=Messenger.TR_DRY_RUN_HELP)
+
+    trimmer.add_argument('-P', '--plan-file',
+                         help=Messenger.TR_PLAN_FILE_HELP)
+
+    trimmer.add_argument('-w', '--workers', type=int,
+                         help=Messenger.TR_WORKERS_HELP)
+
+    trimmer.add_argument('-F', '--full-reconcile', action='store_true',
+                         help=Messenger.TR_FULL_RECONCILE_HELP)
+
+    groupB = trimmer.add_mutually_exclusive_group()
+    groupB.add_argument('-k', '--catalog', action='store_true',
+                        help=Messenger.TR_CATALOG_HELP)
+    groupB.add_argument('-K', '--no-catalog', action='store_true',
+                        help=Messenger.TR_NO_CATALOG_HELP)
+
     trimmer.add_argument('-Lc', '--config-logger',
                          help=Messenger.CONFIG_LOGGER_HELP)
 
@@ -478,6 +594,46 @@ if __name__ == '__main__':
     vacuumer.add_argument('-t', '--terminate',  action='store_true',
                           help=Messenger.V_TERMINATE_HELP)
 
+    vacuumer.add_argument('-s', '--smart', action='store_true',
+                          help=Messenger.V_SMART_HELP)
+
+    vacuumer.add_argument('-r', '--dead-ratio', type=float,
+                          help=Messenger.V_DEAD_RATIO_HELP)
+
+    vacuumer.add_argument('-w', '--workers', type=int,
+                          help=Messenger.V_WORKERS_HELP)
+
+    vacuumer.add_argument('-j', '--jobs', type=int,
+                          help=Messenger.V_JOBS_HELP)
+
+    vacuumer.add_argument('-m', '--max-conns', type=int,
+                          help=Messenger.V_MAX_CONNS_HELP)
+
+    vacuumer.add_argument('-F', '--freeze', action='store_true',
+                          help=Messenger.V_FREEZE_HELP)
+
+    vacuumer.add_argument('-a', '--freeze-age', type=int,
+                          help=Messenger.V_FREEZE_AGE_HELP)
+
+    vacuumer.add_argument('-b', '--time-budget', type=int,
+                          help=Messenger.V_TIME_BUDGET_HELP)
+
+    vacuumer.add_argument('-e', '--executor', choices=['vacuumdb', 'sql'],
+                          help=Messenger.V_EXECUTOR_HELP)
+
+    vacuumer.add_argument('-z', '--analyze', action='store_true',
+                          help=Messenger.V_ANALYZE_HELP)
+
+    vacuumer.add_argument('-P', '--parallel', type=int,
+                          help=Messenger.V_PARALLEL_HELP)
+
+    vacuumer.add_argument('-k', '--skip-locked', action='store_true',
+                          help=Messenger.V_SKIP_LOCKED_HELP)
+
+    vacuumer.add_argument('-i', '--index-cleanup',
+                          choices=['auto', 'on', 'off'],
+                          help=Messenger.V_INDEX_CLEANUP_HELP)
+
     vacuumer.add_argument('-Lc', '--config-logger',
                           help=Messenger.CONFIG_LOGGER_HELP)
 
@@ -495,6 +651,30 @@ if __name__ == '__main__':
     vacuumer.add_argument('-zc', '--config-mailer',
                           help=Messenger.CONFIG_MAIL_HELP)
 
+    # ******************************** WATCHER ********************************
+
+    watcher = sub_parsers.add_parser('w', help=Messenger.WATCHER_HELP)
+
+    watcher.add_argument('-f', '--bkp-folder',
+                         help=Messenger.W_BKP_FOLDER_HELP)
+
+    watcher.add_argument('-b', '--heartbeat', type=int,
+                         help=Messenger.W_HEARTBEAT_HELP)
+
+    watcher.add_argument('-Lc', '--config-logger',
+                         help=Messenger.CONFIG_LOGGER_HELP)
+
+    watcher.add_argument('-Lf', '--logger-logfile',
+                         help=Messenger.LOGGER_LOGFILE_HELP)
+
+    watcher.add_argument('-Ll', '--logger-level',
+                         help=Messenger.LOGGER_LEVEL_HELP,
+                         choices=['debug', 'info', 'warning', 'error',
+                                  'critical'])
+
+    watcher.add_argument('-Lm', '--logger-mute', action='store_true',
+                         help=Messenger.LOGGER_MUTE_HELP)
+
     # *************************** PARSING SYS.ARGV ****************************
 
     args = arg_parser.parse_args()
@@ -559,6 +739,16 @@ if __name__ == '__main__':
                  and args.pg_user)):
             informer.error(Messenger.CONNECTION_ARGS_ERROR)
 
+    # ************************* REINDEXER REQUIREMENTS ************************
+
+    elif action == 'x':
+        if not (args.config or args.db_name):
+            reindexer.error(Messenger.REINDEXER_ARGS_ERROR)
+        if not (args.config_connection or
+                (args.pg_host and isinstance(args.pg_port, int)
+                 and args.pg_user)):
+            reindexer.error(Messenger.CONNECTION_ARGS_ERROR)
+
     # ************************ REPLICATOR REQUIREMENTS ************************
 
     elif action == 'r':
@@ -573,9 +763,13 @@ if __name__ == '__main__':
 
     elif action == 'R':
         if not (args.config or args.db_backup or
-                (args.cluster and args.cluster_backup)):
+                (args.cluster and args.cluster_backup) or args.catalog or
+                args.verify_folder):
             restorer.error(Messenger.RESTORER_ARGS_ERROR)
-        if not (args.config_connection or
+        if args.catalog and not (args.table or args.schema):
+            restorer.error(Messenger.RESTORER_CATALOG_ARGS_ERROR)
+        # The verification works with its own throwaway cluster
+        if not (args.config_connection or args.verify_folder or
                 (args.pg_host and isinstance(args.pg_port, int)
                  and args.pg_user)):
             restorer.error(Messenger.CONNECTION_ARGS_ERROR)
@@ -606,7 +800,9 @@ if __name__ == '__main__':
             trimmer.error(Messenger.TRIMMER_ARGS_ERROR_1)
         if not (args.config or
                 (isinstance(args.n_backups, int) and
-                 isinstance(args.expiry_days, int))):
+                 (isinstance(args.expiry_days, int) or args.keep_daily or
+                  args.keep_weekly or args.keep_monthly or
+                  args.keep_yearly))):
             trimmer.error(Messenger.TRIMMER_ARGS_ERROR_2)
         if not args.cluster and not \
             (args.config_connection or
@@ -627,6 +823,12 @@ if __name__ == '__main__':
                  and args.pg_user)):
             vacuumer.error(Messenger.CONNECTION_ARGS_ERROR)
 
+    # ************************* WATCHER REQUIREMENTS **************************
+
+    elif action == 'w':
+        if not args.bkp_folder:
+            watcher.error(Messenger.WATCHER_ARGS_ERROR)
+
     else:
         pass
 
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+
+
+import datetime  # To calculate when the time budget runs out
+import queue  # To share the indexes to rebuild among the workers
+
+from concurrent import futures  # To rebuild several indexes at a time
+
+from casting.casting import Casting
+from checker.checker import Checker
+from connecter import ConnecterPool
+from const.const import Default
+from const.const import Messenger
+from const.const import Queries
+from date_tools.date_tools import DateTools
+from logger.logger import Logger
+
+
+class Reindexer:
+
+    in_dbs = []  # List of databases to be included in the process
+    in_regex = ''  # Regular expression which must match the included databases
+    # Flag which determinates whether inclusion conditions predominate over the
+    # exclusion ones
+    in_priority = False
+    ex_dbs = []  # List of databases to be excluded in the process
+    ex_regex = ''  # Regular expression which must match the excluded databases
+    # Flag which determinates whether the templates must be included
+    ex_templates = True
+    # Use other PostgreSQL user during the process (only for superusers)
+    db_owner = ''
+    # Estimated ratio of bloat from which an index is rebuilt
+    bloat_ratio = 0.3
+    workers = 2  # Maximum number of indexes rebuilt at a time
+    # Number of seconds after which no more indexes are rebuilt (0 means no
+    # limit)
+    time_budget = 0
+    deadline = None  # The moment when the time budget runs out
+    # An object with connection parameters to connect to PostgreSQL
+    connecter = None
+    logger = None  # Logger to show and log some messages
+
+    def __init__(self, connecter=None, in_dbs=[], in_regex='',
+                 in_priority=False, ex_dbs=['postgres'], ex_regex='',
+                 ex_templates=True, db_owner='', bloat_ratio=0.3, workers=2,
+                 time_budget=0, logger=None):
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = Logger()
+
+        if connecter:
+            self.connecter = connecter
+        else:
+            self.logger.stop_exe(Messenger.NO_CONNECTION_PARAMS)
+
+        if isinstance(in_dbs, list):
+            self.in_dbs = in_dbs
+        else:
+            self.in_dbs = Casting.str_to_list(in_dbs)
+
+        if Checker.check_regex(in_regex):
+            self.in_regex = in_regex
+        else:
+            self.logger.stop_exe(Messenger.INVALID_IN_REGEX)
+
+        if isinstance(in_priority, bool):
+            self.in_priority = in_priority
+        elif Checker.str_is_bool(in_priority):
+            self.in_priority = Casting.str_to_bool(in_priority)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_IN_PRIORITY)
+
+        if isinstance(ex_dbs, list):
+            self.ex_dbs = ex_dbs
+        else:
+            self.ex_dbs = Casting.str_to_list(ex_dbs)
+
+        if Checker.check_regex(ex_regex):
+            self.ex_regex = ex_regex
+        else:
+            self.logger.stop_exe(Messenger.INVALID_EX_REGEX)
+
+        if isinstance(ex_templates, bool):
+            self.ex_templates = ex_templates
+        elif Checker.str_is_bool(ex_templates):
+            self.ex_templates = Casting.str_to_bool(ex_templates)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_EX_TEMPLATES)
+
+        if db_owner is None:
+            self.db_owner = Default.DB_OWNER
+        else:
+            self.db_owner = db_owner
+
+        if bloat_ratio is None:
+            self.bloat_ratio = Default.BLOAT_RATIO
+        elif Checker.str_is_valid_ratio(bloat_ratio):
+            self.bloat_ratio = Casting.str_to_float(bloat_ratio)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_BLOAT_RATIO)
+
+        if workers is None:
+            self.workers = Default.REINDEX_WORKERS
+        elif Checker.str_is_int(workers) and int(workers) > 0:
+            self.workers = Casting.str_to_int(workers)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_REINDEX_WORKERS)
+
+        if time_budget is None:
+            self.time_budget = Default.TIME_BUDGET
+        elif Checker.str_is_int(time_budget) and int(time_budget) >= 0:
+            self.time_budget = Casting.str_to_int(time_budget)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_TIME_BUDGET)
+
+        message = Messenger.REINDEXER_VARS.format(
+            server=self.connecter.server, user=self.connecter.user,
+            port=self.connecter.port, in_dbs=self.in_dbs,
+            in_regex=self.in_regex, in_priority=self.in_priority,
+            ex_dbs=self.ex_dbs, ex_regex=self.ex_regex,
+            ex_templates=self.ex_templates, db_owner=self.db_owner,
+            bloat_ratio=self.bloat_ratio, workers=self.workers,
+            time_budget=self.time_budget)
+        self.logger.debug(Messenger.REINDEXER_VARS_INTRO)
+        self.logger.debug(message)
+
+    def get_db_connecter(self, dbname):
+        '''
+        Target:
+            - connect to a PostgreSQL database with the parameters of the
+              reindexer's connection.
+        Parameters:
+            - dbname: name of the database to connect to.
+        Return:
+            - a connecter to the database.
+        '''
+        return ConnecterPool.get_connecter(
+            server=self.connecter.server, user=self.connecter.user,
+            port=self.connecter.port, database=dbname, logger=self.logger)
+
+    def is_budget_exhausted(self):
+        '''
+        Target:
+            - check whether the time budget of the process has run out.
+        Return:
+            - a boolean which indicates whether the time budget has run out.
+        '''
+        if self.deadline is None:
+            return False
+
+        return DateTools.get_current_datetime() >= self.deadline
+
+    def get_bloated_indexes(self, dbname):
+        '''
+        Target:
+            - estimate the bloat of the B-tree indexes of a database from the
+              catalog statistics and get those which exceed the threshold.
+        Parameters:
+            - dbname: name of the database whose indexes are checked.
+        Return:
+            - a list of dictionaries with the name, size and estimated bloat
+              (in bytes) of each bloated index, the most bloated first, or
+              None if the statistics could not be got.
+        '''
+        db_connecter = self.get_db_connecter(dbname)
+
+        try:
+            db_connecter.cursor.execute(Queries.GET_PG_INDEXES_BLOAT)
+            indexes = db_connecter.cursor.fetchall()
+        except Exception as e:
+            self.logger.debug('Error en la función "get_bloated_indexes": '
+                              '{}.'.format(str(e)))
+            db_connecter.pg_disconnect()
+            return None
+
+        db_connecter.pg_disconnect()
+
+        bloated_indexes = []
+
+        for index in indexes:
+
+            if index['size'] < Default.REINDEX_MIN_SIZE:
+                continue
+
+            # Pages which would not be needed by a freshly built index
+            extra_pages = index['pages'] - index['expected_pages']
+            ratio = extra_pages / index['pages']
+
+            if ratio >= self.bloat_ratio:
+                bloated_indexes.append({
+                    'index_name': index['index_name'],
+                    'size': index['size'],
+                    'ratio': ratio,
+                    'bloat': int(index['size'] * ratio),
+                })
+
+        bloated_indexes.sort(key=lambda index: index['bloat'], reverse=True)
+
+        return bloated_indexes
+
+    def drop_invalid_indexes(self, db_connecter, index_name):
+        '''
+        Target:
+            - drop the invalid copies of an index which a failed concurrent
+              rebuild leaves behind (named "*_ccnew"), since they are still
+              updated by every write in the table.
+        Parameters:
+            - db_connecter: the connecter to the database of the index.
+            - index_name: name of the index whose rebuild failed.
+        '''
+        try:
+            db_connecter.cursor.execute(Queries.GET_PG_INVALID_CCNEW_INDEXES,
+                                        (index_name, ))
+            invalid_indexes = [row['index_name']
+                               for row in db_connecter.cursor.fetchall()]
+        except Exception as e:
+            self.logger.debug('Error en la función "drop_invalid_indexes": '
+                              '{}.'.format(str(e)))
+            return
+
+        for invalid_index in invalid_indexes:
+            try:
+                db_connecter.cursor.execute(
+                    Queries.DROP_PG_INDEX_CONCURRENTLY.format(
+                        index_name=invalid_index))
+                message = Messenger.INVALID_INDEX_DROPPED.format(
+                    index_name=invalid_index)
+                self.logger.info(message)
+            except Exception as e:
+                self.logger.debug('Error en la función '
+                                  '"drop_invalid_indexes": {}.'.format(str(e)))
+                message = Messenger.INVALID_INDEX_DROP_FAIL.format(
+                    index_name=invalid_index)
+                self.logger.highlight('warning', message, 'yellow')
+
+    def reindex_worker(self, dbname, pending):
+        '''
+        Target:
+            - rebuild the pending indexes of a database, one by one, through
+              a connection of its own, until there are no more indexes or the
+              time budget runs out.
+        Parameters:
+            - dbname: name of the database of the indexes.
+            - pending: a queue with the indexes to rebuild.
+        Return:
+            - a tuple with the number of indexes rebuilt, the number of bytes
+              reclaimed and whether every index could be rebuilt.
+        '''
+        n_reindexed = 0
+        reclaimed = 0
+        success = True
+
+        db_connecter = self.get_db_connecter(dbname)
+
+        while not self.is_budget_exhausted():
+
+            try:
+                index = pending.get_nowait()
+            except queue.Empty:
+                break
+
+            message = Messenger.REINDEXING_INDEX.format(
+                index_name=index['index_name'], ratio=index['ratio'],
+                size=index['size'])
+            self.logger.debug(message)
+
+            try:
+                db_connecter.cursor.execute(
+                    Queries.REINDEX_PG_INDEX_CONCURRENTLY.format(
+                        index_name=index['index_name']))
+                db_connecter.cursor.execute(Queries.GET_PG_RELATION_SIZE,
+                                            (index['index_name'], ))
+                new_size = db_connecter.cursor.fetchone()[0]
+                n_reindexed += 1
+                reclaimed += max(index['size'] - new_size, 0)
+            except Exception as e:
+                self.logger.debug('Error en la función "reindex_worker": '
+                                  '{}.'.format(str(e)))
+                message = Messenger.INDEX_REINDEXER_FAIL.format(
+                    index_name=index['index_name'])
+                self.logger.highlight('warning', message, 'yellow')
+                success = False
+                self.drop_invalid_indexes(db_connecter, index['index_name'])
+
+        db_connecter.pg_disconnect()
+
+        return n_reindexed, reclaimed, success
+
+    def reindex_db(self, dbname):
+        '''
+        Target:
+            - rebuild concurrently the bloated indexes of a PostgreSQL
+              database, the most bloated first.
+        Parameters:
+            - dbname: name of the database whose indexes are rebuilt.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        bloated_indexes = self.get_bloated_indexes(dbname)
+
+        if bloated_indexes is None:
+            return False
+
+        pending = queue.Queue()
+        for index in bloated_indexes:
+            pending.put(index)
+
+        n_reindexed = 0
+        reclaimed = 0
+        success = True
+
+        workers = min(self.workers, len(bloated_indexes))
+
+        if workers:
+            with futures.ThreadPoolExecutor(workers) as executor:
+                tasks = [executor.submit(self.reindex_worker, dbname, pending)
+                         for i in range(workers)]
+                for task in futures.as_completed(tasks):
+                    worker_reindexed, worker_reclaimed, worker_success = \
+                        task.result()
+                    n_reindexed += worker_reindexed
+                    reclaimed += worker_reclaimed
+                    success = success and worker_success
+
+        # Some indexes were left because the time budget ran out
+        if n_reindexed < len(bloated_indexes) and success:
+            success = False
+
+        message = Messenger.DB_REINDEXER_DONE.format(
+            dbname=dbname, n_reindexed=n_reindexed,
+            n_bloated=len(bloated_indexes),
+            reclaimed=round(reclaimed / (1024 * 1024), 2))
+        self.logger.highlight('info', message, 'green')
+
+        return success
+
+    def reindex_dbs(self, reindex_list):
+        '''
+        Target:
+            - rebuild the bloated indexes of a group of PostgreSQL databases.
+        Parameters:
+            - reindex_list: names of the databases whose indexes are going to
+              be rebuilt.
+        '''
+        if self.time_budget:
+            self.deadline = DateTools.get_current_datetime() + \
+                datetime.timedelta(seconds=self.time_budget)
+
+        if reindex_list:
+            self.logger.highlight('info', Messenger.BEGINNING_REINDEXER,
+                                  'white')
+
+        for db in reindex_list:
+
+            dbname = db['datname']
+
+            if self.is_budget_exhausted():
+                message = Messenger.TIME_BUDGET_EXHAUSTED.format(
+                    dbname=dbname)
+                self.logger.highlight('warning', message, 'yellow')
+                continue
+
+            message = Messenger.PROCESSING_DB.format(dbname=dbname)
+            self.logger.highlight('info', message, 'cyan')
+
+            # Let the user know whether the database connection is allowed
+            if not db['datallowconn']:
+                message = Messenger.FORBIDDEN_DB_CONNECTION.format(
+                    dbname=dbname)
+                self.logger.highlight('warning', message, 'yellow',
+                                      effect='bold')
+                success = False
+            else:
+                success = self.reindex_db(dbname)
+
+            if not success:
+                message = Messenger.DB_REINDEXER_FAIL.format(dbname=dbname)
+                self.logger.highlight('warning', message, 'yellow',
+                                      effect='bold')
+
+        self.logger.highlight('info', Messenger.REINDEXER_DONE, 'green',
+                              effect='bold')
@@ -71,8 +71,9 @@ class Replicator:
         try:
             pg_pid = self.connecter.get_pid_str()
             formatted_sql = Queries.BACKEND_PG_DB_EXISTS.format(
-                pg_pid=pg_pid, target_db=self.original_dbname)
-            self.connecter.cursor.execute(formatted_sql)
+                pg_pid=pg_pid)
+            self.connecter.cursor.execute(formatted_sql,
+                                          (self.original_dbname, ))
             result = self.connecter.cursor.fetchone()
 
             if result:
@@ -106,6 +107,7 @@ class Replicator:
             start_time = DateTools.get_current_datetime()
             # Replicate the database
             self.connecter.cursor.execute(formatted_query_clone_pg_db)
+            self.connecter.invalidate_metadata('dbs')
             end_time = DateTools.get_current_datetime()
             # Get and show the process' duration
             diff = DateTools.get_diff_datetimes(start_time, end_time)
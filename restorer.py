@@ -2,14 +2,29 @@
 # -*- encoding: utf-8 -*-
 
 
+import getpass  # To get the name of the current system user
+import json  # To write the verification manifest
 import os  # To check the existance of some files
+import random  # To choose a sample of backups to verify
 import re  # To work with regular expressions
+import shlex  # To quote the names of the objects to restore
+import shutil  # To remove the ephemeral cluster's directory
+import socket  # To find a free port for the ephemeral cluster
 import subprocess  # To execute commands in the shell
-
+import tempfile  # To create the ephemeral cluster's directory
+from concurrent import futures  # To restore several backups at a time
+
+from casting.casting import Casting
+from catalog.catalog import Catalog
+from checker.checker import Checker
+from connecter import Connecter
+from const.const import Default
 from const.const import Messenger
-# from const.const import Default
+from const.const import Queries
 from date_tools.date_tools import DateTools
+from dir_tools.dir_tools import Dir
 from logger.logger import Logger
+from terminator import Terminator
 # from replicator import Replicator
 
 
@@ -20,9 +35,15 @@ class Restorer:
     logger = None  # Logger to show and log some messages
     db_backup = ''  # Absolute path of the backup file (of a database)
     new_dbname = ''  # New name for the database restored in PostgreSQL
+    # Flag which determinates whether the backup must be restored in a shadow
+    # database which replaces the target one at the end of the process
+    swap = False
+    table = ''  # Name of the only table which must be restored (if any)
+    schema = ''  # Name of the only schema which must be restored (if any)
+    jobs = 1  # Number of jobs used by pg_restore to restore the backup
 
     def __init__(self, connecter=None, db_backup='', new_dbname='',
-                 logger=None):
+                 swap=False, table='', schema='', jobs=1, logger=None):
 
         if logger:
             self.logger = logger
@@ -44,28 +65,64 @@ class Restorer:
         else:
             self.logger.stop_exe(Messenger.NO_DBNAME_TO_RESTORE)
 
+        if isinstance(swap, bool):
+            self.swap = swap
+        elif Checker.str_is_bool(swap):
+            self.swap = Casting.str_to_bool(swap)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_SWAP)
+
+        self.table = table or ''
+        self.schema = schema or ''
+
+        # A partial restore cannot replace the whole target database
+        if self.swap and (self.table or self.schema):
+            self.logger.stop_exe(Messenger.INVALID_SELECTIVE_SWAP)
+
+        if jobs is None:
+            self.jobs = Default.RESTORE_JOBS
+        elif Checker.str_is_int(jobs) and int(jobs) > 0:
+            self.jobs = Casting.str_to_int(jobs)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_RESTORE_JOBS)
+
         message = Messenger.DB_RESTORER_VARS.format(
             server=self.connecter.server, user=self.connecter.user,
             port=self.connecter.port, db_backup=self.db_backup,
-            new_dbname=self.new_dbname)
+            new_dbname=self.new_dbname, swap=self.swap, table=self.table,
+            schema=self.schema, jobs=self.jobs)
         self.logger.debug(Messenger.DB_RESTORER_VARS_INTRO)
         self.logger.debug(message)
 
-    def restore_db_backup(self):
+    def get_selective_options(self):
         '''
         Target:
-            - restore a database's backup in PostgreSQL.
+            - get the "pg_restore" arguments which restrict the restore to
+              the specified table or schema.
+        Return:
+            - a string with the arguments (empty to restore everything).
         '''
-        #replicator = Replicator(self.connecter, self.new_dbname,
-                                #Default.RESTORING_TEMPLATE, self.logger)
-        #result = self.connecter.allow_db_conn(Default.RESTORING_TEMPLATE)
-        #if result:
-            #replicator.replicate_pg_db()
-            #self.connecter.disallow_db_conn(Default.RESTORING_TEMPLATE)
-        #else:
-            #self.logger.stop_exe(Messenger.ALLOW_DB_CONN_FAIL.format(
-                #dbname=Default.RESTORING_TEMPLATE))
+        options = []
+
+        if self.schema:
+            options.append('-n {}'.format(shlex.quote(self.schema)))
+        if self.table:
+            options.append('-t {}'.format(shlex.quote(self.table)))
 
+        return ' '.join(options)
+
+    def get_restore_command(self, dbname, options=''):
+        '''
+        Target:
+            - get the command which restores the backup in a database,
+              depending on the type of the backup's file.
+        Parameters:
+            - dbname: name of the database where the backup is going to be
+              restored.
+            - options: extra arguments for "pg_restore".
+        Return:
+            - a string with the command to execute in the shell.
+        '''
         # Regular expression which must match the backup's name
         regex = r'.*db_(.+)_(\d{8}_\d{6}_.+)\.(dump|bz2|gz|zip)$'
         regex = re.compile(regex)
@@ -78,42 +135,98 @@ class Restorer:
         else:
             self.logger.stop_exe(Messenger.NO_BACKUP_FORMAT)
 
-        message = Messenger.BEGINNING_DB_RESTORER.format(
-            db_backup=self.db_backup, new_dbname=self.new_dbname)
-        self.logger.highlight('info', message, 'white')
-        self.logger.info(Messenger.WAIT_PLEASE)
+        if options:
+            options += ' '
 
         if ext == 'gz':
-            command = 'gunzip -c {} -k | pg_restore -U {} -h {} -p {} ' \
-                      '-d {}'.format(self.db_backup, self.connecter.user,
+            command = 'gunzip -c {} -k | pg_restore {}-U {} -h {} -p {} ' \
+                      '-d {}'.format(self.db_backup, options,
+                                     self.connecter.user,
                                      self.connecter.server,
-                                     self.connecter.port, self.new_dbname)
+                                     self.connecter.port, dbname)
         elif ext == 'bz2':
-            command = 'bunzip2 -c {} -k | pg_restore -U {} -h {} -p {} ' \
-                      '-d {}'.format(self.db_backup, self.connecter.user,
+            command = 'bunzip2 -c {} -k | pg_restore {}-U {} -h {} -p {} ' \
+                      '-d {}'.format(self.db_backup, options,
+                                     self.connecter.user,
                                      self.connecter.server,
-                                     self.connecter.port, self.new_dbname)
+                                     self.connecter.port, dbname)
         elif ext == 'zip':
-            command = 'unzip -p {} | pg_restore -U {} -h {} -p {} ' \
-                      '-d {}'.format(self.db_backup, self.connecter.user,
+            command = 'unzip -p {} | pg_restore {}-U {} -h {} -p {} ' \
+                      '-d {}'.format(self.db_backup, options,
+                                     self.connecter.user,
                                      self.connecter.server,
-                                     self.connecter.port, self.new_dbname)
+                                     self.connecter.port, dbname)
         else:
-            command = 'pg_restore -U {} -h {} -p {} -d {} {}'.format(
-                self.connecter.user, self.connecter.server,
-                self.connecter.port, self.new_dbname, self.db_backup)
+            # Only a file can be restored in parallel, not a pipe
+            if self.jobs > 1:
+                options += '-j {} '.format(self.jobs)
+            command = 'pg_restore {}-U {} -h {} -p {} -d {} {}'.format(
+                options, self.connecter.user, self.connecter.server,
+                self.connecter.port, dbname, self.db_backup)
+
+        return command
+
+    def restore_db(self, dbname, options=''):
+        '''
+        Target:
+            - restore the backup in a specified database.
+        Parameters:
+            - dbname: name of the database where the backup is going to be
+              restored.
+            - options: extra arguments for "pg_restore".
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        success = True
+
+        command = self.get_restore_command(dbname, options)
 
         try:
-            start_time = DateTools.get_current_datetime()
             # Make the restauration of the database
             result = subprocess.call(command, shell=True)
-            end_time = DateTools.get_current_datetime()
-            # Get and show the process' duration
-            diff = DateTools.get_diff_datetimes(start_time, end_time)
-
             if result != 0:
                 raise Exception()
 
+        except Exception as e:
+            self.logger.debug('Error en la función "restore_db": '
+                              '{}.'.format(str(e)))
+            success = False
+
+        return success
+
+    def restore_db_backup(self):
+        '''
+        Target:
+            - restore a database's backup in PostgreSQL.
+        '''
+        #replicator = Replicator(self.connecter, self.new_dbname,
+                                #Default.RESTORING_TEMPLATE, self.logger)
+        #result = self.connecter.allow_db_conn(Default.RESTORING_TEMPLATE)
+        #if result:
+            #replicator.replicate_pg_db()
+            #self.connecter.disallow_db_conn(Default.RESTORING_TEMPLATE)
+        #else:
+            #self.logger.stop_exe(Messenger.ALLOW_DB_CONN_FAIL.format(
+                #dbname=Default.RESTORING_TEMPLATE))
+
+        if self.swap:
+            self.restore_db_backup_swap()
+            return
+
+        message = Messenger.BEGINNING_DB_RESTORER.format(
+            db_backup=self.db_backup, new_dbname=self.new_dbname)
+        self.logger.highlight('info', message, 'white')
+        self.logger.info(Messenger.WAIT_PLEASE)
+
+        start_time = DateTools.get_current_datetime()
+        # Make the restauration of the database
+        success = self.restore_db(self.new_dbname,
+                                  self.get_selective_options())
+        end_time = DateTools.get_current_datetime()
+        # Get and show the process' duration
+        diff = DateTools.get_diff_datetimes(start_time, end_time)
+
+        if success:
             message = Messenger.RESTORE_DB_DONE.format(
                 db_backup=self.db_backup, new_dbname=self.new_dbname,
                 diff=diff)
@@ -122,13 +235,201 @@ class Restorer:
             self.logger.highlight('info', Messenger.RESTORER_DONE, 'green',
                                   effect='bold')
 
+        else:
+            message = Messenger.RESTORE_DB_FAIL.format(
+                db_backup=self.db_backup, new_dbname=self.new_dbname)
+            self.logger.stop_exe(message)
+
+    @staticmethod
+    def get_aux_dbname(dbname, tag):
+        '''
+        Target:
+            - generate the name of an auxiliary database (shadow or archive)
+              of a specified one, making sure it does not exceed the maximum
+              length of a PostgreSQL identifier.
+        Parameters:
+            - dbname: name of the database the auxiliary one is related to.
+            - tag: word which identifies the type of the auxiliary database.
+        Return:
+            - a string with the name of the auxiliary database.
+        '''
+        suffix = '_{}_{}'.format(tag, DateTools.get_date('%Y%m%d%H%M%S'))
+        max_len = Default.PG_IDENTIFIER_MAX_LEN - len(suffix)
+
+        return dbname[:max_len] + suffix
+
+    def swap_dbs(self, shadow_dbname, archive_dbname, target_exists):
+        '''
+        Target:
+            - replace the target database with the shadow one. Connections to
+              the target database are disallowed and terminated, and then
+              both databases are renamed, so the outage only lasts the time
+              taken by these operations.
+        Parameters:
+            - shadow_dbname: name of the database which contains the restored
+              backup.
+            - archive_dbname: name which the target database is going to get
+              after the swap.
+            - target_exists: a flag which indicates whether the target
+              database exists in PostgreSQL.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        # The names of the databases are going to change
+        self.connecter.invalidate_metadata('dbs')
+
+        if not target_exists:
+            try:
+                self.connecter.cursor.execute(Queries.RENAME_PG_DB.format(
+                    dbname=shadow_dbname, new_dbname=self.new_dbname))
+                return True
+            except Exception as e:
+                self.logger.debug('Error en la función "swap_dbs": '
+                                  '{}.'.format(str(e)))
+                return False
+
+        # Get the target database's "datallowconn" value
+        datallowconn = self.connecter.get_datallowconn(self.new_dbname)
+
+        # Disallow new connections to the target database before terminating
+        # the current ones, so nobody can connect again until the swap ends
+        if datallowconn:
+            result = self.connecter.disallow_db_conn(self.new_dbname)
+            if not result:
+                message = Messenger.DISALLOW_CONN_TO_PG_DB_FAIL.format(
+                    dbname=self.new_dbname)
+                self.logger.highlight('warning', message, 'yellow')
+
+        terminator = Terminator(self.connecter, target_dbs=[self.new_dbname],
+                                logger=self.logger)
+        terminator.terminate_backend_db(self.new_dbname)
+
+        archived = False
+
+        try:
+            self.connecter.cursor.execute(Queries.RENAME_PG_DB.format(
+                dbname=self.new_dbname, new_dbname=archive_dbname))
+            archived = True
+            self.connecter.cursor.execute(Queries.RENAME_PG_DB.format(
+                dbname=shadow_dbname, new_dbname=self.new_dbname))
+            success = True
+
         except Exception as e:
-            self.logger.debug('Error en la función "restore_db_backup": '
+            self.logger.debug('Error en la función "swap_dbs": {}.'.format(
+                str(e)))
+            success = False
+
+            # Put the target database back in its place
+            if archived:
+                try:
+                    self.connecter.cursor.execute(Queries.RENAME_PG_DB.format(
+                        dbname=archive_dbname, new_dbname=self.new_dbname))
+                    archived = False
+                except Exception as e:
+                    self.logger.debug('Error en la función "swap_dbs": '
+                                      '{}.'.format(str(e)))
+
+        # Leave "datallowconn" of the old database as it was
+        if datallowconn:
+            old_dbname = archive_dbname if archived else self.new_dbname
+            result = self.connecter.allow_db_conn(old_dbname)
+            if not result:
+                message = Messenger.ALLOW_CONN_TO_PG_DB_FAIL.format(
+                    dbname=old_dbname)
+                self.logger.highlight('warning', message, 'yellow')
+
+        return success
+
+    def restore_db_backup_swap(self):
+        '''
+        Target:
+            - restore a database's backup in PostgreSQL without dropping the
+              target database first. The backup is restored in a shadow
+              database while the target one keeps working, and afterwards the
+              shadow database takes the target's name. The old database is
+              kept with an archive name.
+        '''
+        shadow_dbname = Restorer.get_aux_dbname(self.new_dbname, 'shadow')
+        archive_dbname = Restorer.get_aux_dbname(self.new_dbname, 'archive')
+
+        self.connecter.cursor.execute(Queries.PG_DB_EXISTS,
+                                      (self.new_dbname, ))
+        target_exists = bool(self.connecter.cursor.fetchone())
+
+        # The shadow database must belong to the target's owner, so the
+        # privileges of the database do not change after the swap
+        owner = self.connecter.user
+        if target_exists:
+            self.connecter.execute_prepared(Queries.GET_PG_DB_OWNER,
+                                            (self.new_dbname, ))
+            db = self.connecter.cursor.fetchone()
+            if db:
+                owner = db['owner']
+
+        message = Messenger.BEGINNING_DB_SWAP_RESTORER.format(
+            db_backup=self.db_backup, shadow_dbname=shadow_dbname)
+        self.logger.highlight('info', message, 'white')
+        self.logger.info(Messenger.WAIT_PLEASE)
+
+        try:
+            # Create the empty shadow database
+            self.connecter.cursor.execute(Queries.CLONE_PG_DB.format(
+                dbname=shadow_dbname,
+                original_dbname=Default.RESTORING_TEMPLATE, user=owner))
+            self.connecter.invalidate_metadata('dbs')
+        except Exception as e:
+            self.logger.debug('Error en la función "restore_db_backup_swap": '
                               '{}.'.format(str(e)))
             message = Messenger.RESTORE_DB_FAIL.format(
                 db_backup=self.db_backup, new_dbname=self.new_dbname)
             self.logger.stop_exe(message)
 
+        start_time = DateTools.get_current_datetime()
+        # Restore the backup in the shadow database
+        success = self.restore_db(shadow_dbname)
+        end_time = DateTools.get_current_datetime()
+        # Get and show the process' duration
+        diff = DateTools.get_diff_datetimes(start_time, end_time)
+
+        if not success:
+            # Remove the incomplete shadow database
+            try:
+                self.connecter.cursor.execute(
+                    Queries.DROP_PG_DB_QUOTED.format(dbname=shadow_dbname))
+            except Exception as e:
+                self.logger.debug('Error en la función '
+                                  '"restore_db_backup_swap": {}.'.format(
+                                      str(e)))
+            message = Messenger.RESTORE_DB_FAIL.format(
+                db_backup=self.db_backup, new_dbname=self.new_dbname)
+            self.logger.stop_exe(message)
+
+        message = Messenger.RESTORE_DB_DONE.format(
+            db_backup=self.db_backup, new_dbname=shadow_dbname, diff=diff)
+        self.logger.highlight('info', message, 'green')
+
+        message = Messenger.SWAPPING_DBS.format(new_dbname=self.new_dbname)
+        self.logger.highlight('info', message, 'white')
+
+        start_time = DateTools.get_current_datetime()
+        # Replace the target database with the shadow one
+        success = self.swap_dbs(shadow_dbname, archive_dbname, target_exists)
+        end_time = DateTools.get_current_datetime()
+        # Get and show the outage's duration
+        diff = DateTools.get_diff_datetimes(start_time, end_time)
+
+        if success:
+            message = Messenger.SWAP_DB_DONE.format(
+                new_dbname=self.new_dbname, archive_dbname=archive_dbname,
+                diff=diff)
+            self.logger.highlight('info', message, 'green')
+            self.logger.highlight('info', Messenger.RESTORER_DONE, 'green',
+                                  effect='bold')
+        else:
+            message = Messenger.SWAP_DB_FAIL.format(
+                new_dbname=self.new_dbname, shadow_dbname=shadow_dbname)
+            self.logger.stop_exe(message)
+
 
 class RestorerCluster:
 
@@ -227,3 +528,367 @@ class RestorerCluster:
             message = Messenger.RESTORE_CL_FAIL.format(
                 cluster_backup=self.cluster_backup)
             self.logger.stop_exe(message)
+
+
+class RestorerVerifier:
+
+    logger = None  # Logger to show and log some messages
+    bkp_path = ''  # Absolute path of the folder which contains the backups
+    # Number of backups to verify, chosen at random among the latest ones of
+    # each database (0 means every database)
+    sample = 0
+    workers = 2  # Number of backups which are restored at the same time
+    # Directory of the PostgreSQL binaries used to create the ephemeral
+    # cluster (if empty, they are searched in the PATH)
+    pg_bin_dir = ''
+    tmp_dir = ''  # Temporary directory which contains the ephemeral cluster
+    port = None  # Port where the ephemeral cluster listens
+    user = None  # Superuser of the ephemeral cluster
+
+    def __init__(self, bkp_path='', sample=0, workers=2, pg_bin_dir='',
+                 logger=None):
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = Logger()
+
+        if bkp_path and os.path.isdir(bkp_path):
+            self.bkp_path = bkp_path
+        else:
+            self.logger.stop_exe(Messenger.NO_BKPS_DIR_TO_VERIFY)
+
+        if sample is None:
+            self.sample = Default.VERIFY_SAMPLE
+        elif isinstance(sample, int) and sample >= 0:
+            self.sample = sample
+        elif Checker.str_is_int(sample) and int(sample) >= 0:
+            self.sample = Casting.str_to_int(sample)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VERIFY_SAMPLE)
+
+        if workers is None:
+            self.workers = Default.VERIFY_WORKERS
+        elif isinstance(workers, int) and workers > 0:
+            self.workers = workers
+        elif Checker.str_is_int(workers) and int(workers) > 0:
+            self.workers = Casting.str_to_int(workers)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VERIFY_WORKERS)
+
+        if pg_bin_dir:
+            self.pg_bin_dir = pg_bin_dir
+        else:
+            self.pg_bin_dir = Default.PG_BIN_DIR
+
+        self.user = getpass.getuser()
+
+        message = Messenger.VERIFIER_VARS.format(
+            bkp_path=self.bkp_path, sample=self.sample,
+            workers=self.workers, pg_bin_dir=self.pg_bin_dir)
+        self.logger.debug(Messenger.VERIFIER_VARS_INTRO)
+        self.logger.debug(message)
+
+    def get_pg_bin(self, binary):
+        '''
+        Target:
+            - get the path of a PostgreSQL binary.
+        Parameters:
+            - binary: name of the binary.
+        Return:
+            - a string with the path of the binary.
+        '''
+        if self.pg_bin_dir:
+            return os.path.join(self.pg_bin_dir, binary)
+        else:
+            return binary
+
+    @staticmethod
+    def get_free_port():
+        '''
+        Target:
+            - get a free TCP port of the local machine.
+        Return:
+            - an integer with the port.
+        '''
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+
+        return port
+
+    def start_cluster(self):
+        '''
+        Target:
+            - create and start a throwaway PostgreSQL cluster in a temporary
+              directory. It only accepts connections through a Unix socket
+              placed in that directory.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        self.tmp_dir = tempfile.mkdtemp(prefix=Default.VERIFY_TMP_PREFIX)
+        self.port = RestorerVerifier.get_free_port()
+        data_dir = os.path.join(self.tmp_dir, 'data')
+        log_file = os.path.join(self.tmp_dir, 'postgresql.log')
+
+        message = Messenger.STARTING_EPHEMERAL_CLUSTER.format(
+            port=self.port, tmp_dir=self.tmp_dir)
+        self.logger.highlight('info', message, 'white')
+
+        init_command = '{} -D {} -U {} -A trust > /dev/null'.format(
+            self.get_pg_bin('initdb'), data_dir, self.user)
+        start_command = '{} -D {} -l {} -w -o "-p {} -k {} -c ' \
+                        'listen_addresses=\'\'" start > /dev/null'.format(
+                            self.get_pg_bin('pg_ctl'), data_dir, log_file,
+                            self.port, self.tmp_dir)
+
+        try:
+            result = subprocess.call(init_command, shell=True)
+            if result != 0:
+                raise Exception()
+            result = subprocess.call(start_command, shell=True)
+            if result != 0:
+                raise Exception()
+            return True
+
+        except Exception as e:
+            self.logger.debug('Error en la función "start_cluster": '
+                              '{}.'.format(str(e)))
+            return False
+
+    def stop_cluster(self):
+        '''
+        Target:
+            - stop the throwaway PostgreSQL cluster and remove its temporary
+              directory.
+        '''
+        data_dir = os.path.join(self.tmp_dir, 'data')
+        command = '{} -D {} -m immediate -w stop > /dev/null'.format(
+            self.get_pg_bin('pg_ctl'), data_dir)
+
+        try:
+            if os.path.exists(os.path.join(data_dir, 'postmaster.pid')):
+                subprocess.call(command, shell=True)
+        except Exception as e:
+            self.logger.debug('Error en la función "stop_cluster": '
+                              '{}.'.format(str(e)))
+
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def get_latest_bkps(self):
+        '''
+        Target:
+            - get the latest backup of each database stored in the backups'
+              folder, and choose a sample of them if necessary.
+        Return:
+            - a dictionary with the databases' names as keys and the paths of
+              their latest backups as values.
+        '''
+        latest_bkps = {}
+
+        # Regular expression which each backup's name must match
+        regex = r'(.+)?db_(.+)_(\d{8}_\d{6}_.+)\.(?:dump|bz2|gz|zip)$'
+        regex = re.compile(regex)
+
+        # Read the backups from the catalog if a watcher is keeping it up to
+        # date, instead of scanning the folder
+        bkps_list = Catalog.get_watched_bkps(self.bkp_path, self.logger)
+
+        if bkps_list is None:
+            # Keep only the newest backup of each database while the folder
+            # is scanned, instead of listing and sorting every file. The
+            # scanner's threads read the status of the files
+            latest_mtimes = {}
+            for entry in Dir.scan_files(self.bkp_path, stat=True):
+                match = regex.match(entry.name)
+                if match:
+                    dbname = match.group(2)
+                    mtime = entry.stat().st_mtime
+                    if mtime >= latest_mtimes.get(dbname, mtime):
+                        latest_mtimes[dbname] = mtime
+                        latest_bkps[dbname] = Dir.get_entry_path(entry)
+
+        else:
+            # The list is sorted by modification date, so the last backup of
+            # each database overwrites the previous ones
+            for f in bkps_list:
+                match = regex.match(os.path.basename(f))
+                if match:
+                    latest_bkps[match.group(2)] = f
+
+        if self.sample and self.sample < len(latest_bkps):
+            dbnames = random.sample(sorted(latest_bkps), self.sample)
+            latest_bkps = {dbname: latest_bkps[dbname] for dbname in dbnames}
+
+        return latest_bkps
+
+    def get_connecter(self, dbname=None):
+        '''
+        Target:
+            - connect to the throwaway PostgreSQL cluster.
+        Parameters:
+            - dbname: name of the database to connect to.
+        Return:
+            - a connecter to the throwaway PostgreSQL cluster.
+        '''
+        return Connecter(server=self.tmp_dir, user=self.user, port=self.port,
+                         database=dbname, logger=self.logger)
+
+    def verify_bkp(self, dbname, db_backup):
+        '''
+        Target:
+            - restore a backup in the throwaway PostgreSQL cluster and check
+              the result.
+        Parameters:
+            - dbname: name of the database the backup belongs to.
+            - db_backup: absolute path of the backup file.
+        Return:
+            - a dictionary with the results of the verification.
+        '''
+        record = {
+            'dbname': dbname,
+            'verified_at': DateTools.get_date(),
+            'success': False,
+            'duration': None,
+            'throughput': None,
+            'n_tables': None,
+            'n_rows': None,
+        }
+
+        connecter = self.get_connecter()
+        # Backups are restored without owners or privileges, because the
+        # roles of the original cluster do not exist in the throwaway one
+        restorer = Restorer(connecter, db_backup, dbname, logger=self.logger)
+
+        start_time = DateTools.get_current_datetime()
+        success = restorer.restore_db(dbname, Default.VERIFY_RESTORE_OPTIONS)
+        end_time = DateTools.get_current_datetime()
+        connecter.pg_disconnect()
+
+        seconds = (end_time - start_time).total_seconds()
+        size = os.path.getsize(db_backup)
+        record['duration'] = round(seconds, 2)
+        if seconds > 0:
+            record['throughput'] = round(size / (1024 * 1024) / seconds, 2)
+
+        if not success:
+            return record
+
+        connecter = self.get_connecter(dbname)
+
+        try:
+            # Update the statistics to get realistic row estimates
+            connecter.cursor.execute(Queries.ANALYZE_PG_DB)
+            connecter.cursor.execute(Queries.GET_PG_DB_TABLES_STATS)
+            stats = connecter.cursor.fetchone()
+            record['n_tables'] = stats['n_tables']
+            record['n_rows'] = stats['n_rows']
+            record['success'] = True
+
+        except Exception as e:
+            connecter.conn.rollback()
+            self.logger.debug('Error en la función "verify_bkp": '
+                              '{}.'.format(str(e)))
+
+        connecter.pg_disconnect()
+
+        return record
+
+    def write_manifest(self, records):
+        '''
+        Target:
+            - store the results of the verification in the manifest of the
+              backups' folder, keeping the results of previous verifications
+              of other backups.
+        Parameters:
+            - records: a dictionary with the backups' paths as keys and the
+              results of their verification as values.
+        '''
+        manifest = os.path.join(self.bkp_path, Default.VERIFY_MANIFEST)
+        content = {'backups': {}}
+
+        try:
+            if os.path.isfile(manifest):
+                with open(manifest) as f:
+                    content = json.load(f)
+            content['backups'].update(records)
+            content['last_verification'] = DateTools.get_date()
+
+            with open(manifest, 'w') as f:
+                json.dump(content, f, indent=4, sort_keys=True)
+
+        except Exception as e:
+            self.logger.debug('Error en la función "write_manifest": '
+                              '{}.'.format(str(e)))
+            message = Messenger.VERIFY_MANIFEST_FAIL.format(manifest=manifest)
+            self.logger.highlight('warning', message, 'yellow')
+
+    def verify_bkps(self):
+        '''
+        Target:
+            - restore the latest backups of the folder in a throwaway
+              PostgreSQL cluster, in parallel, and record which of them are
+              restorable.
+        '''
+        latest_bkps = self.get_latest_bkps()
+
+        if not latest_bkps:
+            message = Messenger.NO_BKPS_TO_VERIFY.format(
+                bkp_path=self.bkp_path)
+            self.logger.highlight('warning', message, 'yellow',
+                                  effect='bold')
+            return
+
+        if not self.start_cluster():
+            self.stop_cluster()
+            self.logger.stop_exe(Messenger.EPHEMERAL_CLUSTER_FAIL)
+
+        records = {}
+
+        try:
+            connecter = self.get_connecter()
+            for dbname in latest_bkps:
+                connecter.cursor.execute(Queries.CLONE_PG_DB.format(
+                    dbname=dbname, original_dbname=Default.RESTORING_TEMPLATE,
+                    user=self.user))
+            connecter.pg_disconnect()
+
+            message = Messenger.VERIFYING_BKPS.format(
+                n_bkps=len(latest_bkps))
+            self.logger.highlight('info', message, 'white')
+            self.logger.info(Messenger.WAIT_PLEASE)
+
+            with futures.ThreadPoolExecutor(self.workers) as executor:
+                tasks = {
+                    executor.submit(self.verify_bkp, dbname, db_backup):
+                    db_backup for dbname, db_backup in latest_bkps.items()
+                }
+                for task in futures.as_completed(tasks):
+                    db_backup = tasks[task]
+                    record = task.result()
+                    records[db_backup] = record
+
+                    if record['success']:
+                        message = Messenger.VERIFY_BKP_DONE.format(
+                            db_backup=db_backup,
+                            n_tables=record['n_tables'],
+                            n_rows=record['n_rows'],
+                            throughput=record['throughput'],
+                            duration=record['duration'])
+                        self.logger.highlight('info', message, 'green')
+                    else:
+                        message = Messenger.VERIFY_BKP_FAIL.format(
+                            db_backup=db_backup)
+                        self.logger.highlight('warning', message, 'yellow',
+                                              effect='bold')
+
+        finally:
+            self.stop_cluster()
+
+        self.write_manifest(records)
+
+        n_passed = len([r for r in records.values() if r['success']])
+        message = Messenger.VERIFIER_DONE.format(
+            n_passed=n_passed, n_failed=len(records) - n_passed)
+        self.logger.highlight('info', message, 'green', effect='bold')
@@ -55,6 +55,42 @@ class Terminator:
         self.logger.debug(Messenger.TERMINATOR_VARS_INTRO)
         self.logger.debug(message)
 
+    def terminate_backends(self, query, params=None, prepared=False):
+        '''
+        Target:
+            - run a query which terminates some connections, reading its
+              result a few rows at a time, as there may be lots of them.
+        Parameters:
+            - query: the query which terminates the connections.
+            - params: the values of the placeholders of the query.
+            - prepared: a flag which determinates whether the query must be
+              prepared instead of streamed, because it is run many times (a
+              prepared statement cannot be read through a server-side
+              cursor).
+        Return:
+            - the number of connections found and the number of them which
+              were terminated.
+        '''
+        n_matched = 0
+        n_terminated = 0
+
+        if prepared:
+            self.connecter.execute_prepared(query, params or ())
+            rows = self.connecter.cursor.fetchall()
+        else:
+            rows = self.connecter.stream_query(query, params)
+
+        for row in rows:
+            n_matched += 1
+            if row[0]:
+                n_terminated += 1
+
+        message = Messenger.N_TERMINATED_CONNS.format(
+            n_terminated=n_terminated, n_matched=n_matched)
+        self.logger.debug(message)
+
+        return n_matched, n_terminated
+
     def terminate_backend_user(self):
         '''
         Target:
@@ -65,6 +101,9 @@ class Terminator:
             target_user=self.target_user)
         self.logger.highlight('info', message, 'white')
 
+        n_matched = 0
+        n_terminated = 0
+
         try:
             pg_pid = self.connecter.get_pid_str()  # Get PID variable's name
 
@@ -78,23 +117,27 @@ class Terminator:
                 self.logger.highlight('warning', message, 'yellow')
 
             else:
-                formatted_sql = Queries.BACKEND_PG_USER_EXISTS.format(
+                formatted_sql = Queries.TERMINATE_BACKEND_PG_USER.format(
                     pg_pid=pg_pid, target_user=self.target_user)
-                self.connecter.cursor.execute(formatted_sql)
-                result = self.connecter.cursor.fetchone()
-
-                if result:
-                    formatted_sql = Queries.TERMINATE_BACKEND_PG_USER.format(
-                        pg_pid=pg_pid, target_user=self.target_user)
-                    self.connecter.cursor.execute(formatted_sql)
-                else:
+
+                n_matched, n_terminated = self.terminate_backends(
+                    formatted_sql)
+
+                if not n_matched:
                     message = Messenger.NO_USER_CONNS.format(
                         target_user=self.target_user)
                     self.logger.info(message)
 
-            message = Messenger.TERMINATE_USER_CONN_DONE.format(
-                target_user=self.target_user)
-            self.logger.highlight('info', message, 'green')
+            # Some connections were found but could not be terminated
+            if n_terminated < n_matched:
+                message = Messenger.TERMINATE_USER_CONN_FAIL.format(
+                    target_user=self.target_user)
+                self.logger.highlight('warning', message, 'yellow',
+                                      effect='bold')
+            else:
+                message = Messenger.TERMINATE_USER_CONN_DONE.format(
+                    target_user=self.target_user)
+                self.logger.highlight('info', message, 'green')
 
         except Exception as e:
             self.logger.debug('Error en la función "terminate_backend_user": '
@@ -119,25 +162,26 @@ class Terminator:
 
             pg_pid = self.connecter.get_pid_str()  # Get PID variable's name
 
-            formatted_sql = Queries.BACKEND_PG_DB_EXISTS.format(
-                pg_pid=pg_pid, target_db=target_db)
-
-            self.connecter.cursor.execute(formatted_sql)
-            result = self.connecter.cursor.fetchone()
+            formatted_sql = Queries.TERMINATE_BACKEND_PG_DB.format(
+                pg_pid=pg_pid)
 
-            if result:
+            # This query is run once per database, so it is prepared
+            n_matched, n_terminated = self.terminate_backends(
+                formatted_sql, (target_db, ), prepared=True)
 
-                formatted_sql = Queries.TERMINATE_BACKEND_PG_DB.format(
-                    pg_pid=pg_pid, target_db=target_db)
-
-                self.connecter.cursor.execute(formatted_sql)
+            if not n_matched:
+                message = Messenger.NO_DB_CONNS.format(target_db=target_db)
+                self.logger.info(message)
 
-                message = Messenger.TERMINATE_DB_CONN_DONE.format(
+            # Some connections were found but could not be terminated
+            elif n_terminated < n_matched:
+                message = Messenger.TERMINATE_DB_CONN_FAIL.format(
                     target_dbname=target_db)
-                self.logger.info(message)
+                self.logger.highlight('warning', message, 'yellow')
 
             else:
-                message = Messenger.NO_DB_CONNS.format(target_db=target_db)
+                message = Messenger.TERMINATE_DB_CONN_DONE.format(
+                    target_dbname=target_db)
                 self.logger.info(message)
 
         except Exception as e:
@@ -181,20 +225,23 @@ class Terminator:
 
             pg_pid = self.connecter.get_pid_str()  # Get PID variable's name
 
-            formatted_sql = Queries.BACKEND_PG_ALL_EXISTS.format(pg_pid=pg_pid)
+            formatted_sql = Queries.TERMINATE_BACKEND_PG_ALL.format(
+                pg_pid=pg_pid)
 
-            self.connecter.cursor.execute(formatted_sql)
-            result = self.connecter.cursor.fetchone()
+            n_matched, n_terminated = self.terminate_backends(formatted_sql)
 
-            if result:
-                formatted_sql = Queries.TERMINATE_BACKEND_PG_ALL.format(
-                    pg_pid=pg_pid)
-                self.connecter.cursor.execute(formatted_sql)
-            else:
+            if not n_matched:
                 self.logger.info(Messenger.NO_CONNS)
 
-            self.logger.highlight('info', Messenger.TERMINATE_ALL_CONN_DONE,
-                                  'green')
+            # Some connections were found but could not be terminated
+            if n_terminated < n_matched:
+                message = Messenger.TERMINATE_ALL_CONN_FAIL
+                self.logger.highlight('warning', message, 'yellow',
+                                      effect='bold')
+            else:
+                self.logger.highlight('info',
+                                      Messenger.TERMINATE_ALL_CONN_DONE,
+                                      'green')
 
         except Exception as e:
             self.logger.debug('Error en la función "terminate_backend_all": '
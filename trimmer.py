@@ -2,12 +2,16 @@
 # -*- encoding: utf-8 -*-
 
 
+from concurrent import futures  # To remove several backups at a time
+import json  # To write the trim plan
 from math import ceil  # To round up some values
 import os  # To work with directories and files
 import re  # To work with regular expressions
+import sys  # To write the trim plan in the standard output
 import time  # To calculate time intervals
 
 from casting.casting import Casting
+from catalog.catalog import Catalog
 from checker.checker import Checker
 from const.const import Default
 from const.const import Messenger
@@ -16,7 +20,256 @@ from dir_tools.dir_tools import Dir
 from logger.logger import Logger
 
 
-class Trimmer:
+class TrimPlan:
+
+    bkp_path = ''  # The path where the backups are stored
+    # Flag which determinates whether the backups must not be removed (only
+    # the plan is shown)
+    dry_run = False
+    plan_file = ''  # Path of the file where the plan is written (JSON)
+    workers = 4  # Maximum number of backups' files removed at a time
+    bkps = []  # Backups to remove, with the reason and their size
+    logger = None  # Logger to show and log some messages
+
+    def __init__(self, bkp_path='', dry_run=False, plan_file='', workers=4,
+                 logger=None):
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = Logger()
+
+        self.bkp_path = bkp_path
+        self.dry_run = dry_run
+        self.plan_file = plan_file
+        self.workers = workers
+        self.bkps = []
+
+    def add_bkp(self, bkp_path, reason, bkp_size=None):
+        '''
+        Target:
+            - add a backup to the list of backups to remove.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+            - reason: the condition which makes the backup be removed.
+            - bkp_size: the size in Bytes of the backup.
+        '''
+        self.bkps.append({'path': bkp_path, 'reason': reason,
+                          'size': bkp_size})
+
+    def write_plan(self):
+        '''
+        Target:
+            - write the plan in JSON format in the specified file, or in the
+              standard output if no file was specified (the console log is
+              written in the standard error, so the output is only the plan
+              and can be parsed).
+        '''
+        plan = {
+            'bkp_path': self.bkp_path,
+            'dry_run': self.dry_run,
+            'date': DateTools.get_date(),
+            'n_bkps': len(self.bkps),
+            'tsize': sum(bkp['size'] or 0 for bkp in self.bkps),
+            'bkps': self.bkps,
+        }
+        plan = json.dumps(plan, indent=4, sort_keys=True)
+
+        if self.plan_file:
+            try:
+                with open(self.plan_file, 'w') as f:
+                    f.write(plan + '\n')
+                message = Messenger.TRIM_PLAN_WRITTEN.format(
+                    plan_file=self.plan_file)
+                self.logger.info(message)
+
+            except Exception as e:
+                self.logger.debug('Error en la función "write_plan": '
+                                  '{}.'.format(str(e)))
+                message = Messenger.TRIM_PLAN_FAIL.format(
+                    plan_file=self.plan_file)
+                self.logger.highlight('warning', message, 'yellow')
+        else:
+            sys.stdout.write(plan + '\n')
+            sys.stdout.flush()
+
+    def apply_plan(self):
+        '''
+        Target:
+            - remove the backups of the plan, several at a time, and then the
+              directories which turned empty.
+        Return:
+            - a list with the removed backups.
+        '''
+        removed = []
+
+        with futures.ThreadPoolExecutor(self.workers) as executor:
+            tasks = {executor.submit(os.unlink, bkp['path']): bkp['path']
+                     for bkp in self.bkps}
+            for task in futures.as_completed(tasks):
+                try:
+                    task.result()
+                    self.logger.info(Messenger.TRIM_REMOVE_DONE % tasks[task])
+                    removed.append(tasks[task])
+                except Exception as e:
+                    self.logger.debug('Error en la función "apply_plan": '
+                                      '{}.'.format(str(e)))
+                    self.logger.highlight(
+                        'warning', Messenger.TRIM_REMOVE_FAIL % tasks[task],
+                        'yellow')
+
+        # Remove the directories which could be empty after the trim (only
+        # the ones which lost some files)
+        if removed:
+            touched_dirs = {os.path.dirname(f) for f in removed}
+            Dir.remove_empty_dirs(self.bkp_path, touched_dirs)
+
+        return removed
+
+    def execute(self):
+        '''
+        Target:
+            - remove the backups of the plan, or only show the plan in a dry
+              run. The plan is also written if a file was specified.
+        Return:
+            - a list with the removed backups.
+        '''
+        if self.dry_run:
+            self.write_plan()
+            message = Messenger.TRIM_DRY_RUN.format(n_bkps=len(self.bkps))
+            self.logger.highlight('info', message, 'yellow')
+            return []
+
+        if self.plan_file:
+            self.write_plan()
+
+        if not self.bkps:
+            return []
+
+        message = Messenger.APPLYING_TRIM_PLAN.format(n_bkps=len(self.bkps),
+                                                      workers=self.workers)
+        self.logger.info(message)
+
+        return self.apply_plan()
+
+
+class TrimmerBase:
+    '''This class gathers the work shared by the trimmers of the databases'
+    and the clusters' backups: listing the backups (from the catalog or the
+    directory), getting their dates and sizes, and planning and applying
+    their removal. The trimmers must set the attributes used here
+    ("bkp_path", "catalog", "full_reconcile", "bkps_catalog", "bkps_data",
+    "bkps_sizes", "name_dates", "trim_plan" and "logger").
+    '''
+
+    def get_bkps_list(self):
+        '''
+        Target:
+            - get every file stored in the specified directory (and its
+              subdirectories) sorted by modification date (or by the date
+              written in their names). If the catalog is used, it is
+              synchronised with the directory first (unless a watcher is
+              keeping it up to date) and only the backups are listed.
+        Return:
+            - a sorted list with the files.
+        '''
+        if self.catalog:
+            self.bkps_catalog = Catalog(Catalog.locate(self.bkp_path),
+                                        self.logger)
+            # The catalog does not need to be synchronised if a watcher is
+            # keeping it up to date (unless a full synchronisation is asked)
+            if (not self.full_reconcile and
+                    self.bkps_catalog.is_watched(self.bkp_path)) or \
+                    self.bkps_catalog.reconcile(self.bkp_path,
+                                                self.full_reconcile):
+                bkps_data = self.bkps_catalog.get_bkps(self.bkp_path)
+                self.bkps_data = {bkp[0]: bkp for bkp in bkps_data}
+                bkps_list = [bkp[0] for bkp in bkps_data]
+                if self.name_dates:
+                    bkps_list.sort(key=lambda f: Dir.get_bkp_timestamp(f) or 0)
+                return bkps_list
+
+            # Scan the directory if the catalog is not available
+            self.logger.highlight('warning', Messenger.CATALOG_SYNC_FAIL,
+                                  'yellow')
+            self.close_catalog()
+
+        return Dir.sorted_flist(self.bkp_path, self.name_dates)
+
+    def get_bkp_ctime(self, bkp_path):
+        '''
+        Target:
+            - get the change date of a backup, or the date written in its name
+              if the names' dates must be used.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+        Return:
+            - a float with the date (in seconds since the epoch).
+        '''
+        if self.name_dates:
+            bkp_time = Dir.get_bkp_timestamp(bkp_path)
+            if bkp_time is not None:
+                return bkp_time
+
+        if self.bkps_catalog:
+            return self.bkps_data[bkp_path][3]
+        else:
+            return os.stat(bkp_path).st_ctime
+
+    def get_bkps_sizes(self, bkps_list):
+        '''
+        Target:
+            - give the size in Bytes of each backup of a list. Every size is
+              read only once (from the catalog, if used) during the execution.
+        Parameters:
+            - bkps_list: a list with some backups' absolute paths.
+        Return:
+            - a dictionary with the backups as keys and their sizes as values.
+        '''
+        for f in bkps_list:
+            if f not in self.bkps_sizes:
+                if self.bkps_catalog:
+                    self.bkps_sizes[f] = self.bkps_data[f][1]
+                else:
+                    self.bkps_sizes[f] = os.stat(f).st_size
+
+        return self.bkps_sizes
+
+    def remove_bkp(self, bkp_path, reason):
+        '''
+        Target:
+            - add a backup's file to the trim plan, to be removed once every
+              backup has been analysed.
+        Parameters:
+            - bkp_path: absolute path of the backup file.
+            - reason: the condition which makes the backup be removed.
+        '''
+        bkp_size = self.get_bkps_sizes([bkp_path])[bkp_path]
+        self.trim_plan.add_bkp(bkp_path, reason, bkp_size)
+
+    def apply_trim_plan(self):
+        '''
+        Target:
+            - remove the backups' files of the trim plan (or only show the plan
+              in a dry run) and their entries in the catalog.
+        '''
+        removed = self.trim_plan.execute()
+
+        if self.bkps_catalog:
+            for bkp_path in removed:
+                self.bkps_catalog.remove_bkp(bkp_path)
+
+    def close_catalog(self):
+        '''
+        Target:
+            - close the catalog if it is being used.
+        '''
+        if self.bkps_catalog:
+            self.bkps_catalog.close()
+            self.bkps_catalog = None
+
+
+class Trimmer(TrimmerBase):
 
     bkp_path = ''  # The path where the backups are stored
     prefix = ''  # The prefix of the backups' names
@@ -37,6 +290,38 @@ class Trimmer:
     equivalence = 10 ** 6
     # Flag which determinates whether show alerts about PostgreSQL
     pg_warnings = True
+    # Flag which determinates whether the backups must be listed from the
+    # catalog instead of scanning the directory
+    catalog = False
+    # Flag which determinates whether every directory and backup must be read
+    # again to synchronise the catalog (and not only the changed directories)
+    full_reconcile = False
+    bkps_catalog = None  # The catalog of the backups (if used)
+    # Path, size, modification and change dates of the catalogued backups
+    bkps_data = {}
+    # Grandfather-father-son retention: number of daily, weekly, monthly and
+    # yearly backups to keep (if all of them are 0, expiry days are used)
+    keep_daily = 0
+    keep_weekly = 0
+    keep_monthly = 0
+    keep_yearly = 0
+    # Flag which determinates whether the oldest backups must be removed when
+    # the size of a group of database's backups exceeds the maximum size
+    enforce_size = False
+    # Maximum size of all the trimmed databases' backups together
+    max_total_size = None
+    # Maximum size in Bytes of all the trimmed databases' backups together
+    max_total_size_bytes = None
+    bkps_sizes = {}  # Sizes of the backups analysed in this execution
+    # Flag which determinates whether the age and order of the backups must be
+    # taken from the dates written in their names instead of their status
+    name_dates = False
+    # Flag which determinates whether the backups must not be removed (only
+    # the trim plan is shown)
+    dry_run = False
+    plan_file = ''  # Path of the file where the trim plan is written
+    workers = 4  # Maximum number of backups' files removed at a time
+    trim_plan = None  # The backups to remove, computed before removing them
     # An object with connection parameters to connect to PostgreSQL
     connecter = None
     logger = None  # Logger to show and log some messages
@@ -44,7 +329,10 @@ class Trimmer:
     def __init__(self, bkp_path='', prefix='', in_dbs=[], in_regex='',
                  in_priority=False, ex_dbs=[], ex_regex='', min_n_bkps=1,
                  exp_days=365, max_size='10000MB', pg_warnings=True,
-                 connecter=None, logger=None):
+                 catalog=False, keep_daily=0, keep_weekly=0, keep_monthly=0,
+                 keep_yearly=0, enforce_size=False, max_total_size='',
+                 name_dates=False, dry_run=False, plan_file='', workers=4,
+                 full_reconcile=False, connecter=None, logger=None):
 
         if logger:
             self.logger = logger
@@ -127,6 +415,85 @@ class Trimmer:
         else:
             self.logger.stop_exe(Messenger.INVALID_PG_WARNINGS)
 
+        if isinstance(catalog, bool):
+            self.catalog = catalog
+        elif Checker.str_is_bool(catalog):
+            self.catalog = Casting.str_to_bool(catalog)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_CATALOG)
+
+        if full_reconcile is None:
+            self.full_reconcile = Default.FULL_RECONCILE
+        elif isinstance(full_reconcile, bool):
+            self.full_reconcile = full_reconcile
+        elif Checker.str_is_bool(full_reconcile):
+            self.full_reconcile = Casting.str_to_bool(full_reconcile)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_FULL_RECONCILE)
+
+        gfs_keeps = {
+            'keep_daily': keep_daily,
+            'keep_weekly': keep_weekly,
+            'keep_monthly': keep_monthly,
+            'keep_yearly': keep_yearly,
+        }
+        for gfs_var, keep in gfs_keeps.items():
+            if keep is None:
+                keep = Default.GFS_KEEP
+            elif Checker.str_is_int(keep) and int(keep) >= 0:
+                keep = Casting.str_to_int(keep)
+            else:
+                self.logger.stop_exe(Messenger.INVALID_GFS_KEEP)
+            setattr(self, gfs_var, keep)
+
+        if isinstance(enforce_size, bool):
+            self.enforce_size = enforce_size
+        elif Checker.str_is_bool(enforce_size):
+            self.enforce_size = Casting.str_to_bool(enforce_size)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_ENFORCE_SIZE)
+
+        if isinstance(name_dates, bool):
+            self.name_dates = name_dates
+        elif Checker.str_is_bool(name_dates):
+            self.name_dates = Casting.str_to_bool(name_dates)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_NAME_DATES)
+
+        if isinstance(dry_run, bool):
+            self.dry_run = dry_run
+        elif Checker.str_is_bool(dry_run):
+            self.dry_run = Casting.str_to_bool(dry_run)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_DRY_RUN)
+
+        if plan_file is None:
+            self.plan_file = Default.PLAN_FILE
+        else:
+            self.plan_file = plan_file
+
+        if workers is None:
+            self.workers = Default.TRIM_WORKERS
+        elif Checker.str_is_int(workers) and int(workers) > 0:
+            self.workers = Casting.str_to_int(workers)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_TRIM_WORKERS)
+
+        self.trim_plan = TrimPlan(self.bkp_path, self.dry_run, self.plan_file,
+                                  self.workers, self.logger)
+
+        if not max_total_size:
+            self.max_total_size = None
+        elif Checker.str_is_valid_max_size(max_total_size):
+            # Split the size and unit of measure and get the size in Bytes
+            self.max_total_size = Casting.str_to_max_size(max_total_size)
+            self.max_total_size_bytes = self.max_total_size['size'] * \
+                Casting.get_equivalence(self.max_total_size['unit'])
+        else:
+            self.logger.stop_exe(Messenger.INVALID_MAX_TOTAL_SIZE)
+
+        self.bkps_sizes = {}
+
         if self.pg_warnings:
             if connecter:
                 self.connecter = connecter
@@ -138,20 +505,131 @@ class Trimmer:
             in_regex=self.in_regex, in_priority=self.in_priority,
             ex_dbs=self.ex_dbs, ex_regex=self.ex_regex,
             min_n_bkps=self.min_n_bkps, exp_days=self.exp_days,
-            max_size=self.max_size, pg_warnings=self.pg_warnings)
+            max_size=self.max_size, pg_warnings=self.pg_warnings,
+            catalog=self.catalog, full_reconcile=self.full_reconcile,
+            keep_daily=self.keep_daily, keep_weekly=self.keep_weekly,
+            keep_monthly=self.keep_monthly, keep_yearly=self.keep_yearly,
+            enforce_size=self.enforce_size,
+            max_total_size=self.max_total_size, name_dates=self.name_dates,
+            dry_run=self.dry_run, plan_file=self.plan_file,
+            workers=self.workers)
         self.logger.debug(Messenger.DB_TRIMMER_VARS_INTRO)
         self.logger.debug(message)
 
+    @staticmethod
+    def get_gfs_bkps(bkps_list, keep_daily=0, keep_weekly=0, keep_monthly=0,
+                     keep_yearly=0, min_n_bkps=0):
+        '''
+        Target:
+            - select the backups which must be kept according to a
+              grandfather-father-son policy: the newest backup of each of the
+              last days, weeks, months and years which have backups. The dates
+              are read from the backups' names, so every backup is bucketed in
+              a single pass once they are sorted.
+        Parameters:
+            - bkps_list: list of backups of a database or cluster.
+            - keep_daily: number of daily backups to keep.
+            - keep_weekly: number of weekly backups to keep.
+            - keep_monthly: number of monthly backups to keep.
+            - keep_yearly: number of yearly backups to keep.
+            - min_n_bkps: number of newest backups to keep in any case.
+        Return:
+            - a set with the backups which must be kept.
+        '''
+        bkps_to_keep = set()
+        dated_bkps = []
+
+        for f in bkps_list:
+            bkp_dt = Dir.get_bkp_datetime(f)
+            if bkp_dt:
+                dated_bkps.append((bkp_dt, f))
+            else:  # Backups without a valid date in their names are kept
+                bkps_to_keep.add(f)
+
+        dated_bkps.sort(reverse=True)  # Newest backups first
+
+        keeps = {'daily': keep_daily, 'weekly': keep_weekly,
+                 'monthly': keep_monthly, 'yearly': keep_yearly}
+        # Periods which already have a newer backup kept
+        periods = {'daily': set(), 'weekly': set(), 'monthly': set(),
+                   'yearly': set()}
+
+        for i, (bkp_dt, f) in enumerate(dated_bkps):
+
+            keep = i < min_n_bkps
+
+            bkp_periods = {
+                'daily': bkp_dt.date(),
+                'weekly': bkp_dt.isocalendar()[:2],
+                'monthly': (bkp_dt.year, bkp_dt.month),
+                'yearly': bkp_dt.year,
+            }
+            for gfs_type, period in bkp_periods.items():
+                if period not in periods[gfs_type] and \
+                        len(periods[gfs_type]) < keeps[gfs_type]:
+                    periods[gfs_type].add(period)
+                    keep = True
+
+            if keep:
+                bkps_to_keep.add(f)
+
+        return bkps_to_keep
+
+    @staticmethod
+    def get_bkps_to_evict(bkps_groups, bkps_sizes, max_size_bytes,
+                          min_n_bkps=0, bkps_order=None):
+        '''
+        Target:
+            - select the oldest backups which must be removed to make some
+              groups of backups fit in a maximum size. The newest backups of
+              each group (as many as the minimum number of backups to keep) are
+              never selected. The sizes are not read again after each deletion.
+        Parameters:
+            - bkps_groups: a dictionary with lists of backups (sorted from the
+              oldest to the newest) as values.
+            - bkps_sizes: a dictionary with the size of each backup.
+            - max_size_bytes: the maximum size in Bytes of all the groups.
+            - min_n_bkps: number of newest backups of each group to keep.
+            - bkps_order: a dictionary with the position of each backup when
+              all of them are sorted from the oldest to the newest (only
+              necessary if there is more than one group).
+        Return:
+            - a list with the backups to remove.
+        '''
+        tsize = 0
+        candidates = []
+
+        for bkps_list in bkps_groups.values():
+            tsize += sum(bkps_sizes[f] for f in bkps_list)
+            # The newest backups of the group are never removed
+            candidates.extend(bkps_list[:max(len(bkps_list) - min_n_bkps, 0)])
+
+        if bkps_order:
+            candidates.sort(key=bkps_order.get)
+
+        bkps_to_evict = []
+
+        for f in candidates:
+            if tsize <= max_size_bytes:
+                break
+            bkps_to_evict.append(f)
+            tsize -= bkps_sizes[f]
+
+        return bkps_to_evict
+
     def trim_db(self, dbname, db_bkps_list):
         '''
         Target:
             - remove (if necessary) some database's backups, taking into
               account some parameters in the following order: minimum number of
-              backups to keep > obsolete backups.
+              backups to keep > obsolete backups (or grandfather-father-son
+              retention, if specified).
         Parameters:
             - dbname: name of the database whose backups are going to be
               trimmed.
             - db_bkps_list: list of backups of a database to analyse and trim.
+        Return:
+            - a list with the database's backups which have been kept.
         '''
         if self.exp_days == -1:  # No expiration date
             x_days_ago = None
@@ -170,56 +648,69 @@ class Trimmer:
 
         start_time = DateTools.get_current_datetime()
 
-        for f in db_bkps_list:
+        # Grandfather-father-son retention
+        if self.keep_daily or self.keep_weekly or self.keep_monthly or \
+                self.keep_yearly:
 
-            # Break if number of backups do not exceed the minimum
-            if num_bkps <= self.min_n_bkps:
-                break
+            bkps_to_keep = Trimmer.get_gfs_bkps(
+                db_bkps_list, self.keep_daily, self.keep_weekly,
+                self.keep_monthly, self.keep_yearly, self.min_n_bkps)
+
+            for f in db_bkps_list:
+                if f not in bkps_to_keep:
+                    self.logger.info(Messenger.GFS_BACKUP_PLANNED % f)
+                    self.remove_bkp(f, 'gfs')
+                    unlinked = True
 
-            file_info = os.stat(f)
+            # Update the list of database's backups
+            db_bkps_lt = [f for f in db_bkps_list if f in bkps_to_keep]
 
-            # Obsolete backup
-            if x_days_ago and file_info.st_ctime < x_days_ago:
+        else:
+            for f in db_bkps_list:
+
+                # Break if number of backups do not exceed the minimum
+                if num_bkps <= self.min_n_bkps:
+                    break
+
+                # Obsolete backup
+                if x_days_ago and self.get_bkp_ctime(f) < x_days_ago:
+
+                    self.logger.info(Messenger.OBSOLETE_BACKUP_PLANNED % f)
+                    self.remove_bkp(f, 'obsolete')
+                    unlinked = True
+                    # Update the number of backups of the database
+                    num_bkps -= 1
+                    # Update the list of database's backups
+                    db_bkps_lt.remove(f)
+
+        # Get the size of each backup in Bytes
+        bkps_sizes = self.get_bkps_sizes(db_bkps_lt)
+        # Get total size of the backups in Bytes
+        tsize = sum(bkps_sizes[f] for f in db_bkps_lt)
 
-                self.logger.info(Messenger.DELETING_OBSOLETE_BACKUP % f)
-                os.unlink(f)  # Remove backup's file
+        # Remove the oldest backups until the total size does not exceed the
+        # maximum (keeping the minimum number of backups anyway)
+        if self.enforce_size and tsize > self.max_size_bytes:
+
+            bkps_to_evict = Trimmer.get_bkps_to_evict(
+                {dbname: db_bkps_lt}, bkps_sizes, self.max_size_bytes,
+                self.min_n_bkps)
+
+            for f in bkps_to_evict:
+                self.logger.info(Messenger.OVERSIZED_BACKUP_PLANNED % f)
+                self.remove_bkp(f, 'max_size')
                 unlinked = True
-                # Update the number of backups of the database
-                num_bkps -= 1
-                db_bkps_lt.remove(f)  # Update the list of database's backups
+                tsize -= bkps_sizes[f]  # Update total size after deletion
+
+            # Update the list of database's backups
+            bkps_to_evict = set(bkps_to_evict)
+            db_bkps_lt = [f for f in db_bkps_lt if f not in bkps_to_evict]
 
         end_time = DateTools.get_current_datetime()
 
-        # Get total size of the backups in Bytes
-        tsize = Dir.get_files_tsize(db_bkps_lt)
         # Get total size of the backups in the selected unit of measure
         tsize_unit = ceil(tsize / self.equivalence)
 
-        ## UNCOMMENT NEXT SECTION TO PROCEDURE WITH THE BACKUP'S DELETION IF
-        ## THEIR TOTAL SIZE EXCEEDS THE SPECIFIED MAXIMUM SIZE
-
-        #db_bkps_list = db_bkps_lt[:]
-
-        #for f in db_bkps_list:
-            ## If there are less backups than the minimum required...
-            #if num_bkps <= self.min_n_bkps:
-                #break
-            #if tsize <= self.max_size_bytes:
-                #break
-            #else:
-                #file_info = os.stat(f)
-                #self.logger.info('Tamaño de copias de seguridad en disco '
-                                 #'mayor que {} {}: eliminando el archivo '
-                                 #'{}...' % (self.max_size['size'],
-                                            #self.max_size['unit'], f))
-                #os.unlink(f)  # Remove backup's file
-                #unlinked = True
-                ## Update the number of backups of the database
-                #num_bkps -= 1
-                ## Update the list of database's backups
-                ## db_bkps_lt.remove(f)
-                #tsize -= file_info.st_size  # Update total size after deletion
-
         if not unlinked:
 
             message = Messenger.NO_DB_BACKUP_DELETED.format(dbname=dbname)
@@ -237,16 +728,20 @@ class Trimmer:
         self.logger.highlight('info', Messenger.DB_TRIMMER_DONE.format(
             dbname=dbname, diff=diff), 'green')
 
-    def trim_dbs(self, bkps_list, dbs_to_clean):
+        return db_bkps_lt
+
+    def group_db_bkps(self, bkps_list, dbs_to_clean):
         '''
         Target:
-            - remove (if necessary) some backups of a group of databases,
-              taking into account some parameters in the following order:
-              minimum number of backups to keep > obsolete backups.
+            - split a list of backups by the database they belong to, parsing
+              each file's name only once.
         Parameters:
             - bkps_list: list of backups found in the specified directory.
-            - dbs_to_clean: name of the database whose backups are going to be
-              trimmed.
+            - dbs_to_clean: names of the databases whose backups are going to
+              be trimmed.
+        Return:
+            - a dictionary with the databases' names as keys and the lists of
+              their backups (in the same order as in bkps_list) as values.
         '''
         # If not prefix specified, trim all the backups (not only the ones
         # without prefix)
@@ -257,44 +752,93 @@ class Trimmer:
             regex = r'(.+)?db_(.+)_(\d{8}_\d{6}_.+)\.(?:dump|bz2|gz|zip)$'
         regex = re.compile(regex)
 
-        for dbname in dbs_to_clean:
+        db_bkps = {dbname: [] for dbname in dbs_to_clean}
+
+        for file in bkps_list:
+
+            # Extract file's name from the absolute path and check if it
+            # matches regex (it means that file is a backup)
+            match = regex.match(os.path.basename(file))
 
-            db_bkps_list = []
+            # If that backup belongs to a database which has to be trimmed,
+            # append it to the group of database's backups
+            if match and match.group(2) in db_bkps:
+                db_bkps[match.group(2)].append(file)
 
-            for file in bkps_list:
+        return db_bkps
 
-                # Extract file's name from the absolute path
-                filename = os.path.basename(file)
+    def trim_total_size(self, bkps_list, db_bkps):
+        '''
+        Target:
+            - remove the oldest backups of any database until all the trimmed
+              databases' backups together do not exceed the maximum total
+              size, keeping the minimum number of backups of each database.
+        Parameters:
+            - bkps_list: list of backups found in the specified directory
+              (sorted from the oldest to the newest).
+            - db_bkps: a dictionary with the databases' names as keys and the
+              lists of their kept backups as values.
+        '''
+        bkps_sizes = self.get_bkps_sizes(
+            [f for db_bkps_list in db_bkps.values() for f in db_bkps_list])
+        tsize = sum(bkps_sizes[f] for db_bkps_list in db_bkps.values()
+                    for f in db_bkps_list)
 
-                # If file matches regex (it means that file is a backup)
-                if re.match(regex, filename):
+        if tsize > self.max_total_size_bytes:
 
-                    # Extract parts of the name ([prefix], dbname, date)
-                    parts = regex.search(filename).groups()
-                    # Store the database's name whose this backup belongs to
-                    fdbname = parts[1]
+            # Position of each backup to sort all of them by date
+            bkps_order = {f: i for i, f in enumerate(bkps_list)}
 
-                    # If that backup belongs to a database which is has to be
-                    # trimmed
-                    if dbname == fdbname:
-                        # Append backup to the group of database's backups
-                        db_bkps_list.append(file)
-                    else:
-                        continue
-                else:
-                    continue
+            bkps_to_evict = Trimmer.get_bkps_to_evict(
+                db_bkps, bkps_sizes, self.max_total_size_bytes,
+                self.min_n_bkps, bkps_order)
+
+            for f in bkps_to_evict:
+                self.logger.info(Messenger.OVERSIZED_BACKUP_PLANNED % f)
+                self.remove_bkp(f, 'max_total_size')
+                tsize -= bkps_sizes[f]  # Update total size after deletion
+
+        if tsize > self.max_total_size_bytes:  # Total size exceeds the maximum
+
+            equivalence = Casting.get_equivalence(self.max_total_size['unit'])
+            message = Messenger.TOTAL_BKPS_SIZE_EXCEEDED.format(
+                tsize_unit=ceil(tsize / equivalence),
+                size=self.max_total_size['size'],
+                unit=self.max_total_size['unit'])
+            self.logger.highlight('warning', message, 'yellow', effect='bold')
+
+    def trim_dbs(self, bkps_list, dbs_to_clean):
+        '''
+        Target:
+            - remove (if necessary) some backups of a group of databases,
+              taking into account some parameters in the following order:
+              minimum number of backups to keep > obsolete backups.
+        Parameters:
+            - bkps_list: list of backups found in the specified directory.
+            - dbs_to_clean: name of the database whose backups are going to be
+              trimmed.
+        '''
+        db_bkps = self.group_db_bkps(bkps_list, dbs_to_clean)
+
+        for dbname in dbs_to_clean:
 
             # Remove (if necessary) some backups of the specified database
-            self.trim_db(dbname, db_bkps_list)
+            db_bkps[dbname] = self.trim_db(dbname, db_bkps[dbname])
+
+        if self.max_total_size:
+            self.trim_total_size(bkps_list, db_bkps)
+
+        # Remove the selected backups and the directories which could be
+        # empty after the trim
+        self.apply_trim_plan()
 
-        # Remove directories which could be empty after the trim
-        Dir.remove_empty_dirs(self.bkp_path)
+        self.close_catalog()
 
         self.logger.highlight('info', Messenger.TRIMMER_DONE, 'green',
                               effect='bold')
 
 
-class TrimmerCluster:
+class TrimmerCluster(TrimmerBase):
 
     bkp_path = ''  # The path where the backups are stored
     prefix = ''  # The prefix of the backups' names
@@ -306,10 +850,41 @@ class TrimmerCluster:
     # Related to max_size, equivalence to turn the specified unit of measure in
     # the max_size variable into Bytes
     equivalence = 10 ** 6
+    # Flag which determinates whether the backups must be listed from the
+    # catalog instead of scanning the directory
+    catalog = False
+    # Flag which determinates whether every directory and backup must be read
+    # again to synchronise the catalog (and not only the changed directories)
+    full_reconcile = False
+    bkps_catalog = None  # The catalog of the backups (if used)
+    # Path, size, modification and change dates of the catalogued backups
+    bkps_data = {}
+    # Grandfather-father-son retention: number of daily, weekly, monthly and
+    # yearly backups to keep (if all of them are 0, expiry days are used)
+    keep_daily = 0
+    keep_weekly = 0
+    keep_monthly = 0
+    keep_yearly = 0
+    # Flag which determinates whether the oldest backups must be removed when
+    # the size of the cluster's backups exceeds the maximum size
+    enforce_size = False
+    bkps_sizes = {}  # Sizes of the backups analysed in this execution
+    # Flag which determinates whether the age and order of the backups must be
+    # taken from the dates written in their names instead of their status
+    name_dates = False
+    # Flag which determinates whether the backups must not be removed (only
+    # the trim plan is shown)
+    dry_run = False
+    plan_file = ''  # Path of the file where the trim plan is written
+    workers = 4  # Maximum number of backups' files removed at a time
+    trim_plan = None  # The backups to remove, computed before removing them
     logger = None  # Logger to show and log some messages
 
     def __init__(self, bkp_path='', prefix='', min_n_bkps=1, exp_days=365,
-                 max_size=5000, logger=None):
+                 max_size=5000, catalog=False, keep_daily=0, keep_weekly=0,
+                 keep_monthly=0, keep_yearly=0, enforce_size=False,
+                 name_dates=False, dry_run=False, plan_file='', workers=4,
+                 full_reconcile=False, logger=None):
 
         if logger:
             self.logger = logger
@@ -358,10 +933,85 @@ class TrimmerCluster:
         # Get the specified size in Bytes
         self.max_size_bytes = self.max_size['size'] * self.equivalence
 
+        if isinstance(catalog, bool):
+            self.catalog = catalog
+        elif Checker.str_is_bool(catalog):
+            self.catalog = Casting.str_to_bool(catalog)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_CATALOG)
+
+        if full_reconcile is None:
+            self.full_reconcile = Default.FULL_RECONCILE
+        elif isinstance(full_reconcile, bool):
+            self.full_reconcile = full_reconcile
+        elif Checker.str_is_bool(full_reconcile):
+            self.full_reconcile = Casting.str_to_bool(full_reconcile)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_FULL_RECONCILE)
+
+        gfs_keeps = {
+            'keep_daily': keep_daily,
+            'keep_weekly': keep_weekly,
+            'keep_monthly': keep_monthly,
+            'keep_yearly': keep_yearly,
+        }
+        for gfs_var, keep in gfs_keeps.items():
+            if keep is None:
+                keep = Default.GFS_KEEP
+            elif Checker.str_is_int(keep) and int(keep) >= 0:
+                keep = Casting.str_to_int(keep)
+            else:
+                self.logger.stop_exe(Messenger.INVALID_GFS_KEEP)
+            setattr(self, gfs_var, keep)
+
+        if isinstance(enforce_size, bool):
+            self.enforce_size = enforce_size
+        elif Checker.str_is_bool(enforce_size):
+            self.enforce_size = Casting.str_to_bool(enforce_size)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_ENFORCE_SIZE)
+
+        if isinstance(name_dates, bool):
+            self.name_dates = name_dates
+        elif Checker.str_is_bool(name_dates):
+            self.name_dates = Casting.str_to_bool(name_dates)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_NAME_DATES)
+
+        if isinstance(dry_run, bool):
+            self.dry_run = dry_run
+        elif Checker.str_is_bool(dry_run):
+            self.dry_run = Casting.str_to_bool(dry_run)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_DRY_RUN)
+
+        if plan_file is None:
+            self.plan_file = Default.PLAN_FILE
+        else:
+            self.plan_file = plan_file
+
+        if workers is None:
+            self.workers = Default.TRIM_WORKERS
+        elif Checker.str_is_int(workers) and int(workers) > 0:
+            self.workers = Casting.str_to_int(workers)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_TRIM_WORKERS)
+
+        self.trim_plan = TrimPlan(self.bkp_path, self.dry_run, self.plan_file,
+                                  self.workers, self.logger)
+
+        self.bkps_sizes = {}
+
         message = Messenger.CL_TRIMMER_VARS.format(
             bkp_path=self.bkp_path, prefix=self.prefix,
             min_n_bkps=self.min_n_bkps, exp_days=self.exp_days,
-            max_size=self.max_size)
+            max_size=self.max_size, catalog=self.catalog,
+            full_reconcile=self.full_reconcile,
+            keep_daily=self.keep_daily, keep_weekly=self.keep_weekly,
+            keep_monthly=self.keep_monthly, keep_yearly=self.keep_yearly,
+            enforce_size=self.enforce_size, name_dates=self.name_dates,
+            dry_run=self.dry_run, plan_file=self.plan_file,
+            workers=self.workers)
         self.logger.debug(Messenger.CL_TRIMMER_VARS_INTRO)
         self.logger.debug(message)
 
@@ -370,7 +1020,8 @@ class TrimmerCluster:
         Target:
             - remove (if necessary) some cluster's backups, taking into
               account some parameters in the following order: minimum number of
-              backups to keep > obsolete backups.
+              backups to keep > obsolete backups (or grandfather-father-son
+              retention, if specified).
         Parameters:
             - ht_bkps_list: list of backups of a cluster to analyse and trim.
         '''
@@ -390,55 +1041,69 @@ class TrimmerCluster:
 
         start_time = DateTools.get_current_datetime()
 
-        for f in ht_bkps_list:
+        # Grandfather-father-son retention
+        if self.keep_daily or self.keep_weekly or self.keep_monthly or \
+                self.keep_yearly:
 
-            # Break if number of backups do not exceed the minimum
-            if num_bkps <= self.min_n_bkps:
-                break
+            bkps_to_keep = Trimmer.get_gfs_bkps(
+                ht_bkps_list, self.keep_daily, self.keep_weekly,
+                self.keep_monthly, self.keep_yearly, self.min_n_bkps)
+
+            for f in ht_bkps_list:
+                if f not in bkps_to_keep:
+                    self.logger.info(Messenger.GFS_BACKUP_PLANNED % f)
+                    self.remove_bkp(f, 'gfs')
+                    unlinked = True
+
+            # Update the list of cluster's backups
+            ht_bkps_lt = [f for f in ht_bkps_list if f in bkps_to_keep]
 
-            file_info = os.stat(f)
+        else:
+            for f in ht_bkps_list:
+
+                # Break if number of backups do not exceed the minimum
+                if num_bkps <= self.min_n_bkps:
+                    break
+
+                # Obsolete backup
+                if x_days_ago and self.get_bkp_ctime(f) < x_days_ago:
+
+                    self.logger.info(Messenger.OBSOLETE_BACKUP_PLANNED % f)
+                    self.remove_bkp(f, 'obsolete')
+                    unlinked = True
+                    # Update the number of backups of the database
+                    num_bkps -= 1
+                    # Update the list of cluster's backups
+                    ht_bkps_lt.remove(f)
+
+        # Get the size of each backup in Bytes
+        bkps_sizes = self.get_bkps_sizes(ht_bkps_lt)
+        # Get total size of the backups in Bytes
+        tsize = sum(bkps_sizes[f] for f in ht_bkps_lt)
 
-            # Obsolete backup
-            if x_days_ago and file_info.st_ctime < x_days_ago:
+        # Remove the oldest backups until the total size does not exceed the
+        # maximum (keeping the minimum number of backups anyway)
+        if self.enforce_size and tsize > self.max_size_bytes:
 
-                self.logger.info(Messenger.DELETING_OBSOLETE_BACKUP % f)
-                os.unlink(f)  # Remove backup's file
+            bkps_to_evict = Trimmer.get_bkps_to_evict(
+                {'cluster': ht_bkps_lt}, bkps_sizes, self.max_size_bytes,
+                self.min_n_bkps)
+
+            for f in bkps_to_evict:
+                self.logger.info(Messenger.OVERSIZED_BACKUP_PLANNED % f)
+                self.remove_bkp(f, 'max_size')
                 unlinked = True
-                # Update the number of backups of the database
-                num_bkps -= 1
-                ht_bkps_lt.remove(f)  # Update the list of cluster's backups
+                tsize -= bkps_sizes[f]  # Update total size after deletion
+
+            # Update the list of cluster's backups
+            bkps_to_evict = set(bkps_to_evict)
+            ht_bkps_lt = [f for f in ht_bkps_lt if f not in bkps_to_evict]
 
         end_time = DateTools.get_current_datetime()
 
-        # Get total size of the backups in Bytes
-        tsize = Dir.get_files_tsize(ht_bkps_lt)
         # Get total size of the backups in the selected unit of measure
         tsize_unit = ceil(tsize / self.equivalence)
 
-        ## UNCOMMENT NEXT SECTION TO PROCEDURE WITH THE BACKUP'S DELETION IF
-        ## THEIR TOTAL SIZE EXCEEDS THE SPECIFIED MAXIMUM SIZE
-
-        #ht_bkps_list = ht_bkps_lt[:]
-
-        #for f in ht_bkps_list:
-            ## If there are less backups than the minimum required...
-            #if num_bkps <= self.min_n_bkps:
-                #break
-            #if tsize <= self.max_size_bytes:
-                #break
-            #else:
-                #file_info = os.stat(f)
-                #self.logger.info('Tamaño de copias de seguridad en disco '
-                                 #'mayor que {} {}: eliminando el archivo '
-                                 #'{}...' % (self.max_size['size'],
-                                            #self.max_size['unit'], f))
-                #os.unlink(f)  # Remove backup's file
-                #unlinked = True
-                ## Update the number of backups of the cluster
-                #num_bkps -= 1
-                ## ht_bkps_lt.remove(f)  # Update the list of cluster's backups
-                #tsize -= file_info.st_size  # Update total size after deletion
-
         if not unlinked:
 
             message = Messenger.NO_CL_BACKUP_DELETED
@@ -461,7 +1126,8 @@ class TrimmerCluster:
         Target:
             - remove (if necessary) some backups of a cluster, taking into
               account some parameters in the following order: minimum number of
-              backups to keep > obsolete backups.
+              backups to keep > obsolete backups (or grandfather-father-son
+              retention, if specified).
         Parameters:
             - bkps_list: list of backups found in the specified directory.
         '''
@@ -495,12 +1161,15 @@ class TrimmerCluster:
 
             # Remove (if necessary) some backups of the cluster
             self.trim_cluster(ht_bkps_list)
-            # Remove directories which could be empty after the trim
-            Dir.remove_empty_dirs(self.bkp_path)
+            # Remove the selected backups and the directories which could be
+            # empty after the trim
+            self.apply_trim_plan()
 
         else:
             self.logger.highlight('warning', Messenger.NO_BACKUP_IN_DIR,
                                   'yellow', effect='bold')
 
+        self.close_catalog()
+
         self.logger.highlight('info', Messenger.TRIMMER_DONE, 'green',
                               effect='bold')
@@ -2,12 +2,18 @@
 # -*- encoding: utf-8 -*-
 
 
+import datetime  # To calculate when the time budget runs out
+import os  # To pass the cost settings of a profile to vacuumdb
 import subprocess  # To execute some commands in the shell
 
+from concurrent import futures  # To vacuum several databases at a time
+
 from casting.casting import Casting
 from checker.checker import Checker
+from connecter import ConnecterPool
 from const.const import Default
 from const.const import Messenger
+from const.const import Queries
 from date_tools.date_tools import DateTools
 from logger.logger import Logger
 
@@ -25,13 +31,54 @@ class Vacuumer:
     ex_templates = True
     # Use other PostgreSQL user during the backup process (only for superusers)
     db_owner = ''
+    # Flag which determinates whether only the tables with dead tuples must be
+    # vacuumed
+    smart = False
+    # Ratio of dead tuples from which a table is vacuumed in smart mode
+    dead_ratio = 0.2
+    workers = 1  # Maximum number of databases vacuumed at a time
+    jobs = 1  # Number of connections used by vacuumdb in each database
+    # Maximum number of connections opened at a time by the vacuum (0 means
+    # no limit)
+    max_conns = 0
+    # Flag which determinates whether the tables must be frozen, oldest first,
+    # instead of vacuumed
+    freeze = False
+    # Age of the transaction ids from which a database or table is frozen
+    freeze_age = 150000000
+    # Number of seconds after which no more databases or tables are processed
+    # (0 means no limit)
+    time_budget = 0
+    deadline = None  # The moment when the time budget runs out
+    # Tool which runs the vacuum of a whole database: "vacuumdb" or "sql"
+    # (VACUUM statements sent through the connection to the database)
+    executor = 'vacuumdb'
+    analyze = False  # Flag which determinates whether to analyze the tables
+    # Number of parallel workers used to vacuum the indexes of each table (0
+    # lets PostgreSQL decide)
+    parallel = 0
+    # Flag which determinates whether the tables which cannot be locked at
+    # once are skipped
+    skip_locked = False
+    # Whether the indexes are cleaned up: "auto", "on" or "off"
+    index_cleanup = 'auto'
+    timings = {}  # Seconds taken to vacuum each table of each database
+    # Vacuum settings (cost delay, cost limit, parallel workers and databases
+    # vacuumed at a time) to apply during some time windows
+    profiles = []
+    profile_name = None  # Name of the last profile applied
     # An object with connection parameters to connect to PostgreSQL
     connecter = None
     logger = None  # Logger to show and log some messages
 
     def __init__(self, connecter=None, in_dbs=[], in_regex='',
                  in_priority=False, ex_dbs=['postgres'], ex_regex='',
-                 ex_templates=True, db_owner='', logger=None):
+                 ex_templates=True, db_owner='', smart=False,
+                 dead_ratio=0.2, workers=1, jobs=1, max_conns=0,
+                 freeze=False, freeze_age=150000000, time_budget=0,
+                 executor='vacuumdb', analyze=False, parallel=0,
+                 skip_locked=False, index_cleanup='auto', profiles=[],
+                 logger=None):
 
         if logger:
             self.logger = logger
@@ -82,21 +129,465 @@ class Vacuumer:
         else:
             self.db_owner = db_owner
 
+        if smart is None:
+            self.smart = Default.SMART_VACUUM
+        elif isinstance(smart, bool):
+            self.smart = smart
+        elif Checker.str_is_bool(smart):
+            self.smart = Casting.str_to_bool(smart)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_SMART)
+
+        if dead_ratio is None:
+            self.dead_ratio = Default.DEAD_RATIO
+        elif Checker.str_is_valid_ratio(dead_ratio):
+            self.dead_ratio = Casting.str_to_float(dead_ratio)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_DEAD_RATIO)
+
+        if workers is None:
+            self.workers = Default.VACUUM_WORKERS
+        elif Checker.str_is_int(workers) and int(workers) > 0:
+            self.workers = Casting.str_to_int(workers)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VACUUM_WORKERS)
+
+        if jobs is None:
+            self.jobs = Default.VACUUM_JOBS
+        elif Checker.str_is_int(jobs) and int(jobs) > 0:
+            self.jobs = Casting.str_to_int(jobs)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VACUUM_JOBS)
+
+        if max_conns is None:
+            self.max_conns = Default.VACUUM_MAX_CONNS
+        elif Checker.str_is_int(max_conns) and int(max_conns) >= 0:
+            self.max_conns = Casting.str_to_int(max_conns)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VACUUM_MAX_CONNS)
+
+        if freeze is None:
+            self.freeze = Default.FREEZE
+        elif isinstance(freeze, bool):
+            self.freeze = freeze
+        elif Checker.str_is_bool(freeze):
+            self.freeze = Casting.str_to_bool(freeze)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_FREEZE)
+
+        if freeze_age is None:
+            self.freeze_age = Default.FREEZE_AGE
+        elif Checker.str_is_int(freeze_age) and int(freeze_age) >= 0:
+            self.freeze_age = Casting.str_to_int(freeze_age)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_FREEZE_AGE)
+
+        if time_budget is None:
+            self.time_budget = Default.TIME_BUDGET
+        elif Checker.str_is_int(time_budget) and int(time_budget) >= 0:
+            self.time_budget = Casting.str_to_int(time_budget)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_TIME_BUDGET)
+
+        if executor is None:
+            self.executor = Default.VACUUM_EXECUTOR
+        elif executor in Default.VACUUM_EXECUTORS:
+            self.executor = executor
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VACUUM_EXECUTOR)
+
+        if analyze is None:
+            self.analyze = Default.VACUUM_ANALYZE
+        elif isinstance(analyze, bool):
+            self.analyze = analyze
+        elif Checker.str_is_bool(analyze):
+            self.analyze = Casting.str_to_bool(analyze)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VACUUM_ANALYZE)
+
+        if parallel is None:
+            self.parallel = Default.VACUUM_PARALLEL
+        elif Checker.str_is_int(parallel) and int(parallel) >= 0:
+            self.parallel = Casting.str_to_int(parallel)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_VACUUM_PARALLEL)
+
+        if skip_locked is None:
+            self.skip_locked = Default.VACUUM_SKIP_LOCKED
+        elif isinstance(skip_locked, bool):
+            self.skip_locked = skip_locked
+        elif Checker.str_is_bool(skip_locked):
+            self.skip_locked = Casting.str_to_bool(skip_locked)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_SKIP_LOCKED)
+
+        if index_cleanup is None:
+            self.index_cleanup = Default.VACUUM_INDEX_CLEANUP
+        elif index_cleanup in Default.VACUUM_INDEX_CLEANUPS:
+            self.index_cleanup = index_cleanup
+        else:
+            self.logger.stop_exe(Messenger.INVALID_INDEX_CLEANUP)
+
+        self.timings = {}
+
+        if profiles is None:
+            self.profiles = []
+        else:
+            self.profiles = [self.get_profile_vars(profile)
+                             for profile in profiles]
+
+        if self.max_conns:
+            self.cap_conns()
+
         message = Messenger.VACUUMER_VARS.format(
             server=self.connecter.server, user=self.connecter.user,
             port=self.connecter.port, in_dbs=self.in_dbs,
             in_regex=self.in_regex, in_priority=self.in_priority,
             ex_dbs=self.ex_dbs, ex_regex=self.ex_regex,
-            ex_templates=self.ex_templates, db_owner=self.db_owner)
+            ex_templates=self.ex_templates, db_owner=self.db_owner,
+            smart=self.smart, dead_ratio=self.dead_ratio,
+            workers=self.workers, jobs=self.jobs, max_conns=self.max_conns,
+            freeze=self.freeze, freeze_age=self.freeze_age,
+            time_budget=self.time_budget, executor=self.executor,
+            analyze=self.analyze, parallel=self.parallel,
+            skip_locked=self.skip_locked, index_cleanup=self.index_cleanup,
+            profiles=[profile['name'] for profile in self.profiles])
         self.logger.debug(Messenger.VACUUMER_VARS_INTRO)
         self.logger.debug(message)
 
-    def vacuum_db(self, dbname):
+    def cap_conns(self):
+        '''
+        Target:
+            - reduce the number of databases vacuumed at a time and the number
+              of connections used in each one, so that the vacuum never opens
+              more connections than the established maximum.
+        '''
+        # The SQL executor vacuums each database through a single connection
+        if self.smart or self.freeze or self.executor == 'sql':
+            db_conns = 1
+        else:
+            self.jobs = min(self.jobs, self.max_conns)
+            db_conns = self.jobs
+
+        workers = max(1, min(self.workers, self.max_conns // db_conns))
+
+        if workers != self.workers:
+            self.workers = workers
+            message = Messenger.VACUUM_CONNS_CAPPED.format(
+                max_conns=self.max_conns, workers=self.workers,
+                jobs=self.jobs)
+            self.logger.highlight('warning', message, 'yellow')
+
+        for profile in self.profiles:
+            profile['workers'] = max(
+                1, min(profile['workers'], self.max_conns // db_conns))
+
+        # Close the unused connections of the databases already vacuumed when
+        # opening new ones, so that they do not exceed the maximum either
+        # (the main connection is not counted in it)
+        ConnecterPool.cap_total(self.max_conns + 1)
+
+    def get_profile_vars(self, profile):
+        '''
+        Target:
+            - check the settings of a vacuum profile and convert them.
+        Parameters:
+            - profile: a dictionary with the settings of the profile, as
+              strings.
+        Return:
+            - a dictionary with the settings of the profile.
+        '''
+        message = Messenger.INVALID_VACUUM_PROFILE.format(
+            name=profile.get('name'))
+        profile_vars = {'name': profile.get('name')}
+
+        for key in ('start', 'end'):
+            if Checker.str_is_valid_hour(profile.get(key)):
+                profile_vars[key] = DateTools.str_to_datetime(
+                    profile[key], '%H:%M').time()
+            else:
+                self.logger.stop_exe(message)
+
+        # Cost settings which are not specified keep the server's ones
+        for key in ('cost_delay', 'cost_limit'):
+            if not profile.get(key):
+                profile_vars[key] = None
+            elif Checker.str_is_int(profile[key]) and int(profile[key]) >= 0:
+                profile_vars[key] = Casting.str_to_int(profile[key])
+            else:
+                self.logger.stop_exe(message)
+
+        # Parallel workers and databases at a time not specified keep the
+        # vacuumer's ones
+        for key, minimum in (('parallel', 0), ('workers', 1)):
+            if not profile.get(key):
+                profile_vars[key] = getattr(self, key)
+            elif Checker.str_is_int(profile[key]) and \
+                    int(profile[key]) >= minimum:
+                profile_vars[key] = Casting.str_to_int(profile[key])
+            else:
+                self.logger.stop_exe(message)
+
+        return profile_vars
+
+    def get_current_profile(self):
+        '''
+        Target:
+            - get the vacuum profile whose time window includes the current
+              moment, and let the user know when it changes.
+        Return:
+            - a dictionary with the settings of the profile, or None if there
+              is no profile for the current moment.
+        '''
+        now = DateTools.get_current_datetime().time()
+        current_profile = None
+
+        for profile in self.profiles:
+            # The time window may go past midnight
+            if profile['start'] <= profile['end']:
+                in_window = profile['start'] <= now < profile['end']
+            else:
+                in_window = now >= profile['start'] or now < profile['end']
+            if in_window:
+                current_profile = profile
+                break
+
+        name = current_profile['name'] if current_profile else None
+        if name != self.profile_name:
+            self.profile_name = name
+            if current_profile:
+                message = Messenger.VACUUM_PROFILE_APPLIED.format(
+                    name=name, cost_delay=current_profile['cost_delay'],
+                    cost_limit=current_profile['cost_limit'],
+                    parallel=current_profile['parallel'],
+                    workers=current_profile['workers'])
+                self.logger.highlight('info', message, 'white')
+
+        return current_profile
+
+    def get_db_connecter(self, dbname, profile=None):
+        '''
+        Target:
+            - connect to a PostgreSQL database with the parameters of the
+              vacuumer's connection, applying the cost settings of a vacuum
+              profile to the session.
+        Parameters:
+            - dbname: name of the database to connect to.
+            - profile: the vacuum profile to apply.
+        Return:
+            - a connecter to the database.
+        '''
+        db_connecter = ConnecterPool.get_connecter(
+            server=self.connecter.server, user=self.connecter.user,
+            port=self.connecter.port, database=dbname, logger=self.logger)
+
+        if profile:
+            try:
+                if profile['cost_delay'] is not None:
+                    db_connecter.cursor.execute(
+                        Queries.SET_VACUUM_COST_DELAY.format(
+                            cost_delay=profile['cost_delay']))
+                if profile['cost_limit'] is not None:
+                    db_connecter.cursor.execute(
+                        Queries.SET_VACUUM_COST_LIMIT.format(
+                            cost_limit=profile['cost_limit']))
+            except Exception as e:
+                self.logger.debug('Error en la función "get_db_connecter": '
+                                  '{}.'.format(str(e)))
+                message = Messenger.VACUUM_PROFILE_FAIL.format(
+                    name=profile['name'], dbname=dbname)
+                self.logger.highlight('warning', message, 'yellow')
+
+        return db_connecter
+
+    def get_vacuum_options(self, freeze=False, profile=None):
+        '''
+        Target:
+            - get the options of the VACUUM statements.
+        Parameters:
+            - freeze: a flag which determinates whether the tables must be
+              frozen.
+            - profile: the vacuum profile to apply.
+        Return:
+            - a string with the options between brackets, or an empty string
+              if there are no options.
+        '''
+        options = []
+
+        if freeze:
+            options.append('FREEZE')
+        if self.analyze:
+            options.append('ANALYZE')
+        parallel = profile['parallel'] if profile else self.parallel
+        if parallel:
+            options.append('PARALLEL {}'.format(parallel))
+        if self.skip_locked:
+            options.append('SKIP_LOCKED')
+        if self.index_cleanup != 'auto':
+            options.append('INDEX_CLEANUP {}'.format(
+                self.index_cleanup.upper()))
+
+        if options:
+            return '({}) '.format(', '.join(options))
+        else:
+            return ''
+
+    def vacuum_table(self, db_connecter, dbname, table_name, freeze=False,
+                     profile=None):
+        '''
+        Target:
+            - vacuum a table through a connection to its database, recording
+              how long it takes.
+        Parameters:
+            - db_connecter: a connecter to the database of the table.
+            - dbname: name of the database of the table.
+            - table_name: the qualified and quoted name of the table.
+            - freeze: a flag which determinates whether the table must be
+              frozen.
+            - profile: the vacuum profile to apply.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        query = Queries.VACUUM_PG_TABLE.format(
+            options=self.get_vacuum_options(freeze, profile),
+            table_name=table_name)
+
+        start_time = DateTools.get_current_datetime()
+
+        try:
+            db_connecter.cursor.execute(query)
+        except Exception as e:
+            self.logger.debug('Error en la función "vacuum_table": '
+                              '{}.'.format(str(e)))
+            message = Messenger.TABLE_VACUUMER_FAIL.format(
+                table_name=table_name)
+            self.logger.highlight('warning', message, 'yellow')
+            return False
+
+        end_time = DateTools.get_current_datetime()
+        seconds = DateTools.get_diff_datetimes(
+            start_time, end_time).total_seconds()
+        self.timings.setdefault(dbname, {})[table_name] = seconds
+
+        message = Messenger.TABLE_VACUUMER_DONE.format(
+            table_name=table_name, seconds=seconds)
+        self.logger.debug(message)
+
+        return True
+
+    def is_budget_exhausted(self):
+        '''
+        Target:
+            - check whether the time budget of the vacuum has run out.
+        Return:
+            - a boolean which indicates whether the time budget has run out.
+        '''
+        if self.deadline is None:
+            return False
+
+        return DateTools.get_current_datetime() >= self.deadline
+
+    def sort_by_xid_age(self, vacuum_list):
+        '''
+        Target:
+            - get the databases which must be frozen, ordered by the age of
+              their oldest transaction id (oldest first).
+        Parameters:
+            - vacuum_list: the databases which are going to be vacuumed.
+        Return:
+            - a list with the databases whose age exceeds the threshold,
+              oldest first.
+        '''
+        try:
+            self.connecter.cursor.execute(Queries.GET_PG_DBS_XID_AGE)
+            xid_ages = {row['datname']: row['xid_age']
+                        for row in self.connecter.cursor.fetchall()}
+        except Exception as e:
+            self.logger.debug('Error en la función "sort_by_xid_age": '
+                              '{}.'.format(str(e)))
+            self.logger.stop_exe(Messenger.GET_XID_AGE_FAIL)
+
+        freeze_list = []
+
+        for db in vacuum_list:
+            xid_age = xid_ages.get(db['datname'], 0)
+            message = Messenger.DB_XID_AGE.format(dbname=db['datname'],
+                                                  xid_age=xid_age)
+            self.logger.debug(message)
+            if xid_age >= self.freeze_age:
+                freeze_list.append(db)
+
+        freeze_list.sort(key=lambda db: xid_ages[db['datname']],
+                         reverse=True)
+
+        return freeze_list
+
+    def vacuum_db_freeze(self, dbname, profile=None):
+        '''
+        Target:
+            - freeze those tables of a PostgreSQL database whose age exceeds
+              the threshold, oldest first, until the time budget runs out.
+        Parameters:
+            - dbname: name of the database which is going to be frozen.
+            - profile: the vacuum profile to apply.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        success = True
+
+        db_connecter = self.get_db_connecter(dbname, profile)
+
+        n_tables = 0
+        n_frozen = 0
+
+        # Read the tables a few at a time, as there may be lots of them
+        tables = db_connecter.stream_query(Queries.GET_PG_TABLES_XID_AGE,
+                                           (self.freeze_age, ))
+
+        try:
+            for table in tables:
+
+                n_tables += 1
+
+                # Keep on reading to count the tables which are left
+                if self.is_budget_exhausted():
+                    success = False
+                    continue
+
+                message = Messenger.FREEZING_TABLE.format(
+                    table_name=table.table_name, xid_age=table.xid_age)
+                self.logger.debug(message)
+
+                if self.vacuum_table(db_connecter, dbname, table.table_name,
+                                     freeze=True, profile=profile):
+                    n_frozen += 1
+                else:
+                    success = False
+
+        except Exception as e:
+            self.logger.debug('Error en la función "vacuum_db_freeze": '
+                              '{}.'.format(str(e)))
+            return False
+
+        finally:
+            # Close the cursor before giving the connection back, in case
+            # some tables were not read
+            tables.close()
+            db_connecter.pg_disconnect()
+
+        message = Messenger.FREEZE_VACUUMER_DONE.format(
+            dbname=dbname, n_frozen=n_frozen, n_pending=n_tables - n_frozen)
+        self.logger.info(message)
+
+        return success
+
+    def vacuum_db(self, dbname, profile=None):
         '''
         Target:
             - vacuum a PostgreSQL database.
         Parameters:
             - dbname: name of the database which is going to be vacuumed.
+            - profile: the vacuum profile to apply.
         Return:
             - a boolean which indicates the success of the process.
         '''
@@ -106,10 +597,41 @@ class Vacuumer:
         command = 'vacuumdb {} -U {} -h {} -p {}'.format(
             dbname, self.connecter.user, self.connecter.server,
             self.connecter.port)
+        # Vacuum several tables at a time
+        if self.jobs > 1:
+            command += ' -j {}'.format(self.jobs)
+        if self.analyze:
+            command += ' -z'
+        # Apply the same options as the VACUUM statements (they need vacuumdb
+        # 13, 12 and 14 or later respectively, or 16 to force the cleanup of
+        # the indexes)
+        # The parallel workers of the profile replace the general ones
+        parallel = profile['parallel'] if profile else self.parallel
+        if parallel:
+            command += ' -P {}'.format(parallel)
+        if self.skip_locked:
+            command += ' --skip-locked'
+        if self.index_cleanup == 'off':
+            command += ' --no-index-cleanup'
+        elif self.index_cleanup == 'on':
+            command += ' --force-index-cleanup'
+
+        # Pass the cost settings of the profile to the vacuumdb sessions
+        env = None
+        if profile:
+            settings = []
+            if profile['cost_delay'] is not None:
+                settings.append('-c vacuum_cost_delay={}'.format(
+                    profile['cost_delay']))
+            if profile['cost_limit'] is not None:
+                settings.append('-c vacuum_cost_limit={}'.format(
+                    profile['cost_limit']))
+            if settings:
+                env = dict(os.environ, PGOPTIONS=' '.join(settings))
 
         try:
             # Execute the command in console
-            result = subprocess.call(command, shell=True)
+            result = subprocess.call(command, shell=True, env=env)
             if result != 0:
                 raise Exception()
         except Exception as e:
@@ -118,6 +640,195 @@ class Vacuumer:
             success = False
         return success
 
+    def vacuum_db_sql(self, dbname, profile=None):
+        '''
+        Target:
+            - vacuum every table of a PostgreSQL database through a single
+              connection to it, instead of spawning vacuumdb.
+        Parameters:
+            - dbname: name of the database which is going to be vacuumed.
+            - profile: the vacuum profile to apply.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        success = True
+
+        db_connecter = self.get_db_connecter(dbname, profile)
+
+        n_tables = 0
+        n_vacuumed = 0
+
+        # Read the tables a few at a time, as there may be lots of them. The
+        # system catalogs are included, as vacuumdb does
+        tables = db_connecter.stream_query(Queries.GET_PG_TABLES_TO_VACUUM)
+
+        try:
+            for table in tables:
+
+                if self.is_budget_exhausted():
+                    success = False
+                    break
+
+                n_tables += 1
+
+                if self.vacuum_table(db_connecter, dbname, table.table_name,
+                                     profile=profile):
+                    n_vacuumed += 1
+                else:
+                    success = False
+
+        except Exception as e:
+            self.logger.debug('Error en la función "vacuum_db_sql": '
+                              '{}.'.format(str(e)))
+            return False
+
+        finally:
+            # Close the cursor before giving the connection back, in case
+            # some tables were not read
+            tables.close()
+            db_connecter.pg_disconnect()
+
+        timings = self.timings.get(dbname, {})
+        if timings:
+            slowest = max(timings, key=timings.get)
+            message = Messenger.SQL_VACUUMER_DONE.format(
+                dbname=dbname, n_vacuumed=n_vacuumed, n_tables=n_tables,
+                table_name=slowest, seconds=timings[slowest])
+            self.logger.info(message)
+
+        return success
+
+    def vacuum_db_smart(self, dbname, profile=None):
+        '''
+        Target:
+            - vacuum only those tables of a PostgreSQL database whose ratio of
+              dead tuples exceeds the threshold, reusing a single connection
+              to the database for all of them.
+        Parameters:
+            - dbname: name of the database which is going to be vacuumed.
+            - profile: the vacuum profile to apply.
+        Return:
+            - a boolean which indicates the success of the process.
+        '''
+        success = True
+
+        db_connecter = self.get_db_connecter(dbname, profile)
+
+        n_vacuumed = 0
+        n_skipped = 0
+        # Sizes of the vacuumed and skipped tables, to estimate the time a
+        # vacuum of the whole database would have taken
+        vacuumed_size = 0
+        skipped_size = 0
+        start_time = DateTools.get_current_datetime()
+
+        # Read the tables a few at a time, as there may be lots of them
+        tables = db_connecter.stream_query(Queries.GET_PG_TABLES_VACUUM_STATS)
+
+        try:
+            for table in tables:
+
+                if self.is_budget_exhausted():
+                    success = False
+                    break
+
+                n_tuples = table.n_live_tup + table.n_dead_tup
+                ratio = table.n_dead_tup / n_tuples if n_tuples else 0
+
+                if not table.n_dead_tup or ratio < self.dead_ratio:
+                    n_skipped += 1
+                    skipped_size += table.size
+                    continue
+
+                message = Messenger.VACUUMING_TABLE.format(
+                    table_name=table.table_name, n_dead_tup=table.n_dead_tup,
+                    ratio=ratio, last_autovacuum=table.last_autovacuum)
+                self.logger.debug(message)
+
+                if self.vacuum_table(db_connecter, dbname, table.table_name,
+                                     profile=profile):
+                    n_vacuumed += 1
+                    vacuumed_size += table.size
+                else:
+                    success = False
+
+        except Exception as e:
+            self.logger.debug('Error en la función "vacuum_db_smart": '
+                              '{}.'.format(str(e)))
+            return False
+
+        finally:
+            # Close the cursor before giving the connection back, in case
+            # some tables were not read
+            tables.close()
+            db_connecter.pg_disconnect()
+
+        end_time = DateTools.get_current_datetime()
+
+        # The time of a vacuum grows with the size of the tables it scans
+        diff = DateTools.get_diff_datetimes(start_time, end_time)
+        if vacuumed_size:
+            saved = diff * (skipped_size / vacuumed_size)
+        else:
+            saved = '-'
+
+        message = Messenger.SMART_VACUUMER_DONE.format(
+            dbname=dbname, n_vacuumed=n_vacuumed, n_skipped=n_skipped,
+            saved=saved)
+        self.logger.info(message)
+
+        return success
+
+    def process_db(self, db, profile=None):
+        '''
+        Target:
+            - vacuum a PostgreSQL database and show the result.
+        Parameters:
+            - db: a dictionary with the name of the database which is going
+              to be vacuumed and whether connections to it are allowed.
+            - profile: the vacuum profile to apply.
+        '''
+        dbname = db['datname']
+
+        if self.is_budget_exhausted():
+            message = Messenger.TIME_BUDGET_EXHAUSTED.format(dbname=dbname)
+            self.logger.highlight('warning', message, 'yellow')
+            return
+
+        message = Messenger.PROCESSING_DB.format(dbname=dbname)
+        self.logger.highlight('info', message, 'cyan')
+
+        # Let the user know whether the database connection is allowed
+        if not db['datallowconn']:
+            message = Messenger.FORBIDDEN_DB_CONNECTION.format(dbname=dbname)
+            self.logger.highlight('warning', message, 'yellow',
+                                  effect='bold')
+            success = False
+        else:
+            start_time = DateTools.get_current_datetime()
+            # Vacuum the database
+            if self.freeze:
+                success = self.vacuum_db_freeze(dbname, profile)
+            elif self.smart:
+                success = self.vacuum_db_smart(dbname, profile)
+            elif self.executor == 'sql':
+                success = self.vacuum_db_sql(dbname, profile)
+            else:
+                success = self.vacuum_db(dbname, profile)
+            end_time = DateTools.get_current_datetime()
+            # Get and show the process' duration
+            diff = DateTools.get_diff_datetimes(start_time, end_time)
+
+        if success:
+            message = Messenger.DB_VACUUMER_DONE.format(dbname=dbname,
+                                                        diff=diff)
+            self.logger.highlight('info', message, 'green')
+
+        else:
+            message = Messenger.DB_VACUUMER_FAIL.format(dbname=dbname)
+            self.logger.highlight('warning', message, 'yellow',
+                                  effect='bold')
+
     def vacuum_dbs(self, vacuum_list):
         '''
         Target:
@@ -126,41 +837,38 @@ class Vacuumer:
             - vacuum_list: names of the databases which are going to be
               vacuumed.
         '''
+        if self.freeze:
+            # Process first the databases closest to the wraparound
+            vacuum_list = self.sort_by_xid_age(vacuum_list)
+
+        if self.time_budget:
+            self.deadline = DateTools.get_current_datetime() + \
+                datetime.timedelta(seconds=self.time_budget)
+
         if vacuum_list:
             self.logger.highlight('info', Messenger.BEGINNING_VACUUMER,
                                   'white')
 
-        for db in vacuum_list:
+        max_workers = max([self.workers] +
+                          [profile['workers'] for profile in self.profiles])
 
-            dbname = db['datname']
-
-            message = Messenger.PROCESSING_DB.format(dbname=dbname)
-            self.logger.highlight('info', message, 'cyan')
-
-            # Let the user know whether the database connection is allowed
-            if not db['datallowconn']:
-                message = Messenger.FORBIDDEN_DB_CONNECTION.format(
-                    dbname=dbname)
-                self.logger.highlight('warning', message, 'yellow',
-                                      effect='bold')
-                success = False
-            else:
-                start_time = DateTools.get_current_datetime()
-                # Vacuum the database
-                success = self.vacuum_db(dbname)
-                end_time = DateTools.get_current_datetime()
-                # Get and show the process' duration
-                diff = DateTools.get_diff_datetimes(start_time, end_time)
-
-            if success:
-                message = Messenger.DB_VACUUMER_DONE.format(dbname=dbname,
-                                                            diff=diff)
-                self.logger.highlight('info', message, 'green')
-
-            else:
-                message = Messenger.DB_VACUUMER_FAIL.format(dbname=dbname)
-                self.logger.highlight('warning', message, 'yellow',
-                                      effect='bold')
+        if max_workers > 1:
+            with futures.ThreadPoolExecutor(max_workers) as executor:
+                running = set()
+                for db in vacuum_list:
+                    # The profile may change between databases if the vacuum
+                    # goes past the end of a time window
+                    profile = self.get_current_profile()
+                    workers = profile['workers'] if profile else self.workers
+                    while len(running) >= workers:
+                        done, running = futures.wait(
+                            running, return_when=futures.FIRST_COMPLETED)
+                    running.add(executor.submit(self.process_db, db,
+                                                profile))
+                futures.wait(running)
+        else:
+            for db in vacuum_list:
+                self.process_db(db, self.get_current_profile())
 
         self.logger.highlight('info', Messenger.VACUUMER_DONE, 'green',
                               effect='bold')
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- encoding: utf-8 -*-
+
+
+import ctypes  # To call the inotify functions of the C library
+import ctypes.util  # To find the C library
+import os  # To work with directories and files
+import select  # To wait for the inotify events with a timeout
+import signal  # To stop the watcher cleanly when it is terminated
+import struct  # To read the inotify events
+import sys  # To stop the watcher cleanly when it is terminated
+import time  # To renew the watcher's mark periodically
+
+from casting.casting import Casting
+from catalog.catalog import Catalog
+from checker.checker import Checker
+from const.const import Default
+from const.const import Messenger
+from logger.logger import Logger
+
+
+class Watcher:
+    '''This class keeps the catalog of a backups' directory up to date while
+    it is running, listening to the inotify events of the directory and its
+    subdirectories (Linux only).
+    '''
+    bkp_path = ''  # The path where the backups are stored
+    # Number of seconds after which the watcher renews its mark in the catalog
+    heartbeat = 60
+    bkps_catalog = None  # The catalog of the backups
+    libc = None  # The C library, to call the inotify functions
+    inotify_fd = None  # The inotify file descriptor
+    watched_dirs = {}  # Watch descriptors and their directories
+    logger = None  # Logger to show and log some messages
+
+    # inotify events (see "man inotify")
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | \
+        IN_DELETE | IN_ONLYDIR
+    # Header of each event (watch descriptor, mask, cookie, name's length)
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, bkp_path='', heartbeat=60, logger=None):
+
+        if logger:
+            self.logger = logger
+        else:
+            self.logger = Logger()
+
+        if bkp_path and os.path.isdir(bkp_path):
+            self.bkp_path = os.path.realpath(bkp_path)
+        else:
+            self.logger.stop_exe(Messenger.DIR_DOES_NOT_EXIST)
+
+        if heartbeat is None:
+            self.heartbeat = Default.WATCHER_HEARTBEAT
+        elif Checker.str_is_int(heartbeat) and int(heartbeat) > 0:
+            self.heartbeat = Casting.str_to_int(heartbeat)
+        else:
+            self.logger.stop_exe(Messenger.INVALID_HEARTBEAT)
+
+        self.watched_dirs = {}
+
+        message = Messenger.WATCHER_VARS.format(bkp_path=self.bkp_path,
+                                                heartbeat=self.heartbeat)
+        self.logger.debug(Messenger.WATCHER_VARS_INTRO)
+        self.logger.debug(message)
+
+    def init_inotify(self):
+        '''
+        Target:
+            - get an inotify file descriptor from the C library.
+        '''
+        try:
+            self.libc = ctypes.CDLL(ctypes.util.find_library('c'),
+                                    use_errno=True)
+            self.inotify_fd = self.libc.inotify_init1(os.O_CLOEXEC)
+            if self.inotify_fd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_init1')
+
+        except Exception as e:
+            self.logger.debug('Error en la función "init_inotify": '
+                              '{}.'.format(str(e)))
+            self.logger.stop_exe(Messenger.WATCHER_NOT_SUPPORTED)
+
+    def add_watches(self, path):
+        '''
+        Target:
+            - watch a directory and all its subdirectories.
+        Parameters:
+            - path: the directory to watch.
+        '''
+        for dirname, dirnames, filenames in os.walk(path):
+            wd = self.libc.inotify_add_watch(
+                self.inotify_fd, os.fsencode(dirname), Watcher.WATCH_MASK)
+            if wd < 0:
+                message = Messenger.WATCH_DIR_FAIL.format(dirname=dirname)
+                self.logger.highlight('warning', message, 'yellow')
+            else:
+                self.watched_dirs[wd] = dirname
+
+    def remove_watches(self, path):
+        '''
+        Target:
+            - stop watching a directory and all its subdirectories. inotify
+              keeps watching a moved directory (wherever it is moved), so its
+              watches must be removed explicitly.
+        Parameters:
+            - path: the directory to stop watching.
+        '''
+        for wd, dirname in list(self.watched_dirs.items()):
+            if dirname == path or dirname.startswith(path + os.sep):
+                self.libc.inotify_rm_watch(self.inotify_fd, wd)
+                del self.watched_dirs[wd]
+
+    def read_events(self):
+        '''
+        Target:
+            - read the pending inotify events.
+        Return:
+            - a list of tuples (watch descriptor, mask, file's name).
+        '''
+        data = os.read(self.inotify_fd, 64 * 1024)
+        events = []
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, cookie, length = Watcher.EVENT_HEADER.unpack_from(
+                data, offset)
+            offset += Watcher.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+
+        return events
+
+    def handle_event(self, wd, mask, name):
+        '''
+        Target:
+            - update the catalog according to an inotify event.
+        Parameters:
+            - wd: the watch descriptor of the directory.
+            - mask: the event's mask.
+            - name: the name of the file or directory.
+        '''
+        # Some events were lost: synchronise the whole directory
+        if mask & Watcher.IN_Q_OVERFLOW:
+            self.logger.highlight('warning', Messenger.WATCHER_OVERFLOW,
+                                  'yellow')
+            self.bkps_catalog.reconcile(self.bkp_path, full=True)
+            return
+
+        dirname = self.watched_dirs.get(wd)
+
+        if dirname is None:
+            return
+
+        # The directory was removed or moved
+        if mask & Watcher.IN_IGNORED:
+            del self.watched_dirs[wd]
+            return
+
+        path = os.path.join(dirname, name)
+
+        if mask & Watcher.IN_ISDIR:
+            if mask & (Watcher.IN_CREATE | Watcher.IN_MOVED_TO):
+                # Watch the new directory before cataloguing its content, so
+                # that no backup is missed
+                self.add_watches(path)
+                self.bkps_catalog.reconcile(path)
+            else:
+                if mask & Watcher.IN_MOVED_FROM:
+                    self.remove_watches(path)
+                # Forget the backups of the removed directory
+                self.bkps_catalog.reconcile(dirname)
+
+        elif mask & (Watcher.IN_CLOSE_WRITE | Watcher.IN_MOVED_TO):
+            if self.bkps_catalog.add_bkp(path):
+                self.logger.info(Messenger.WATCHER_BKP_ADDED % path)
+
+        elif mask & (Watcher.IN_DELETE | Watcher.IN_MOVED_FROM):
+            if Catalog.parse_bkp_name(name):
+                self.bkps_catalog.remove_bkp(path)
+                self.logger.info(Messenger.WATCHER_BKP_REMOVED % path)
+
+    def stop(self, signum=None, frame=None):
+        '''
+        Target:
+            - stop the watcher when the process is terminated.
+        Parameters:
+            - signum: the number of the received signal.
+            - frame: the current stack frame.
+        '''
+        sys.exit(0)
+
+    def watch(self):
+        '''
+        Target:
+            - keep the catalog of the backups' directory up to date until the
+              process is terminated. The catalog is marked as watched, so the
+              rest of modules can read it without synchronising it first.
+        '''
+        self.init_inotify()
+
+        self.bkps_catalog = Catalog(Catalog.locate(self.bkp_path),
+                                    self.logger)
+
+        signal.signal(signal.SIGTERM, self.stop)
+
+        try:
+            # Watch the directories before synchronising the catalog, so that
+            # no backup created meanwhile is missed
+            self.add_watches(self.bkp_path)
+            if not self.bkps_catalog.reconcile(self.bkp_path):
+                self.logger.stop_exe(Messenger.WATCHER_SYNC_FAIL)
+
+            self.bkps_catalog.set_watcher(self.bkp_path, self.heartbeat)
+            last_heartbeat = time.time()
+
+            message = Messenger.WATCHING_DIR.format(bkp_path=self.bkp_path)
+            self.logger.highlight('info', message, 'white')
+
+            while True:
+                ready, _, _ = select.select([self.inotify_fd], [], [],
+                                            self.heartbeat)
+                if ready:
+                    for wd, mask, name in self.read_events():
+                        self.handle_event(wd, mask, name)
+
+                if time.time() - last_heartbeat >= self.heartbeat:
+                    self.bkps_catalog.set_watcher(self.bkp_path,
+                                                  self.heartbeat)
+                    last_heartbeat = time.time()
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            self.bkps_catalog.remove_watcher(self.bkp_path)
+            self.bkps_catalog.close()
+            os.close(self.inotify_fd)
+
+        self.logger.highlight('info', Messenger.WATCHER_DONE, 'green',
+                              effect='bold')